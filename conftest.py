@@ -0,0 +1,9 @@
+"""
+The benchmark suites are run from inside each engine's directory; put the repo
+root on the path so they can import the shared `harness` package.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
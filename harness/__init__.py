@@ -0,0 +1,7 @@
+"""
+Shared benchmark tooling that drives the per-engine query suites.
+
+The tools are run as modules from the repo root, for example:
+
+    uv run python -m harness.cold --engine kuzu
+"""
@@ -0,0 +1,73 @@
+"""
+Engine adapters: one class per engine, all running the shared query catalog.
+
+To add an engine, subclass `EngineAdapter`, give it a dialect in
+`harness.catalog.DIALECTS` (plus overrides for queries it can't run as
+written), and register it in `ADAPTERS`.
+"""
+
+from collections.abc import Iterable
+
+from harness.adapters.base import REPO_ROOT, EngineAdapter, PhaseTimings, PreparedQuery, phase
+from harness.adapters.embedded import KuzuAdapter, LadybugAdapter
+from harness.adapters.lance import LanceAdapter
+from harness.adapters.neo4j import Neo4jAdapter
+from harness.adapters.sharded import ShardedLanceAdapter
+
+ADAPTERS: dict[str, type[EngineAdapter]] = {
+    "neo4j": Neo4jAdapter,
+    "kuzu": KuzuAdapter,
+    "ladybug": LadybugAdapter,
+    "lance": LanceAdapter,
+    "lance-sharded": ShardedLanceAdapter,
+}
+
+# Engines the multi-engine harnesses run by default. The sharded lance-graph
+# mode needs its shards built first, so it is opt-in.
+ENGINES = ("neo4j", "kuzu", "ladybug", "lance")
+
+
+def get_adapter(engine: str, location: str | None = None, **options) -> EngineAdapter:
+    """
+    Create (but don't open) the adapter for an engine. `location` points it at
+    a database other than the benchmark one: a path for the embedded engines
+    and lance-graph, a database name for Neo4j.
+    """
+    try:
+        adapter_cls = ADAPTERS[engine]
+    except KeyError:
+        raise ValueError(f"Unknown engine '{engine}'. Expected one of {sorted(ADAPTERS)}")
+    if location is not None:
+        options[adapter_cls.location_arg] = location
+    return adapter_cls(**options)
+
+
+def parse_engines(value: str, allowed: Iterable[str] = ADAPTERS) -> list[str]:
+    """
+    Engine names from a comma-separated `--engines` value. Exits with a usage
+    message naming any engine not in `allowed`.
+    """
+    allowed = sorted(allowed)
+    engines = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in engines if name not in allowed]
+    if unknown:
+        raise SystemExit(f"Unknown engine(s): {unknown}. Expected one of {allowed}")
+    return engines
+
+
+__all__ = [
+    "ADAPTERS",
+    "ENGINES",
+    "REPO_ROOT",
+    "EngineAdapter",
+    "KuzuAdapter",
+    "LadybugAdapter",
+    "LanceAdapter",
+    "Neo4jAdapter",
+    "PhaseTimings",
+    "PreparedQuery",
+    "ShardedLanceAdapter",
+    "get_adapter",
+    "parse_engines",
+    "phase",
+]
@@ -0,0 +1,123 @@
+"""
+The interface every engine adapter implements.
+
+An adapter owns one open connection to an engine and runs catalog queries on
+it: `prepare()` renders a query for the engine's dialect once, `execute()` runs
+a prepared query and returns the result as an Arrow table, so the timed part of
+a benchmark is only the engine round trip plus the conversion to Arrow.
+"""
+
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import pyarrow as pa
+
+from harness.catalog import QUERIES, Dialect, QuerySpec, render
+
+if TYPE_CHECKING:
+    from harness.updates import UpdateBatch
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Optional sink for per-phase open timings in milliseconds, keyed by phase name.
+PhaseTimings = dict[str, float] | None
+
+
+@contextmanager
+def phase(timings: PhaseTimings, name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[name] = (time.perf_counter() - start) * 1000
+
+
+@dataclass(frozen=True)
+class PreparedQuery:
+    spec: QuerySpec
+    text: str
+    params: Mapping[str, Any] = field(default_factory=dict)
+
+
+class EngineAdapter(ABC):
+    # Registry key, e.g. "kuzu".
+    name: ClassVar[str]
+    dialect: ClassVar[Dialect]
+    # Prefix of the result file names, e.g. "lance-graph" in lance-graph-0.5.4.
+    system: ClassVar[str]
+    # Installed distribution whose version identifies the engine under test.
+    distribution: ClassVar[str]
+    # Directory holding the engine's build and benchmark scripts.
+    directory: ClassVar[str]
+    # Constructor argument that points the adapter at another database, e.g. a
+    # snapshot built by `harness.updates`.
+    location_arg: ClassVar[str]
+
+    @abstractmethod
+    def open(self, timings: PhaseTimings = None) -> None:
+        """
+        Open the engine. When `timings` is given, the import of the client
+        library and each step of the open are recorded into it, in order.
+        """
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+    @abstractmethod
+    def execute(self, prepared: PreparedQuery) -> pa.Table: ...
+
+    @abstractmethod
+    def profile(self, prepared: PreparedQuery) -> str:
+        """The engine's plan for the query, with runtime metrics where it has them."""
+
+    def fork(self) -> EngineAdapter:
+        """
+        Another open adapter on the same database, with its own connection or
+        session, for use from another thread. Closing it leaves this one open.
+        """
+        raise NotImplementedError(f"{self.name} adapter does not support concurrent use")
+
+    def insert(self, batch: UpdateBatch) -> None:
+        """
+        Insert a batch of new nodes and edges. The batch becomes visible to
+        readers all at once where the engine supports transactions.
+        """
+        raise NotImplementedError(f"{self.name} adapter has no write path")
+
+    def prepare(
+        self, spec: QuerySpec, params: Mapping[str, Any] | None = None
+    ) -> PreparedQuery:
+        values = {**spec.params, **(params or {})}
+        return PreparedQuery(spec, render(spec, self.dialect, values), values)
+
+    def run(self, idx: int, params: Mapping[str, Any] | None = None) -> pa.Table:
+        spec = QUERIES.get(idx)
+        if spec is None:
+            raise KeyError(f"Unknown query index: {idx}")
+        return self.execute(self.prepare(spec, params))
+
+    def version(self) -> str:
+        try:
+            return metadata.version(self.distribution)
+        except metadata.PackageNotFoundError:
+            return "unknown"
+
+    def system_name(self) -> str:
+        """Name used for result files, e.g. `kuzu-0.11.3`."""
+        return f"{self.system}-{self.version()}"
+
+    def __enter__(self) -> EngineAdapter:
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,158 @@
+"""
+Adapters for the embedded engines, Kuzu and its fork Ladybug, which share an API.
+"""
+
+from __future__ import annotations
+
+import importlib
+import re
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import pyarrow as pa
+
+from harness.adapters.base import REPO_ROOT, EngineAdapter, PhaseTimings, PreparedQuery, phase
+from harness.catalog import DIALECTS
+
+if TYPE_CHECKING:
+    from harness.updates import UpdateBatch
+
+TABLE_DDL_RE = re.compile(r"CREATE (?:NODE|REL) TABLE (\w+)\((.*?)\);", re.DOTALL)
+# Functions that turn the CSV strings of the update stream into typed values.
+CONVERSIONS = {"DATE": "date({})", "TIMESTAMP": "timestamp({})"}
+
+
+def load_schema(path: Path) -> dict[str, dict[str, str]]:
+    """Property types per table, read from the `etl/schema.cypher` DDL."""
+    tables: dict[str, dict[str, str]] = {}
+    for name, body in TABLE_DDL_RE.findall(path.read_text()):
+        properties: dict[str, str] = {}
+        for part in body.split(","):
+            tokens = part.split()
+            # Skip `FROM A TO B` and multiplicities such as `MANY_ONE`.
+            if len(tokens) >= 2 and tokens[0] != "FROM":
+                properties[tokens[0]] = tokens[1]
+        tables[name] = properties
+    return tables
+
+
+def _property_map(columns: list[str], types: dict[str, str]) -> str:
+    assignments = []
+    for column in columns:
+        prop = "ID" if column == "id" else column
+        value = CONVERSIONS.get(types.get(prop, ""), "{}").format(f"row.{column}")
+        assignments.append(f"{prop}: {value}")
+    return "{" + ", ".join(assignments) + "}"
+
+
+class EmbeddedAdapter(EngineAdapter):
+    dialect = DIALECTS["kuzu"]
+    location_arg = "db_path"
+    # Client module to import, and the database directory inside `directory`.
+    client: ClassVar[str]
+    database: ClassVar[str]
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        buffer_pool_size: int = 0,
+        max_num_threads: int = 0,
+    ) -> None:
+        self.db_path = Path(db_path) if db_path else REPO_ROOT / self.directory / self.database
+        # Buffer pool in bytes and threads per query; 0 leaves the engine default
+        # (about 80% of RAM and every core).
+        self.buffer_pool_size = buffer_pool_size
+        self.max_num_threads = max_num_threads
+        self._db: Any = None
+        self._conn: Any = None
+        self._owns_db = True
+
+    @property
+    def connection(self) -> Any:
+        if self._conn is None:
+            raise RuntimeError(f"{self.name} adapter is not open")
+        return self._conn
+
+    @cached_property
+    def schema(self) -> dict[str, dict[str, str]]:
+        return load_schema(REPO_ROOT / self.directory / "etl" / "schema.cypher")
+
+    def open(self, timings: PhaseTimings = None) -> None:
+        with phase(timings, "import"):
+            client = importlib.import_module(self.client)
+        with phase(timings, "database"):
+            self._db = client.Database(
+                str(self.db_path),
+                buffer_pool_size=self.buffer_pool_size,
+                max_num_threads=self.max_num_threads,
+            )
+        with phase(timings, "connection"):
+            self._conn = client.Connection(self._db)
+
+    def fork(self) -> EmbeddedAdapter:
+        other = type(self)(self.db_path, self.buffer_pool_size, self.max_num_threads)
+        other._db = self._db
+        other._conn = importlib.import_module(self.client).Connection(self._db)
+        other._owns_db = False
+        return other
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._db is not None and self._owns_db:
+            self._db.close()
+        self._db = None
+
+    def execute(self, prepared: PreparedQuery) -> pa.Table:
+        return self.connection.execute(prepared.text).get_as_arrow()
+
+    def profile(self, prepared: PreparedQuery) -> str:
+        result = self.connection.execute(f"PROFILE {prepared.text}").get_as_arrow()
+        return "\n".join(str(value) for row in result.to_pylist() for value in row.values())
+
+    def insert(self, batch: UpdateBatch) -> None:
+        from harness.ldbc import EDGE_FILES
+
+        conn = self.connection
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            for label, table in batch.ordered_nodes():
+                props = _property_map(table.column_names, self.schema[label])
+                conn.execute(
+                    f"UNWIND $rows AS row CREATE (:{label} {props})",
+                    {"rows": table.to_pylist()},
+                )
+            for rel_type, table in batch.edges.items():
+                edge = EDGE_FILES[rel_type]
+                columns = [name for name in table.column_names if name not in ("src", "dst")]
+                props = _property_map(columns, self.schema[rel_type]) if columns else ""
+                conn.execute(
+                    f"UNWIND $rows AS row "
+                    f"MATCH (a:{edge.src_label} {{ID: row.src}}), (b:{edge.dst_label} {{ID: row.dst}}) "
+                    f"CREATE (a)-[:{rel_type} {props}]->(b)",
+                    {"rows": table.to_pylist()},
+                )
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+
+class KuzuAdapter(EmbeddedAdapter):
+    name = "kuzu"
+    system = "kuzu"
+    distribution = "kuzu"
+    directory = "kuzu"
+    client = "kuzu"
+    database = "ldbc_snb_sf1.kuzu"
+
+
+class LadybugAdapter(EmbeddedAdapter):
+    name = "ladybug"
+    system = "ladybug"
+    distribution = "ladybug"
+    directory = "ladybugdb"
+    client = "ladybug"
+    database = "ldbc_snb_sf1.lbdb"
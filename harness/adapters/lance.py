@@ -0,0 +1,437 @@
+"""
+Adapter for lance-graph, which runs Cypher in-process over Arrow tables loaded
+from the Lance datasets written by `lance_graph/build_graph.py`.
+"""
+
+from __future__ import annotations
+
+import importlib
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from harness.adapters.base import REPO_ROOT, EngineAdapter, PhaseTimings, PreparedQuery, phase
+from harness.adapters.result_cache import ResultCache, cache_key
+from harness.catalog import DIALECTS, QuerySpec, dialect_text
+
+if TYPE_CHECKING:
+    from harness.planner import Statistics
+    from harness.updates import UpdateBatch
+
+GRAPH_ROOT = REPO_ROOT / "lance_graph" / "graph_lance"
+
+NODE_LABELS = (
+    "Comment",
+    "Forum",
+    "Organisation",
+    "Person",
+    "Place",
+    "Post",
+    "Tag",
+    "Tagclass",
+)
+
+REL_DATASETS = {
+    "containerOf": "forum_containerOf_post",
+    "commentHasCreator": "comment_hasCreator_person",
+    "postHasCreator": "post_hasCreator_person",
+    "hasInterest": "person_hasInterest_tag",
+    "hasMember": "forum_hasMember_person",
+    "hasModerator": "forum_hasModerator_person",
+    "commentHasTag": "comment_hasTag_tag",
+    "forumHasTag": "forum_hasTag_tag",
+    "postHasTag": "post_hasTag_tag",
+    "hasType": "tag_hasType_tagclass",
+    "commentIsLocatedIn": "comment_isLocatedIn_place",
+    "organisationIsLocatedIn": "organisation_isLocatedIn_place",
+    "personIsLocatedIn": "person_isLocatedIn_place",
+    "postIsLocatedIn": "post_isLocatedIn_place",
+    "isPartOf": "place_isPartOf_place",
+    "isSubclassOf": "tagclass_isSubclassOf_tagclass",
+    "knows": "person_knows_person",
+    "likeComment": "person_likes_comment",
+    "likePost": "person_likes_post",
+    "replyOfComment": "comment_replyOf_comment",
+    "replyOfPost": "comment_replyOf_post",
+    "studyAt": "person_studyAt_organisation",
+    "workAt": "person_workAt_organisation",
+}
+
+# Derived edges written by `harness.views`, present when built with `--views`
+# (`lance_graph/build_graph.py` deletes them on a build without it).
+VIEW_DATASETS = {
+    "commentRepliesToPostBy": "comment_repliesToPostBy_person",
+    "commentOnPostTagged": "comment_onPostTagged_tag",
+}
+
+GraphDatasets = dict[str, pa.Table]
+
+# Node labels and relationship types in a pattern, e.g. `(p:Person)`, `[:knows]`.
+PATTERN_NAME_RE = re.compile(r":\s*(\w+)")
+# A trailing `ORDER BY col [ASC|DESC] LIMIT k`.
+TOP_K_RE = re.compile(
+    r"\s+ORDER BY\s+(\w+)(?:\s+(ASC|DESC))?\s+LIMIT\s+(\d+)\s*$", re.IGNORECASE
+)
+
+
+def build_config(views: Iterable[str] = ()) -> Any:
+    from lance_graph import GraphConfig
+
+    builder = GraphConfig.builder()
+    for label in NODE_LABELS:
+        builder = builder.with_node_label(label, "id")
+    for rel_type in (*REL_DATASETS, *views):
+        builder = builder.with_relationship(rel_type, "src", "dst")
+    return builder.build()
+
+
+def dataset_path(root: Path, name: str) -> Path:
+    """Path of the Lance dataset for a node label or relationship type."""
+    dataset_name = REL_DATASETS.get(name) or VIEW_DATASETS.get(name, name)
+    return root / f"{dataset_name}.lance"
+
+
+def available_views(root: Path = GRAPH_ROOT) -> list[str]:
+    return [name for name in VIEW_DATASETS if dataset_path(root, name).exists()]
+
+
+def load_datasets(root: Path = GRAPH_ROOT, views: Iterable[str] = ()) -> GraphDatasets:
+    import lance
+
+    datasets: GraphDatasets = {}
+    for name in (*NODE_LABELS, *REL_DATASETS, *views):
+        datasets[name] = lance.dataset(str(dataset_path(root, name))).to_table()
+    return datasets
+
+
+def decode_dictionaries(table: pa.Table) -> pa.Table:
+    """The table with its dictionary-encoded columns cast to plain values."""
+    fields = [
+        pa.field(field.name, field.type.value_type) if pa.types.is_dictionary(field.type) else field
+        for field in table.schema
+    ]
+    return table.cast(pa.schema(fields))
+
+
+def dataset_versions(root: Path, names: Iterable[str]) -> dict[str, int]:
+    import lance
+
+    return {name: lance.dataset(str(dataset_path(root, name))).version for name in names}
+
+
+def conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """
+    Rename and cast update-stream rows to the layout `build_graph.py` wrote:
+    lowercased column names with `.` replaced by `_`, and the dataset's types.
+    Columns the stream doesn't carry, such as degree columns, are left null.
+    """
+    table = table.rename_columns(
+        [name.strip().lower().replace(".", "_") for name in table.column_names]
+    )
+    columns = [
+        table[field.name] if field.name in table.column_names else pa.nulls(table.num_rows)
+        for field in schema
+    ]
+    return pa.table(columns, names=schema.names).cast(schema)
+
+
+def to_arrow(result: Any) -> pa.Table:
+    if isinstance(result, pa.Table):
+        return result
+    if isinstance(result, pa.RecordBatch):
+        return pa.Table.from_batches([result])
+    if hasattr(result, "to_arrow"):
+        return result.to_arrow()
+    if hasattr(result, "to_pydict"):
+        return pa.table(result.to_pydict())
+    raise TypeError(f"Unsupported result type: {type(result)}")
+
+
+def select_top_k(table: pa.Table, column: str, descending: bool, k: int) -> pa.Table:
+    """The first `k` rows by `column`, from a bounded heap rather than a full sort."""
+    order = "descending" if descending else "ascending"
+    indices = pc.select_k_unstable(table, k, [(column, order)])
+    return table.take(indices)
+
+
+def count_as_bool(table: pa.Table, column: str) -> pa.Table:
+    """Turn the single-row count returned for a yes/no query into its bool answer."""
+    value = table.num_rows > 0 and bool(table.column(column)[0].as_py())
+    return pa.table({column: [value]})
+
+
+class LanceAdapter(EngineAdapter):
+    name = "lance"
+    dialect = DIALECTS["lance"]
+    system = "lance-graph"
+    distribution = "lance-graph"
+    directory = "lance_graph"
+    location_arg = "graph_root"
+
+    def __init__(
+        self,
+        graph_root: str | Path = GRAPH_ROOT,
+        persist_updates: bool = True,
+        cache_bytes: int = 0,
+        bind_params: bool = False,
+        cache_templates: bool = True,
+        push_top_k: bool = False,
+        reorder_joins: bool = False,
+        semi_join: str | None = None,
+        dictionary_strings: bool = True,
+    ) -> None:
+        if semi_join not in (None, "memory", "lance"):
+            raise ValueError(f"semi_join must be 'memory' or 'lance', got {semi_join!r}")
+        if semi_join and bind_params:
+            # Staging rewrites the tables a query runs on; a bound template runs on
+            # the full datasets.
+            raise ValueError("semi_join can't be combined with bind_params")
+        self.graph_root = Path(graph_root)
+        # When set, inserts are also written to the Lance datasets as new versions;
+        # otherwise only the in-memory tables change.
+        self.persist_updates = persist_updates
+        # With `cache_bytes`, results are cached per query text, parameters and
+        # the versions of the datasets it reads; inserts bump those versions.
+        self.result_cache = ResultCache(cache_bytes) if cache_bytes else None
+        self.versions: dict[str, int] = {}
+        # When set, queries keep their `$name` parameters: each template is parsed
+        # once into a `CypherQuery` and the values are bound at execution, instead
+        # of every binding being a new text to parse. What is cached is the parsed
+        # query; lance-graph plans it again on every `execute()`.
+        self.bind_params = bind_params
+        # With `bind_params`, unset to parse the template again on every execution
+        # through the same `CypherQuery` path, as the baseline for the cache.
+        self.cache_templates = cache_templates
+        self._templates: dict[str, Any] = {}
+        self.template_hits = 0
+        self.template_misses = 0
+        # When set, an aggregate query ending in ORDER BY ... LIMIT k runs without
+        # them and the top k groups are selected from its result with a heap.
+        self.push_top_k = push_top_k
+        # When set, `prepare()` rewrites each pattern into the join order
+        # `harness.planner` estimates cheapest, from the graph's statistics.
+        self.reorder_joins = reorder_joins
+        # "memory" or "lance": run multi-hop queries staged by `harness.semijoin`,
+        # cutting the tables to the rows reachable from the most selective filter
+        # in memory or in a filtered Lance scan.
+        self.semi_join = semi_join
+        # String columns `build_graph.py` dictionary-encoded are queried as Arrow
+        # dictionary arrays; when unset they are decoded to plain strings on load.
+        self.dictionary_strings = dictionary_strings
+        self.statistics: Statistics | None = None
+        self.config: Any = None
+        self.datasets: GraphDatasets = {}
+        self._engine: Any = None
+        # Adapters made by fork() read the engine of the adapter they came from,
+        # so they see its inserts.
+        self._parent: LanceAdapter | None = None
+
+    @property
+    def engine(self) -> Any:
+        if self._parent is not None:
+            return self._parent.engine
+        if self._engine is None:
+            raise RuntimeError("lance adapter is not open")
+        return self._engine
+
+    def open(self, timings: PhaseTimings = None) -> None:
+        views = available_views(self.graph_root)
+        with phase(timings, "import"):
+            lance_graph = importlib.import_module("lance_graph")
+        with phase(timings, "build_config"):
+            self.config = build_config(views)
+        with phase(timings, "load_datasets"):
+            self.datasets = load_datasets(self.graph_root, views)
+        if not self.dictionary_strings:
+            with phase(timings, "decode_dictionaries"):
+                self.datasets = {
+                    name: decode_dictionaries(table) for name, table in self.datasets.items()
+                }
+        if self.reorder_joins or self.semi_join:
+            # Imported here: harness.planner imports harness.ldbc, which imports
+            # this package.
+            from harness.planner import default_statistics
+
+            with phase(timings, "statistics"):
+                row_counts = {name: table.num_rows for name, table in self.datasets.items()}
+                self.statistics = default_statistics(self.graph_root, row_counts)
+        if self.result_cache is not None:
+            with phase(timings, "dataset_versions"):
+                self.versions = dataset_versions(self.graph_root, self.datasets)
+        with phase(timings, "engine"):
+            self._engine = lance_graph.CypherEngine(self.config, self.datasets)
+
+    def fork(self) -> LanceAdapter:
+        other = LanceAdapter(
+            self.graph_root,
+            self.persist_updates,
+            bind_params=self.bind_params,
+            cache_templates=self.cache_templates,
+            push_top_k=self.push_top_k,
+            semi_join=self.semi_join,
+        )
+        other._parent = self._parent or self
+        other.config = self.config
+        return other
+
+    def close(self) -> None:
+        self._engine = None
+        self._parent = None
+        self.datasets = {}
+        self.versions = {}
+        self._templates = {}
+        self.statistics = None
+
+    def insert(self, batch: UpdateBatch) -> None:
+        """
+        Append the batch to the in-memory tables and swap in a new engine over
+        them; queries already running keep the engine they started on. With
+        `persist_updates`, nodes are merged into their dataset on `id` and edges
+        appended, each write committing a new dataset version.
+        """
+        import lance
+        import lance_graph
+
+        if self._parent is not None:
+            self._parent.insert(batch)
+            return
+        datasets = dict(self.datasets)
+        versions = dict(self.versions)
+        written = [*batch.ordered_nodes(), *batch.edges.items()]
+        for name, table in written:
+            current = datasets[name]
+            rows = conform(table, current.schema)
+            if self.persist_updates:
+                path = str(dataset_path(self.graph_root, name))
+                if name in NODE_LABELS:
+                    dataset = lance.dataset(path)
+                    dataset.merge_insert("id").when_not_matched_insert_all().execute(rows)
+                else:
+                    lance.write_dataset(rows, path, mode="append")
+                versions[name] = lance.dataset(path).version
+            else:
+                versions[name] = versions.get(name, 0) + 1
+            datasets[name] = pa.concat_tables([current, rows])
+        self.datasets = datasets
+        self._engine = lance_graph.CypherEngine(self.config, datasets)
+        self.versions = versions
+        if self.result_cache is not None:
+            self.result_cache.invalidate(name for name, _ in written)
+
+    def execute(self, prepared: PreparedQuery) -> pa.Table:
+        owner = self._parent or self
+        if owner.result_cache is None:
+            return self._execute(prepared, self.engine, owner.datasets)
+        # Read the versions before the engine and tables: an insert swaps the
+        # versions in last, so a result is never computed from older data than
+        # the versions it is cached under.
+        versions = owner.versions
+        engine, datasets = self.engine, owner.datasets
+        read = {name for name in PATTERN_NAME_RE.findall(prepared.text) if name in versions}
+        key = cache_key(
+            prepared.text,
+            prepared.params,
+            {name: versions[name] for name in read or versions},
+        )
+        table = owner.result_cache.get(key)
+        if table is None:
+            table = self._execute(prepared, engine, datasets)
+            owner.result_cache.put(key, table)
+        return table
+
+    def prepare(
+        self, spec: QuerySpec, params: Mapping[str, Any] | None = None
+    ) -> PreparedQuery:
+        if self.bind_params:
+            values = {**spec.params, **(params or {})}
+            prepared = PreparedQuery(spec, dialect_text(spec, self.dialect), values)
+        else:
+            prepared = super().prepare(spec, params)
+        owner = self._parent or self
+        if not owner.reorder_joins:
+            return prepared
+        from harness.planner import reorder
+
+        plan = reorder(prepared.text, owner.statistics)
+        return prepared if plan is None else replace(prepared, text=plan.text)
+
+    def _template(self, text: str) -> Any:
+        """The parsed query for a template, from the cache shared with forks."""
+        from lance_graph import CypherQuery
+
+        owner = self._parent or self
+        query = owner._templates.get(text)
+        if query is None:
+            owner.template_misses += 1
+            query = CypherQuery(text).with_config(owner.config)
+            if owner.cache_templates:
+                owner._templates[text] = query
+        else:
+            owner.template_hits += 1
+        return query
+
+    def _stage(self, text: str, engine: Any, datasets: GraphDatasets) -> GraphDatasets | None:
+        from harness.planner import parse_query
+        from harness.semijoin import stage
+
+        owner = self._parent or self
+        parsed = parse_query(text)
+        if parsed is None or owner.statistics is None:
+            return None
+        # Inserts that weren't persisted are only in memory.
+        scan = owner.semi_join if owner.persist_updates else "memory"
+        return stage(parsed, owner.statistics, engine, datasets, owner.graph_root, scan)
+
+    def _execute(self, prepared: PreparedQuery, engine: Any, datasets: GraphDatasets) -> pa.Table:
+        text = prepared.text
+        top = TOP_K_RE.search(text) if self.push_top_k and "COUNT(" in text.upper() else None
+        if top is not None:
+            text = text[: top.start()]
+        if self.bind_params:
+            query = self._template(text)
+            for name, value in prepared.params.items():
+                query = query.with_parameter(name, value)
+            table = to_arrow(query.execute(datasets))
+        else:
+            reduced = self._stage(text, engine, datasets) if self.semi_join else None
+            if reduced is not None:
+                from lance_graph import CypherQuery
+
+                query = CypherQuery(text).with_config(self.config)
+                table = to_arrow(query.execute(reduced))
+            else:
+                table = to_arrow(engine.execute(text))
+        if top is not None:
+            descending = (top.group(2) or "").upper() == "DESC"
+            table = select_top_k(table, top.group(1), descending, int(top.group(3)))
+        column = prepared.spec.bool_column
+        if column is not None and not self.dialect.count_comparisons:
+            return count_as_bool(table, column)
+        return table
+
+    def profile(self, prepared: PreparedQuery) -> str:
+        """
+        DataFusion plan for the query, followed by EXPLAIN ANALYZE of its SQL
+        translation, which carries per-operator row counts and timings.
+        """
+        from lance_graph import CypherQuery, SqlEngine
+
+        datasets = self._parent.datasets if self._parent is not None else self.datasets
+        cypher = CypherQuery(prepared.text).with_config(self.config)
+        if self.bind_params:
+            for name, value in prepared.params.items():
+                cypher = cypher.with_parameter(name, value)
+        sections = ["== Cypher plan ==", cypher.explain(datasets)]
+        try:
+            sql = cypher.to_sql(datasets)
+            analyzed = SqlEngine(datasets).execute(f"EXPLAIN ANALYZE {sql}")
+            sections.append("== EXPLAIN ANALYZE ==")
+            sections.extend(str(plan) for plan in analyzed.column("plan").to_pylist())
+        except Exception as exc:  # noqa: BLE001 - operator metrics are best-effort
+            sections.append(f"(EXPLAIN ANALYZE unavailable: {exc})")
+        return "\n".join(sections)
@@ -0,0 +1,200 @@
+"""
+Adapter for a Neo4j server over Bolt.
+
+Connection settings come from the environment (or `neo4j/.env`): `NEO4J_URI`,
+`NEO4J_USER`, `NEO4J_PASSWORD`, `NEO4J_DATABASE`. The client driver version
+says nothing about the server under test, so the version is the one the server
+reports in `dbms.components()`; `NEO4J_VERSION` is only used when the server
+can't be reached, and without either the version is an error rather than
+`unknown`, so result files always join on the real version.
+
+With `runtime` set, every query runs with a `CYPHER runtime=...` prefix
+(`slotted`, `pipelined`, or `parallel` on servers that have it); otherwise the
+server picks the runtime.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+from dotenv import load_dotenv
+
+from harness.adapters.base import REPO_ROOT, EngineAdapter, PhaseTimings, PreparedQuery, phase
+from harness.catalog import DIALECTS
+
+if TYPE_CHECKING:
+    from harness.updates import UpdateBatch
+
+load_dotenv(REPO_ROOT / "neo4j" / ".env")
+load_dotenv()
+
+
+def format_profile(operator: dict[str, Any], depth: int = 0) -> list[str]:
+    details = operator.get("args", {}).get("Details")
+    line = (
+        f"{'  ' * depth}{operator.get('operatorType')}"
+        f"  rows={operator.get('rows')}"
+        f"  dbHits={operator.get('dbHits')}"
+        f"  time={operator.get('time')}"
+    )
+    if details:
+        line += f"  [{details}]"
+    lines = [line]
+    for child in operator.get("children", []):
+        lines.extend(format_profile(child, depth + 1))
+    return lines
+
+
+# Cypher functions that parse the CSV strings of the update stream, per kind in
+# `harness.ldbc.TEMPORAL_COLUMNS`, so inserts get the types `build_graph.py` writes.
+TEMPORAL_FUNCTIONS = {"timestamp": "datetime", "date": "date"}
+
+
+def _temporal_sets(var: str, source: str, kinds: dict[str, str], columns: list[str]) -> str:
+    assignments = [
+        f"{var}.{column} = {TEMPORAL_FUNCTIONS[kind]}({source}.{column})"
+        for column, kind in kinds.items()
+        if column in columns
+    ]
+    return f" SET {', '.join(assignments)}" if assignments else ""
+
+
+def _native(value: Any) -> Any:
+    # Temporal values come back as neo4j.time types, which Arrow can't infer.
+    to_native = getattr(value, "to_native", None)
+    return to_native() if callable(to_native) else value
+
+
+class Neo4jAdapter(EngineAdapter):
+    name = "neo4j"
+    dialect = DIALECTS["neo4j"]
+    system = "neo4j"
+    distribution = "neo4j"
+    directory = "neo4j"
+    location_arg = "database"
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        user: str | None = None,
+        password: str | None = None,
+        database: str | None = None,
+        runtime: str | None = None,
+    ) -> None:
+        self.uri = uri or os.environ.get("NEO4J_URI", "bolt://localhost:7687")
+        self.user = user or os.environ.get("NEO4J_USER")
+        self.password = password or os.environ.get("NEO4J_PASSWORD")
+        self.database = database or os.environ.get("NEO4J_DATABASE", "neo4j")
+        self.runtime = runtime
+        self._version: str | None = None
+        self._driver: Any = None
+        self._session: Any = None
+        self._owns_driver = True
+
+    @property
+    def session(self) -> Any:
+        if self._session is None:
+            raise RuntimeError("neo4j adapter is not open")
+        return self._session
+
+    def open(self, timings: PhaseTimings = None) -> None:
+        if self.user is None or self.password is None:
+            raise EnvironmentError("NEO4J_USER and NEO4J_PASSWORD must be set")
+        with phase(timings, "import"):
+            from neo4j import GraphDatabase
+        with phase(timings, "driver"):
+            self._driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+        with phase(timings, "connect_and_auth"):
+            self._driver.verify_connectivity()
+        with phase(timings, "session"):
+            self._session = self._driver.session(database=self.database)
+
+    def fork(self) -> Neo4jAdapter:
+        other = Neo4jAdapter(self.uri, self.user, self.password, self.database, self.runtime)
+        other._driver = self._driver
+        other._session = self._driver.session(database=self.database)
+        other._owns_driver = False
+        other._version = self._version
+        return other
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._driver is not None and self._owns_driver:
+            self._driver.close()
+        self._driver = None
+
+    def _with_options(self, text: str) -> str:
+        # Query options go before PROFILE/EXPLAIN.
+        return f"CYPHER runtime={self.runtime} {text}" if self.runtime else text
+
+    def execute(self, prepared: PreparedQuery) -> pa.Table:
+        result = self.session.run(self._with_options(prepared.text))
+        keys = result.keys()
+        records = list(result)
+        return pa.table({key: [_native(record[key]) for record in records] for key in keys})
+
+    def profile(self, prepared: PreparedQuery) -> str:
+        summary = self.session.run(self._with_options(f"PROFILE {prepared.text}")).consume()
+        return "\n".join(format_profile(summary.profile or {}))
+
+    def insert(self, batch: UpdateBatch) -> None:
+        from harness.ldbc import EDGE_FILES, TEMPORAL_COLUMNS
+
+        def _write(tx: Any) -> None:
+            # Same property layout as build_graph.py: `ID` plus the CSV columns.
+            for label, table in batch.ordered_nodes():
+                rows = [{"ID": row.pop("id"), **row} for row in table.to_pylist()]
+                kinds = TEMPORAL_COLUMNS.get(label, {})
+                temporal = _temporal_sets("n", "row", kinds, table.column_names)
+                tx.run(f"UNWIND $rows AS row CREATE (n:{label}) SET n = row{temporal}", rows=rows)
+            for rel_type, table in batch.edges.items():
+                edge = EDGE_FILES[rel_type]
+                rows = [
+                    {"src": row.pop("src"), "dst": row.pop("dst"), "props": row}
+                    for row in table.to_pylist()
+                ]
+                kinds = TEMPORAL_COLUMNS.get(rel_type, {})
+                temporal = _temporal_sets("r", "row.props", kinds, table.column_names)
+                tx.run(
+                    f"""
+                    UNWIND $rows AS row
+                    MATCH (src:{edge.src_label} {{ID: row.src}})
+                    MATCH (dst:{edge.dst_label} {{ID: row.dst}})
+                    CREATE (src)-[r:{rel_type}]->(dst)
+                    SET r = row.props{temporal}
+                    """,
+                    rows=rows,
+                )
+
+        self.session.execute_write(_write)
+
+    def _server_version(self) -> str:
+        query = (
+            "CALL dbms.components() YIELD name, versions "
+            "WHERE name = 'Neo4j Kernel' RETURN versions[0] AS version"
+        )
+        if self._session is not None:
+            return self._session.run(query).single()["version"]
+        from neo4j import GraphDatabase
+
+        with GraphDatabase.driver(self.uri, auth=(self.user, self.password)) as driver:
+            with driver.session(database=self.database) as session:
+                return session.run(query).single()["version"]
+
+    def version(self) -> str:
+        if self._version is None:
+            try:
+                self._version = self._server_version()
+            except Exception as exc:
+                configured = os.environ.get("NEO4J_VERSION")
+                if not configured:
+                    raise RuntimeError(
+                        f"Could not read the Neo4j server version from {self.uri} ({exc}); "
+                        "start the server or set NEO4J_VERSION"
+                    ) from exc
+                self._version = configured
+        return self._version
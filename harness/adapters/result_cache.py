@@ -0,0 +1,99 @@
+"""
+LRU cache of query results, for workloads that re-run identical queries
+against an unchanged graph.
+
+Entries are keyed on the normalized query text, its parameters, and the version
+of every dataset the query reads, so a write to any of those datasets makes the
+entry unreachable; `invalidate()` also drops such entries right away to free
+their memory. The cache is bounded by the Arrow size of the results it holds.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow as pa
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...], tuple[tuple[str, int], ...]]
+
+
+def cache_key(text: str, params: Mapping[str, Any], versions: Mapping[str, int]) -> CacheKey:
+    return (
+        WHITESPACE_RE.sub(" ", text).strip(),
+        tuple(sorted((name, repr(value)) for name, value in params.items())),
+        tuple(sorted(versions.items())),
+    )
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[CacheKey, pa.Table] = OrderedDict()
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> pa.Table | None:
+        with self._lock:
+            table = self._entries.get(key)
+            if table is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return table
+
+    def put(self, key: CacheKey, table: pa.Table) -> None:
+        # A result bigger than the whole cache would only flush everything else.
+        if table.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = table
+            self._stats.bytes += table.nbytes
+            while self._stats.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._stats.bytes -= evicted.nbytes
+                self._stats.evictions += 1
+
+    def invalidate(self, datasets: Iterable[str]) -> None:
+        """Drop every entry that read one of `datasets`."""
+        names = set(datasets)
+        with self._lock:
+            stale = [key for key in self._entries if any(name in names for name, _ in key[2])]
+            for key in stale:
+                self._stats.bytes -= self._entries.pop(key).nbytes
+            self._stats.invalidations += len(stale)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._stats.hits,
+                self._stats.misses,
+                self._stats.evictions,
+                self._stats.invalidations,
+                len(self._entries),
+                self._stats.bytes,
+            )
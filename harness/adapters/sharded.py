@@ -0,0 +1,267 @@
+"""
+Scale-out mode for lance-graph: the comment-anchored datasets are split across
+worker processes and aggregate queries over comments run on all of them at once.
+
+`lance_graph/build_shards.py` hash-partitions `Comment` and the edges that
+start at a comment into `graph_lance_shards/shard_<i>/`, and writes the rest of
+the graph, which stays whole, once to uncompressed Arrow IPC files under
+`graph_lance_shards/shared/`. Each worker process loads its shard and
+memory-maps the shared files, so the workers read the same page-cache pages
+instead of each holding a private copy of Post, Person, Forum and the other
+edges, and runs its own `CypherEngine`. Each worker reports its RSS and the
+private (anonymous) part of it once loaded, in `worker_memory`. For the queries in
+`SHARDABLE`, the coordinator sends the query to every worker and merges their
+partial aggregates: counts are summed per group, then the query's ORDER BY and
+LIMIT are applied to the merged rows. Each comment lives on exactly one shard,
+so `COUNT(DISTINCT c.id)` sums correctly. Other queries run on a full
+in-process engine, loaded on first use.
+"""
+
+from __future__ import annotations
+
+import importlib
+import multiprocessing as mp
+import threading
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from harness.adapters.base import REPO_ROOT, PhaseTimings, PreparedQuery, phase
+from harness.adapters.lance import (
+    GRAPH_ROOT,
+    NODE_LABELS,
+    REL_DATASETS,
+    TOP_K_RE,
+    GraphDatasets,
+    LanceAdapter,
+    build_config,
+    count_as_bool,
+    dataset_path,
+    load_datasets,
+    to_arrow,
+)
+from harness.catalog import QUERIES
+from harness.system import current_rss_bytes, private_rss_bytes
+
+SHARD_ROOT = REPO_ROOT / "lance_graph" / "graph_lance_shards"
+SHARED_DIR = "shared"
+
+# Dataset -> column holding the comment id it is partitioned on. `replyOfComment`
+# stays whole since both of its ends are comments.
+PARTITIONED = {
+    "Comment": "id",
+    "commentHasCreator": "src",
+    "commentHasTag": "src",
+    "commentIsLocatedIn": "src",
+    "replyOfPost": "src",
+}
+
+
+@dataclass(frozen=True)
+class PartialAggregate:
+    """How to merge the per-shard results of a query."""
+
+    # Count columns, summed across shards; every other column is a group key.
+    sums: tuple[str, ...]
+    order_by: str | None = None
+    descending: bool = False
+    limit: int | None = None
+
+
+SHARDABLE: dict[int, PartialAggregate] = {
+    12: PartialAggregate(("num_comments",)),
+    19: PartialAggregate(("comment_count",), order_by="comment_count", descending=True, limit=1),
+    20: PartialAggregate(("long_comment_count",)),
+    30: PartialAggregate(("has_self_reply",)),
+}
+
+
+def shard_of(ids: pa.ChunkedArray | pa.Array, shards: int) -> np.ndarray:
+    """Shard number per id: a multiplicative hash, so consecutive ids spread out."""
+    values = np.asarray(ids.to_numpy(), dtype=np.uint64)
+    return ((values * np.uint64(0x9E3779B97F4A7C15)) >> np.uint64(32)) % np.uint64(shards)
+
+
+def shared_path(shard_root: Path, name: str) -> Path:
+    return shard_root / SHARED_DIR / f"{name}.arrow"
+
+
+def write_shards(graph_root: Path, shard_root: Path, shards: int) -> dict[str, list[int]]:
+    """
+    Split the partitioned datasets into `shards` parts and write the others as
+    Arrow IPC files for the workers to memory-map; returns the row counts per shard.
+    """
+    import lance
+
+    for name in (*NODE_LABELS, *REL_DATASETS):
+        if name in PARTITIONED:
+            continue
+        # The IPC file format allows one dictionary per column.
+        table = lance.dataset(str(dataset_path(graph_root, name))).to_table().unify_dictionaries()
+        target = shared_path(shard_root, name)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with pa.ipc.new_file(str(target), table.schema) as writer:
+            writer.write_table(table)
+
+    counts: dict[str, list[int]] = {}
+    for name, column in PARTITIONED.items():
+        table = lance.dataset(str(dataset_path(graph_root, name))).to_table()
+        assignment = shard_of(table.column(column), shards)
+        counts[name] = []
+        for shard in range(shards):
+            part = table.filter(pa.array(assignment == shard))
+            target = dataset_path(shard_root / f"shard_{shard}", name)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            lance.write_dataset(part, str(target), mode="overwrite")
+            counts[name].append(part.num_rows)
+    return counts
+
+
+def load_shard(shard_dir: Path) -> GraphDatasets:
+    """One shard's comment datasets, plus zero-copy memory-mapped views of the shared ones."""
+    import lance
+
+    datasets: GraphDatasets = {}
+    for name in (*NODE_LABELS, *REL_DATASETS):
+        if name in PARTITIONED:
+            datasets[name] = lance.dataset(str(dataset_path(shard_dir, name))).to_table()
+        else:
+            source = pa.memory_map(str(shared_path(shard_dir.parent, name)))
+            datasets[name] = pa.ipc.open_file(source).read_all()
+    return datasets
+
+
+def _serve(shard_dir: Path, conn: Connection) -> None:
+    """Worker loop: run each query text received on `conn` against one shard."""
+    import lance_graph
+
+    engine = lance_graph.CypherEngine(build_config(), load_shard(shard_dir))
+    conn.send({"rss_bytes": current_rss_bytes(), "private_bytes": private_rss_bytes()})
+    while (text := conn.recv()) is not None:
+        try:
+            conn.send(to_arrow(engine.execute(text)))
+        except Exception as exc:  # noqa: BLE001 - re-raised in the coordinator
+            conn.send(RuntimeError(f"{shard_dir.name}: {exc}"))
+
+
+def merge_partials(parts: list[pa.Table], merge: PartialAggregate) -> pa.Table:
+    table = pa.concat_tables(parts, promote_options="default")
+    keys = [name for name in table.column_names if name not in merge.sums]
+    if keys:
+        merged = table.group_by(keys).aggregate([(name, "sum") for name in merge.sums])
+        renames = {f"{name}_sum": name for name in merge.sums}
+        merged = merged.rename_columns(
+            [renames.get(name, name) for name in merged.column_names]
+        ).select(table.column_names)
+    else:
+        merged = pa.table(
+            {
+                name: pa.array([pc.sum(table[name]).as_py() or 0], table.schema.field(name).type)
+                for name in merge.sums
+            }
+        )
+    if merge.order_by is not None:
+        order = "descending" if merge.descending else "ascending"
+        merged = merged.sort_by([(merge.order_by, order)])
+    if merge.limit is not None:
+        merged = merged.slice(0, merge.limit)
+    return merged
+
+
+class ShardedLanceAdapter(LanceAdapter):
+    name = "lance-sharded"
+    system = "lance-graph-sharded"
+    location_arg = "shard_root"
+
+    def __init__(
+        self, shard_root: str | Path = SHARD_ROOT, graph_root: str | Path = GRAPH_ROOT
+    ) -> None:
+        super().__init__(graph_root, persist_updates=False)
+        self.shard_root = Path(shard_root)
+        self._workers: list[tuple[Any, Connection]] = []
+        # RSS of each worker once its shard is loaded, as the worker reported it.
+        self.worker_memory: list[dict[str, int | None]] = []
+        # One scatter-gather at a time: the pipes carry one request each.
+        self._lock = threading.Lock()
+        self._owns_workers = True
+
+    def open(self, timings: PhaseTimings = None) -> None:
+        shard_dirs = sorted(self.shard_root.glob("shard_*"))
+        if not shard_dirs or not (self.shard_root / SHARED_DIR).is_dir():
+            raise FileNotFoundError(
+                f"No shards under {self.shard_root}; run lance_graph/build_shards.py first"
+            )
+        with phase(timings, "import"):
+            importlib.import_module("lance_graph")
+        with phase(timings, "build_config"):
+            self.config = build_config()
+        with phase(timings, "workers"):
+            context = mp.get_context("spawn")
+            for shard_dir in shard_dirs:
+                parent, child = context.Pipe()
+                process = context.Process(
+                    target=_serve, args=(shard_dir, child), daemon=True
+                )
+                process.start()
+                self._workers.append((process, parent))
+            self.worker_memory = [conn.recv() for _, conn in self._workers]
+
+    def fork(self) -> ShardedLanceAdapter:
+        other = ShardedLanceAdapter(self.shard_root, self.graph_root)
+        other.config = self.config
+        other._workers = self._workers
+        other._lock = self._lock
+        other._owns_workers = False
+        other.worker_memory = self.worker_memory
+        other._parent = self
+        return other
+
+    def close(self) -> None:
+        if self._owns_workers:
+            for process, conn in self._workers:
+                conn.send(None)
+                process.join()
+        self._workers = []
+        super().close()
+
+    def insert(self, batch: Any) -> None:
+        raise NotImplementedError("lance-sharded adapter has no write path")
+
+    def _full_engine(self) -> Any:
+        owner = self._parent or self
+        with owner._lock:
+            if owner._engine is None:
+                lance_graph = importlib.import_module("lance_graph")
+                owner.datasets = load_datasets(owner.graph_root)
+                owner._engine = lance_graph.CypherEngine(owner.config, owner.datasets)
+        return owner._engine
+
+    def execute(self, prepared: PreparedQuery) -> pa.Table:
+        # Only the catalog form of a query has known partial aggregates; variants
+        # such as existence checks run on the full engine.
+        merge = SHARDABLE.get(prepared.spec.idx)
+        if merge is None or prepared.spec != QUERIES[prepared.spec.idx]:
+            self._full_engine()
+            return super().execute(prepared)
+        text = TOP_K_RE.sub("", prepared.text)
+        with self._lock:
+            for _, conn in self._workers:
+                conn.send(text)
+            parts = [conn.recv() for _, conn in self._workers]
+        for part in parts:
+            if isinstance(part, Exception):
+                raise part
+        table = merge_partials(parts, merge)
+        column = prepared.spec.bool_column
+        if column is not None and not self.dialect.count_comparisons:
+            return count_as_bool(table, column)
+        return table
+
+    def profile(self, prepared: PreparedQuery) -> str:
+        self._full_engine()
+        return super().profile(prepared)
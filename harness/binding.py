@@ -0,0 +1,185 @@
+"""
+Parameter sweep on lance-graph: parsing each query once against parsing it
+every time.
+
+By default every query is rendered with its parameters inlined and run on the
+adapter's prebuilt `CypherEngine`, so each binding is a new query text that
+lance-graph parses and plans from scratch. With `bind_params`, the adapter
+parses each template once into a `CypherQuery` and binds the values at
+execution; lance-graph still plans it on every `execute()`, so only the parse
+is saved. This runs every selected query over `--bindings` parameter sets in
+three modes:
+
+- `inline`: literals inlined, on the `CypherEngine` (the adapter's default);
+- `reparsed`: bound parameters, with the template parsed again on every call;
+- `bound`: bound parameters, with the parsed template cached.
+
+`reparsed` and `bound` go through the same `CypherQuery.execute()` path, so
+their ratio is the cost of parsing; `inline` is a different entry point and is
+reported for reference. Each mode first runs `--warmup` untimed executions, and
+the order of the modes rotates from one binding to the next, so no mode always
+runs first. Parameters naming an entity, such as `$tag_name` or `$person_id`,
+are sampled from the graph; other parameters keep their catalog values. Results
+are checked to match between the modes.
+
+    uv run python -m harness.binding --queries 1,3,10,14 --bindings 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import REPO_ROOT, LanceAdapter
+from harness.catalog import QUERIES, parse_selection
+from harness.stats import latency_summary
+from harness.verify import digest_table
+
+BINDING_DIR = REPO_ROOT / "results" / "binding"
+
+# Mode -> (bind_params, cache_templates) on the adapter.
+MODES = {
+    "inline": (False, True),
+    "reparsed": (True, False),
+    "bound": (True, True),
+}
+
+# Parameter -> (dataset, column) its values are sampled from.
+SWEEP_COLUMNS = {
+    "first_name": ("Person", "firstname"),
+    "last_name": ("Person", "lastname"),
+    "person_id": ("Person", "id"),
+    "post_id": ("Post", "id"),
+    "tag_name": ("Tag", "name"),
+    "tagclass_name": ("Tagclass", "name"),
+    "place_name": ("Place", "name"),
+    "organization_name": ("Organisation", "name"),
+}
+
+
+def sample_bindings(
+    adapter: LanceAdapter, idx: int, count: int, rng: random.Random
+) -> list[dict[str, Any]]:
+    """`count` parameter sets for a query, the first being the catalog's own."""
+    spec = QUERIES[idx]
+    columns = {}
+    for name in spec.params:
+        if name in SWEEP_COLUMNS:
+            dataset, column = SWEEP_COLUMNS[name]
+            values = adapter.datasets[dataset].column(column).drop_null().unique()
+            columns[name] = values.to_pylist()
+    bindings = [dict(spec.params)]
+    for _ in range(count - 1):
+        bindings.append(
+            {
+                name: rng.choice(columns[name]) if name in columns else value
+                for name, value in spec.params.items()
+            }
+        )
+    return bindings
+
+
+def set_mode(adapter: LanceAdapter, mode: str) -> None:
+    adapter.bind_params, adapter.cache_templates = MODES[mode]
+
+
+def sweep(
+    adapter: LanceAdapter, idx: int, bindings: list[dict[str, Any]], warmup: int
+) -> tuple[dict[str, list[float]], dict[str, list[str]]]:
+    """Latency and result digest of each binding, per mode."""
+    spec = QUERIES[idx]
+    timings: dict[str, list[float]] = {mode: [] for mode in MODES}
+    digests: dict[str, list[str]] = {mode: [] for mode in MODES}
+    for mode in MODES:
+        set_mode(adapter, mode)
+        prepared = adapter.prepare(spec, bindings[0])
+        for _ in range(warmup):
+            adapter.execute(prepared)
+    modes = list(MODES)
+    for i, params in enumerate(bindings):
+        shift = i % len(modes)
+        for mode in modes[shift:] + modes[:shift]:
+            set_mode(adapter, mode)
+            prepared = adapter.prepare(spec, params)
+            start = time.perf_counter()
+            result = adapter.execute(prepared)
+            timings[mode].append((time.perf_counter() - start) * 1000)
+            digests[mode].append(digest_table(result).digest)
+    return timings, digests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time lance-graph parameter sweeps with inlined and bound parameters."
+    )
+    parser.add_argument("--queries", "-q", default=None, help="Comma-separated query numbers")
+    parser.add_argument("--bindings", "-n", type=int, default=20, help="Parameter sets per query")
+    parser.add_argument(
+        "--warmup", type=int, default=2, help="Untimed executions per mode before timing"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--location", default=None, help="Graph root other than the benchmark one")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output JSON path (default: results/binding/<system>.json)",
+    )
+    args = parser.parse_args()
+
+    selected = [idx for idx in parse_selection(args.queries) if QUERIES[idx].params]
+    adapter = LanceAdapter(args.location) if args.location else LanceAdapter()
+    system = adapter.system_name()
+    rng = random.Random(args.seed)
+    report: dict[str, Any] = {}
+    adapter.open()
+    try:
+        for idx in selected:
+            bindings = sample_bindings(adapter, idx, args.bindings, rng)
+            timings, digests = sweep(adapter, idx, bindings, args.warmup)
+            report[f"q{idx}"] = {
+                **{mode: latency_summary(timings[mode]) for mode in MODES},
+                "same_results": all(digests[mode] == digests["bound"] for mode in MODES),
+            }
+        # Misses include a parse per `reparsed` execution.
+        template_stats = {"hits": adapter.template_hits, "misses": adapter.template_misses}
+    finally:
+        adapter.close()
+
+    print(
+        f"| Query | {system} inline p50 (ms) | reparsed p50 (ms) | bound p50 (ms) "
+        "| parse-once speedup | same results |"
+    )
+    print("| --- | --- | --- | --- | --- | --- |")
+    for name, row in report.items():
+        inline, reparsed, bound = (row[mode]["p50_ms"] for mode in MODES)
+        print(
+            f"| {name} | {inline:.2f} | {reparsed:.2f} | {bound:.2f} | {reparsed / bound:.2f}x "
+            f"| {'yes' if row['same_results'] else 'NO'} |"
+        )
+    print(f"\nTemplate cache: {template_stats['hits']} hits, {template_stats['misses']} misses")
+
+    output = args.output or BINDING_DIR / f"{system}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "system": system,
+                "bindings": args.bindings,
+                "warmup": args.warmup,
+                "templates": template_stats,
+                "queries": report,
+            },
+            indent=2,
+        )
+    )
+    print(f"\nWrote binding timings to {output}")
+
+
+if __name__ == "__main__":
+    main()
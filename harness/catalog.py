@@ -0,0 +1,557 @@
+"""
+The 30-query LDBC SNB suite, written once for every engine.
+
+Queries are stored in the Kuzu/Neo4j dialect with `$name` parameters. An engine
+whose dialect differs gets its text either from the automatic rewrite done by
+`render()` (lance-graph: lowercase property names, no trailing semicolon, and
+`COUNT(...) > 0` returned as a plain count for the adapter to coerce to bool)
+or, where that is not enough, from a per-dialect override of the whole query.
+Overrides are used verbatim apart from parameter inlining.
+
+By default parameters are inlined as literals so every engine plans exactly the
+text it would have been given by hand.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from textwrap import dedent
+from typing import Any
+
+PARAM_RE = re.compile(r"\$(\w+)")
+PROPERTY_RE = re.compile(r"\b([A-Za-z_]\w*)\.([A-Za-z_]\w*)\b")
+COUNT_GT_ZERO_RE = re.compile(r"(COUNT\([^)]*\))\s*>\s*0\s+AS\s+(\w+)")
+# The count a yes/no query returns, with or without the `> 0` lance-graph drops.
+COUNT_RETURN_RE = re.compile(
+    r"RETURN\s+COUNT\((?:DISTINCT\s+)?([^)]*)\)(?:\s*>\s*0)?\s+AS\s+(\w+)\s*(;?)\s*$"
+)
+
+
+@dataclass(frozen=True)
+class Dialect:
+    name: str
+    # Quote character for inlined string literals.
+    quote: str = '"'
+    lowercase_properties: bool = False
+    semicolons: bool = True
+    # Whether `RETURN COUNT(...) > 0 AS col` is supported. If not, the count is
+    # returned as `col` and the adapter turns it into a bool.
+    count_comparisons: bool = True
+
+
+DIALECTS: dict[str, Dialect] = {
+    "kuzu": Dialect("kuzu"),
+    "neo4j": Dialect("neo4j"),
+    "lance": Dialect(
+        "lance",
+        quote="'",
+        lowercase_properties=True,
+        semicolons=False,
+        count_comparisons=False,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    idx: int
+    question: str
+    cypher: str
+    params: Mapping[str, Any] = field(default_factory=dict)
+    # Dialect name -> full query text, for rewrites `render()` can't do.
+    overrides: Mapping[str, str] = field(default_factory=dict)
+
+    @property
+    def bool_column(self) -> str | None:
+        """Output column of a yes/no query (`COUNT(...) > 0 AS col`), if any."""
+        match = COUNT_GT_ZERO_RE.search(self.cypher)
+        return match.group(2) if match else None
+
+    @property
+    def test_name(self) -> str:
+        """Name of the pytest-benchmark test that times this query."""
+        return f"test_benchmark_query{self.idx}"
+
+
+def format_literal(value: Any, dialect: Dialect) -> str:
+    if isinstance(value, str):
+        if dialect.quote == "'":
+            escaped = value.replace("'", "''")
+        else:
+            escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f"{dialect.quote}{escaped}{dialect.quote}"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    return str(value)
+
+
+def inline_params(query: str, params: Mapping[str, Any], dialect: Dialect) -> str:
+    def _replace(match: re.Match[str]) -> str:
+        name = match.group(1)
+        if name not in params:
+            raise KeyError(f"No value for query parameter ${name}")
+        return format_literal(params[name], dialect)
+
+    return PARAM_RE.sub(_replace, query)
+
+
+def dialect_text(spec: QuerySpec, dialect: Dialect) -> str:
+    """Query text for the dialect, with `$name` parameters left in place."""
+    override = spec.overrides.get(dialect.name)
+    if override is not None:
+        return dedent(override).strip()
+    text = dedent(spec.cypher).strip().rstrip(";")
+    if dialect.lowercase_properties:
+        text = PROPERTY_RE.sub(lambda m: f"{m.group(1)}.{m.group(2).lower()}", text)
+    if not dialect.count_comparisons:
+        text = COUNT_GT_ZERO_RE.sub(r"\1 AS \2", text)
+    if dialect.semicolons:
+        text += ";"
+    return text
+
+
+def render(
+    spec: QuerySpec,
+    dialect: Dialect,
+    params: Mapping[str, Any] | None = None,
+) -> str:
+    """Query text for the dialect with parameters inlined as literals."""
+    values = {**spec.params, **(params or {})}
+    return inline_params(dialect_text(spec, dialect), values, dialect)
+
+
+def existence_spec(spec: QuerySpec) -> QuerySpec:
+    """
+    The existence form of a yes/no query: instead of counting every match, it
+    returns the first one with `LIMIT 1`, so the engine can stop there. Its
+    answer is whether it returns a row.
+    """
+    if spec.bool_column is None:
+        raise ValueError(f"Query {spec.idx} is not a yes/no query")
+
+    def _rewrite(text: str) -> str:
+        rewritten, found = COUNT_RETURN_RE.subn(r"RETURN \1 AS \2 LIMIT 1\3", dedent(text).strip())
+        if not found:
+            raise ValueError(f"No count to rewrite in query {spec.idx}")
+        return rewritten
+
+    return QuerySpec(
+        spec.idx,
+        spec.question,
+        _rewrite(spec.cypher),
+        spec.params,
+        {dialect: _rewrite(text) for dialect, text in spec.overrides.items()},
+    )
+
+
+def parse_selection(selection: str | None) -> list[int]:
+    """Parse a comma-separated list of query numbers; empty/`all` means every query."""
+    if selection is None or selection.strip() in {"", "all", "run_all"}:
+        return list(QUERIES)
+    indices: list[int] = []
+    for part in selection.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            indices.append(int(part))
+        except ValueError:
+            raise ValueError(f"Invalid query index: {part}")
+    return indices
+
+
+_SUITE = (
+    QuerySpec(
+        1,
+        "Who are the names of people who live in Glasgow and are interested in Napoleon?",
+        """
+        MATCH (p:Person)-[:personIsLocatedIn]->(pl:Place),
+              (p)-[:hasInterest]->(t:Tag)
+        WHERE pl.name = $place_name AND t.name = $tag_name
+        RETURN p.firstName, p.lastName;
+        """,
+        {"place_name": "Glasgow", "tag_name": "Napoleon"},
+        overrides={
+            "lance": """
+            MATCH (t:Tag)<-[:hasInterest]-(p:Person)-[:personIsLocatedIn]->(pl:Place)
+            WHERE pl.name = $place_name AND t.name = $tag_name
+            RETURN p.firstname, p.lastname
+            """,
+        },
+    ),
+    QuerySpec(
+        2,
+        "IDs of posts by Lei Zhang whose content contains Zulu.",
+        """
+        MATCH (p:Person)<-[:postHasCreator]-(post:Post)
+        WHERE p.firstName = $first_name AND p.lastName = $last_name
+          AND post.content CONTAINS $content_fragment
+        RETURN post.ID;
+        """,
+        {"first_name": "Lei", "last_name": "Zhang", "content_fragment": "Zulu"},
+    ),
+    QuerySpec(
+        3,
+        "Creator of post ID 962077547172 and where they studied.",
+        """
+        MATCH (post:Post {ID: $post_id})-[:postHasCreator]->(person:Person),
+              (person)-[:studyAt]->(org:Organisation)
+        RETURN person.firstName, person.lastName, org.name;
+        """,
+        {"post_id": 962077547172},
+        overrides={
+            "lance": """
+            MATCH (post:Post)-[:postHasCreator]->(person:Person),
+                  (person)-[:studyAt]->(org:Organisation)
+            WHERE post.id = $post_id
+            RETURN person.firstname, person.lastname, org.name
+            """,
+        },
+    ),
+    QuerySpec(
+        4,
+        "Comment IDs by Alfredo Gomez with length > 100.",
+        """
+        MATCH (p:Person)<-[:commentHasCreator]-(c:Comment)
+        WHERE p.firstName = $first_name
+          AND p.lastName = $last_name
+          AND c.length > $min_length
+        RETURN c.ID;
+        """,
+        {"first_name": "Alfredo", "last_name": "Gomez", "min_length": 100},
+    ),
+    QuerySpec(
+        5,
+        "Full names of persons with last name Choi who are members of forums containing John Brown.",
+        """
+        MATCH (f:Forum)-[:hasMember]->(p:Person)
+        WHERE f.title CONTAINS $forum_title_fragment
+          AND p.lastName CONTAINS $last_name_fragment
+        RETURN DISTINCT p.firstName, p.lastName
+        LIMIT 10;
+        """,
+        {"forum_title_fragment": "John Brown", "last_name_fragment": "Choi"},
+    ),
+    QuerySpec(
+        6,
+        "IDs of employees who work at Nova_Air and whose last name contains Bravo.",
+        """
+        MATCH (p:Person)-[:workAt]->(o:Organisation)
+        WHERE o.name = $organization_name AND p.lastName CONTAINS $last_name_fragment
+        RETURN p.ID;
+        """,
+        {"organization_name": "Nova_Air", "last_name_fragment": "Bravo"},
+    ),
+    QuerySpec(
+        7,
+        "Places where person 1786706544494 commented on posts tagged Jamaica.",
+        """
+        MATCH (p:Person {ID: $person_id})<-[:commentHasCreator]-(c:Comment)
+              -[:replyOfPost]->(post:Post)-[:postHasTag]->(t:Tag),
+              (c)-[:commentIsLocatedIn]->(place:Place)
+        WHERE t.name = $tag_name
+        RETURN DISTINCT place.name;
+        """,
+        {"person_id": 1786706544494, "tag_name": "Jamaica"},
+        overrides={
+            "lance": """
+            MATCH (p:Person)<-[:commentHasCreator]-(c:Comment)
+                  -[:replyOfPost]->(post:Post)-[:postHasTag]->(t:Tag),
+                  (c)-[:commentIsLocatedIn]->(place:Place)
+            WHERE p.id = $person_id AND t.name = $tag_name
+            RETURN DISTINCT place.name
+            """,
+        },
+    ),
+    QuerySpec(
+        8,
+        "Distinct IDs of persons born after 1990 who moderate forums containing Emilio Fernandez.",
+        """
+        MATCH (p:Person)<-[:hasModerator]-(f:Forum)
+        WHERE p.birthday > DATE($min_birthday)
+          AND f.title CONTAINS $forum_title_fragment
+        RETURN DISTINCT p.ID;
+        """,
+        {"min_birthday": "1990-01-01", "forum_title_fragment": "Emilio Fernandez"},
+        overrides={
+            "lance": """
+            MATCH (p:Person)<-[:hasModerator]-(f:Forum)
+            WHERE p.birthday > $min_birthday
+              AND f.title CONTAINS $forum_title_fragment
+            RETURN DISTINCT p.id
+            """,
+        },
+    ),
+    QuerySpec(
+        9,
+        "Persons with last name Johansson who know someone who studied in Tallinn.",
+        """
+        MATCH (p:Person)-[:knows]->(p2:Person)-[:studyAt]->(o:Organisation)
+              -[:organisationIsLocatedIn]->(l:Place)
+        WHERE l.name = $place_name AND p.lastName = $last_name
+        RETURN p.ID, p.firstName, p.lastName;
+        """,
+        {"place_name": "Tallinn", "last_name": "Johansson"},
+    ),
+    QuerySpec(
+        10,
+        "Unique IDs of persons who commented on posts tagged Cate_Blanchett.",
+        """
+        MATCH (c:Comment)-[:replyOfPost]->(post:Post)-[:postHasTag]->(t:Tag),
+              (c)-[:commentHasCreator]->(p:Person)
+        WHERE t.name = $tag_name
+        RETURN DISTINCT p.ID;
+        """,
+        {"tag_name": "Cate_Blanchett"},
+    ),
+    QuerySpec(
+        11,
+        "Non-university organization with most employees.",
+        """
+        MATCH (p:Person)-[:workAt]->(o:Organisation)
+        WHERE o.type <> $organization_type
+        RETURN COUNT(DISTINCT p.ID) AS num_e, o.name
+        ORDER BY num_e DESC
+        LIMIT 1;
+        """,
+        {"organization_type": "university"},
+    ),
+    QuerySpec(
+        12,
+        "Total number of comments with non-null content created by people in Berlin.",
+        """
+        MATCH (c:Comment)-[:commentHasCreator]->(p:Person)-[:personIsLocatedIn]->(l:Place)
+        WHERE c.content IS NOT NULL AND l.name = $place_name
+        RETURN COUNT(DISTINCT c.ID) AS num_comments;
+        """,
+        {"place_name": "Berlin"},
+    ),
+    QuerySpec(
+        13,
+        "Total number of persons who liked comments created by Rafael Alonso.",
+        """
+        MATCH (p:Person)<-[:commentHasCreator]-(c:Comment)<-[:likeComment]-(p2:Person)
+        WHERE p.firstName = $first_name AND p.lastName = $last_name
+        RETURN COUNT(DISTINCT p2.ID) AS num_persons;
+        """,
+        {"first_name": "Rafael", "last_name": "Alonso"},
+    ),
+    QuerySpec(
+        14,
+        "Number of forums with tags belonging to the Athlete tagclass.",
+        """
+        MATCH (f:Forum)-[:forumHasTag]->(:Tag)-[:hasType]->(:Tagclass {name: $tagclass_name})
+        RETURN COUNT(DISTINCT f.ID) AS num_forums;
+        """,
+        {"tagclass_name": "Athlete"},
+        overrides={
+            "lance": """
+            MATCH (f:Forum)-[:forumHasTag]->(:Tag)-[:hasType]->(tc:Tagclass)
+            WHERE tc.name = $tagclass_name
+            RETURN COUNT(DISTINCT f.id) AS num_forums
+            """,
+        },
+    ),
+    QuerySpec(
+        15,
+        "Total number of forums moderated by employees of Air_Tanzania.",
+        """
+        MATCH (f:Forum)-[:hasModerator]->(p:Person)-[:workAt]->(o:Organisation)
+        WHERE o.name = $organization_name
+        RETURN COUNT(DISTINCT f.ID) AS num_forums;
+        """,
+        {"organization_name": "Air_Tanzania"},
+    ),
+    QuerySpec(
+        16,
+        "Number of posts containing Copernicus created by persons located in Mumbai.",
+        """
+        MATCH (p:Person)-[:personIsLocatedIn]->(l:Place),
+              (p)<-[:postHasCreator]-(post:Post)
+        WHERE l.name = $place_name AND post.content CONTAINS $content_fragment
+        RETURN COUNT(post.ID) AS num_posts;
+        """,
+        {"place_name": "Mumbai", "content_fragment": "Copernicus"},
+    ),
+    QuerySpec(
+        17,
+        "Most common interest tag among people who studied at Indian_Institute_of_Science.",
+        """
+        MATCH (p:Person)-[:studyAt]->(o:Organisation), (p)-[:hasInterest]->(t:Tag)
+        WHERE o.name = $organization_name
+        RETURN t.name, COUNT(*) AS tag_count
+        ORDER BY tag_count DESC
+        LIMIT 1;
+        """,
+        {"organization_name": "Indian_Institute_of_Science"},
+    ),
+    QuerySpec(
+        18,
+        "People studying at The_Oxford_Educational_Institutions with interest in William_Shakespeare.",
+        """
+        MATCH (p:Person)-[:studyAt]->(o:Organisation), (p)-[:hasInterest]->(t:Tag)
+        WHERE o.name = $organization_name
+          AND t.name = $tag_name
+        RETURN COUNT(DISTINCT p.ID) AS num_p;
+        """,
+        {
+            "organization_name": "The_Oxford_Educational_Institutions",
+            "tag_name": "William_Shakespeare",
+        },
+    ),
+    QuerySpec(
+        19,
+        "Place with most comments whose tag contains Copernicus.",
+        """
+        MATCH (c:Comment)-[:commentHasTag]->(t:Tag), (c)-[:commentIsLocatedIn]->(l:Place)
+        WHERE t.name CONTAINS $tag_name_fragment
+        RETURN l.name, COUNT(c.ID) AS comment_count
+        ORDER BY comment_count DESC
+        LIMIT 1;
+        """,
+        {"tag_name_fragment": "Copernicus"},
+    ),
+    QuerySpec(
+        20,
+        "Number of comments containing World War II with length > 1000.",
+        """
+        MATCH (c:Comment)
+        WHERE c.content CONTAINS $content_fragment AND c.length > $min_length
+        RETURN COUNT(c.ID) AS long_comment_count;
+        """,
+        {"content_fragment": "World War II", "min_length": 1000},
+    ),
+    QuerySpec(
+        21,
+        "Has Bill Moore liked the post with ID 1649268446863?",
+        """
+        MATCH (p:Post)<-[:likePost]-(p2:Person)
+        WHERE p2.firstName = $first_name AND p2.lastName = $last_name
+          AND p.ID = $post_id
+        RETURN COUNT(p.ID) > 0 AS liked;
+        """,
+        {"first_name": "Bill", "last_name": "Moore", "post_id": 1649268446863},
+    ),
+    QuerySpec(
+        22,
+        "Did anyone who works at Linxair create a comment that replied to a post?",
+        """
+        MATCH (p:Person)-[:workAt]->(o:Organisation),
+              (c:Comment)-[:replyOfPost]->(post:Post),
+              (c)-[:commentHasCreator]->(p)
+        WHERE o.name = $organization_name
+        RETURN COUNT(DISTINCT c.ID) > 0 AS has_reply_comment;
+        """,
+        {"organization_name": "Linxair"},
+        overrides={
+            "lance": """
+            MATCH (o:Organisation)<-[:workAt]-(p:Person)<-[:commentHasCreator]-(c:Comment)-[:replyOfPost]->(post:Post)
+            WHERE o.name = $organization_name
+            RETURN COUNT(DISTINCT c.id) AS has_reply_comment
+            """,
+        },
+    ),
+    QuerySpec(
+        23,
+        "Is there a person with last name Gurung who is a moderator of a forum tagged Norah_Jones?",
+        """
+        MATCH (p:Person)<-[:hasModerator]-(f:Forum)-[:forumHasTag]->(t:Tag)
+        WHERE t.name = $tag_name AND p.lastName = $last_name
+        RETURN COUNT(DISTINCT p.ID) > 0 AS has_moderator;
+        """,
+        {"tag_name": "Norah_Jones", "last_name": "Gurung"},
+    ),
+    QuerySpec(
+        24,
+        "Is there a person who lives in Paris and is interested in Cate_Blanchett?",
+        """
+        MATCH (p:Person)-[:personIsLocatedIn]->(l:Place), (p)-[:hasInterest]->(t:Tag)
+        WHERE l.name = $place_name AND t.name = $tag_name
+        RETURN COUNT(DISTINCT p.ID) > 0 AS has_person;
+        """,
+        {"place_name": "Paris", "tag_name": "Cate_Blanchett"},
+    ),
+    QuerySpec(
+        25,
+        "Does Amit Singh know anyone who studied at MIT_School_of_Engineering?",
+        """
+        MATCH (amit:Person)-[:knows]->(p2:Person)-[:studyAt]->(o:Organisation)
+        WHERE amit.firstName = $first_name AND amit.lastName = $last_name
+          AND o.name = $organization_name
+        RETURN COUNT(DISTINCT p2.ID) > 0 AS knows_someone;
+        """,
+        {
+            "first_name": "Amit",
+            "last_name": "Singh",
+            "organization_name": "MIT_School_of_Engineering",
+        },
+    ),
+    QuerySpec(
+        26,
+        "Are there any forums with tag Benjamin_Franklin that person 10995116287854 is a member of?",
+        """
+        MATCH (f:Forum)-[:hasMember]->(p:Person), (f)-[:forumHasTag]->(t:Tag)
+        WHERE p.ID = $person_id AND t.name = $tag_name
+        RETURN COUNT(DISTINCT f.ID) > 0 AS has_forum;
+        """,
+        {"person_id": 10995116287854, "tag_name": "Benjamin_Franklin"},
+    ),
+    QuerySpec(
+        27,
+        "Did any person from Toronto create a comment with tag Winston_Churchill?",
+        """
+        MATCH (c:Comment)-[:commentHasCreator]->(p:Person),
+              (p)-[:personIsLocatedIn]->(l:Place),
+              (c)-[:commentHasTag]->(t:Tag)
+        WHERE l.name = $place_name AND t.name = $tag_name
+        RETURN COUNT(DISTINCT c.ID) > 0 AS has_comment;
+        """,
+        {"place_name": "Toronto", "tag_name": "Winston_Churchill"},
+    ),
+    QuerySpec(
+        28,
+        "Are there people in Manila interested in tags of type BritishRoyalty?",
+        """
+        MATCH (t:Tag)-[:hasType]->(tc:Tagclass),
+              (p:Person)-[:hasInterest]->(t),
+              (p)-[:personIsLocatedIn]->(l:Place)
+        WHERE tc.name = $tagclass_name AND l.name = $place_name
+        RETURN COUNT(DISTINCT p.ID) > 0 AS has_people;
+        """,
+        {"tagclass_name": "BritishRoyalty", "place_name": "Manila"},
+        overrides={
+            "lance": """
+            MATCH (p:Person)-[:hasInterest]->(t:Tag)-[:hasType]->(tc:Tagclass),
+                  (p)-[:personIsLocatedIn]->(l:Place)
+            WHERE tc.name = $tagclass_name AND l.name = $place_name
+            RETURN COUNT(DISTINCT p.id) AS has_people
+            """,
+        },
+    ),
+    QuerySpec(
+        29,
+        "Has Justine Fenter written a post using Safari?",
+        """
+        MATCH (p:Person)<-[:postHasCreator]-(post:Post)
+        WHERE p.firstName = $first_name AND p.lastName = $last_name
+          AND post.browserUsed CONTAINS $browser_name
+        RETURN COUNT(post.ID) > 0 AS has_written_post_with_safari;
+        """,
+        {"first_name": "Justine", "last_name": "Fenter", "browser_name": "Safari"},
+    ),
+    QuerySpec(
+        30,
+        "Are there comments replying to posts created by the same person?",
+        """
+        MATCH (c:Comment)-[:commentHasCreator]->(creator:Person),
+              (c)-[:replyOfPost]->(post:Post)-[:postHasCreator]->(creator)
+        RETURN COUNT(DISTINCT c.ID) > 0 AS has_self_reply;
+        """,
+    ),
+)
+
+QUERIES: dict[int, QuerySpec] = {spec.idx: spec for spec in _SUITE}
@@ -0,0 +1,189 @@
+"""
+Cold-start benchmark: first-execution latency versus steady state, per query.
+
+pytest-benchmark runs every query on a session-scoped connection with warmup
+rounds, so the cost of the first execution after a restart never shows up.
+Here each sample runs in a fresh subprocess that opens the database, times the
+first execution of a single query, then times a few repeat executions of the
+same query on the same connection.
+
+With `--drop-caches` the OS page cache is dropped before every sample where the
+platform allows it (root on Linux, `purge` on macOS). Neo4j keeps its own page
+cache on the server, so pass `--restart-cmd` to restart the container between
+samples if that should be cold as well.
+
+    uv run python -m harness.cold --engine kuzu --queries 1,7,30 --samples 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import ADAPTERS, REPO_ROOT, EngineAdapter, get_adapter
+from harness.catalog import QUERIES, parse_selection
+from harness.system import drop_page_cache
+
+
+def _open_with_retry(engine: str, timeout_s: float) -> tuple[EngineAdapter, float]:
+    deadline = time.perf_counter() + timeout_s
+    while True:
+        adapter = get_adapter(engine)
+        start = time.perf_counter()
+        try:
+            adapter.open()
+        except Exception:
+            adapter.close()
+            if time.perf_counter() >= deadline:
+                raise
+            time.sleep(0.5)
+            continue
+        return adapter, (time.perf_counter() - start) * 1000
+
+
+def run_worker(engine: str, idx: int, steady_runs: int, open_timeout_s: float) -> dict[str, Any]:
+    adapter, open_ms = _open_with_retry(engine, open_timeout_s)
+    try:
+        prepared = adapter.prepare(QUERIES[idx])
+        start = time.perf_counter()
+        adapter.execute(prepared)
+        first_ms = (time.perf_counter() - start) * 1000
+
+        steady_ms: list[float] = []
+        for _ in range(steady_runs):
+            start = time.perf_counter()
+            adapter.execute(prepared)
+            steady_ms.append((time.perf_counter() - start) * 1000)
+    finally:
+        adapter.close()
+    return {"query": idx, "open_ms": open_ms, "first_ms": first_ms, "steady_ms": steady_ms}
+
+
+def _spawn_worker(engine: str, idx: int, steady_runs: int, open_timeout_s: float) -> dict[str, Any]:
+    cmd = [
+        sys.executable,
+        "-m",
+        "harness.cold",
+        "--worker",
+        "--engine",
+        engine,
+        "--queries",
+        str(idx),
+        "--steady-runs",
+        str(steady_runs),
+        "--open-timeout",
+        str(open_timeout_s),
+    ]
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Worker failed for q{idx}:\n{proc.stderr}")
+    # Engines may write their own output; the sample is always the last line.
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples: list[dict[str, Any]]) -> dict[str, float]:
+    steady = [value for sample in samples for value in sample["steady_ms"]]
+    first = statistics.median(sample["first_ms"] for sample in samples)
+    summary = {
+        "open_ms": statistics.median(sample["open_ms"] for sample in samples),
+        "first_ms": first,
+        "steady_ms": statistics.median(steady) if steady else float("nan"),
+    }
+    summary["first_over_steady"] = (
+        first / summary["steady_ms"] if summary["steady_ms"] > 0 else float("nan")
+    )
+    return summary
+
+
+def to_markdown(system: str, summaries: dict[int, dict[str, float]]) -> str:
+    lines = [
+        f"| Query | {system} open (ms) | first (ms) | steady (ms) | first / steady |",
+        "| --- | --- | --- | --- | --- |",
+    ]
+    for idx, summary in summaries.items():
+        lines.append(
+            f"| q{idx} | {summary['open_ms']:.1f} | {summary['first_ms']:.1f} "
+            f"| {summary['steady_ms']:.1f} | {summary['first_over_steady']:.1f}x |"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure first-execution (cold) latency against steady state."
+    )
+    parser.add_argument("--engine", "-e", required=True, choices=sorted(ADAPTERS))
+    parser.add_argument(
+        "--queries", "-q", default=None, help="Comma-separated query numbers (default: all)"
+    )
+    parser.add_argument(
+        "--samples", "-n", type=int, default=3, help="Fresh processes per query"
+    )
+    parser.add_argument(
+        "--steady-runs",
+        type=int,
+        default=5,
+        help="Repeat executions after the first one, used as the steady-state baseline",
+    )
+    parser.add_argument(
+        "--drop-caches",
+        action="store_true",
+        help="Drop the OS page cache before every sample (needs root/sudo)",
+    )
+    parser.add_argument(
+        "--restart-cmd",
+        default=None,
+        help="Shell command run before every sample, e.g. to restart a server",
+    )
+    parser.add_argument(
+        "--open-timeout",
+        type=float,
+        default=0.0,
+        help="Seconds to keep retrying the open, useful together with --restart-cmd",
+    )
+    parser.add_argument("--output", "-o", type=Path, default=None, help="Write raw samples as JSON")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    queries = parse_selection(args.queries)
+
+    if args.worker:
+        sample = run_worker(args.engine, queries[0], args.steady_runs, args.open_timeout)
+        print(json.dumps(sample))
+        return
+
+    warned = False
+    raw: dict[int, list[dict[str, Any]]] = {}
+    for idx in queries:
+        raw[idx] = []
+        for _ in range(args.samples):
+            if args.restart_cmd:
+                subprocess.run(args.restart_cmd, shell=True, check=True)
+            if args.drop_caches and not drop_page_cache() and not warned:
+                print("Page cache could not be dropped; cold runs only reopen the database.")
+                warned = True
+            raw[idx].append(
+                _spawn_worker(args.engine, idx, args.steady_runs, args.open_timeout)
+            )
+        print(f"q{idx}: {summarize(raw[idx])['first_ms']:.1f}ms first execution")
+
+    system = get_adapter(args.engine).system_name()
+    summaries = {idx: summarize(samples) for idx, samples in raw.items()}
+    print()
+    print(to_markdown(system, summaries))
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"system": system, "samples": raw, "summary": summaries}
+        args.output.write_text(json.dumps(payload, indent=2))
+        print(f"\nWrote raw samples to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Row counts and on-disk size per node and relationship table, for any engine,
+to check a fresh build in seconds.
+
+Counts come from metadata where the engine keeps it:
+
+- lance-graph: the row counts in each Lance dataset's fragment metadata, read
+  with `lance.dataset()` without loading the graph into the adapter.
+- Neo4j: the count store, which answers `MATCH (n:Label) RETURN count(n)` and
+  `MATCH ()-[r:TYPE]->() RETURN count(r)` without touching the graph.
+- Kuzu / Ladybug: the cardinalities kept next to the database by a `--stats`
+  build (`<db>.stats.json`, see `harness.ingest_stats`), unless the database
+  was written after them. These are the counts as of ingest; their source is
+  `ingest`.
+
+Otherwise every table is counted with a `MATCH` over `--workers` connections
+in parallel. Sizes are per dataset for lance-graph and for the whole database
+file for the embedded engines; Neo4j keeps its store on the server.
+
+    uv run python -m harness.counts --engine ladybug
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from harness.adapters import ADAPTERS, EngineAdapter, get_adapter
+from harness.adapters.embedded import EmbeddedAdapter
+from harness.adapters.lance import LanceAdapter, dataset_path
+from harness.adapters.neo4j import Neo4jAdapter
+from harness.catalog import QuerySpec
+from harness.ingest_stats import current_cardinality
+from harness.ldbc import EDGE_FILES, NODE_FILES
+
+
+@dataclass
+class TableCount:
+    name: str
+    kind: str
+    count: int
+    # "metadata" or "scan".
+    source: str
+    size_bytes: int | None = None
+
+
+def disk_size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(child.stat().st_size for child in path.rglob("*") if child.is_file())
+
+
+def count_spec(name: str, kind: str) -> QuerySpec:
+    pattern = f"(n:{name})" if kind == "node" else f"()-[n:{name}]->()"
+    return QuerySpec(
+        0, f"How many rows does {name} have?", f"MATCH {pattern} RETURN COUNT(n) AS count;"
+    )
+
+
+def _tables() -> list[tuple[str, str]]:
+    return [(label, "node") for label in NODE_FILES] + [(rel, "rel") for rel in EDGE_FILES]
+
+
+def _count(adapter: EngineAdapter, name: str, kind: str) -> int:
+    result = adapter.execute(adapter.prepare(count_spec(name, kind)))
+    return int(result.column(0)[0].as_py())
+
+
+def scan_counts(adapter: EngineAdapter, workers: int) -> list[TableCount]:
+    """Count every table with a MATCH, spread over `workers` connections."""
+    tables = _tables()
+    counts: dict[str, TableCount] = {}
+
+    def _worker(assigned: list[tuple[str, str]]) -> None:
+        fork = adapter.fork()
+        try:
+            for name, kind in assigned:
+                counts[name] = TableCount(name, kind, _count(fork, name, kind), "scan")
+        finally:
+            fork.close()
+
+    threads = [
+        threading.Thread(target=_worker, args=(tables[i::workers],)) for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    missing = [name for name, _ in tables if name not in counts]
+    if missing:
+        raise RuntimeError(f"Counting failed for: {missing}")
+    return [counts[name] for name, _ in tables]
+
+
+def stored_counts(adapter: EngineAdapter) -> list[TableCount] | None:
+    """
+    Counts read from files next to the data, without opening the engine, or
+    None if there are none to read.
+    """
+    if isinstance(adapter, LanceAdapter):
+        import lance
+
+        counts = []
+        for name, kind in _tables():
+            path = dataset_path(adapter.graph_root, name)
+            rows = lance.dataset(str(path)).count_rows()
+            counts.append(TableCount(name, kind, rows, "metadata", disk_size(path)))
+        return counts
+    if isinstance(adapter, EmbeddedAdapter):
+        stats_path = Path(f"{adapter.db_path}.stats.json")
+        tables = current_cardinality(stats_path, adapter.db_path)
+        if tables is None or any(name not in tables for name, _ in _tables()):
+            return None
+        return [
+            TableCount(name, kind, tables[name]["count"], "ingest") for name, kind in _tables()
+        ]
+    return None
+
+
+def metadata_counts(adapter: EngineAdapter) -> list[TableCount] | None:
+    """Counts from an open engine's metadata, or None if it has none to offer."""
+    if isinstance(adapter, Neo4jAdapter):
+        return [
+            TableCount(name, kind, _count(adapter, name, kind), "metadata")
+            for name, kind in _tables()
+        ]
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Row counts and sizes per table, from metadata where the engine has it."
+    )
+    parser.add_argument("--engine", "-e", required=True, choices=sorted(ADAPTERS))
+    parser.add_argument("--location", default=None, help="Database other than the benchmark one")
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Connections for scans")
+    parser.add_argument(
+        "--scan", action="store_true", help="Count with MATCH even where metadata exists"
+    )
+    args = parser.parse_args()
+
+    adapter = get_adapter(args.engine, args.location)
+    start = time.perf_counter()
+    counts = None if args.scan else stored_counts(adapter)
+    if counts is None:
+        # lance-graph only gets here to scan, which loads the whole graph.
+        adapter.open()
+        try:
+            counts = None if args.scan else metadata_counts(adapter)
+            if counts is None:
+                counts = scan_counts(adapter, args.workers)
+        finally:
+            adapter.close()
+    elapsed = time.perf_counter() - start
+
+    print("| Table | Kind | Rows | Source | Size (MB) |")
+    print("| --- | --- | --- | --- | --- |")
+    for table in counts:
+        size = "-" if table.size_bytes is None else f"{table.size_bytes / 2**20:.1f}"
+        print(f"| {table.name} | {table.kind} | {table.count} | {table.source} | {size} |")
+    if any(table.source == "ingest" for table in counts):
+        print("\nCounts are as of the --stats build; the database has not been written since.")
+    nodes = sum(table.count for table in counts if table.kind == "node")
+    rels = sum(table.count for table in counts if table.kind == "rel")
+    print(f"\n{nodes} nodes and {rels} relationships in {len(counts)} tables, {elapsed:.2f}s")
+    if isinstance(adapter, EmbeddedAdapter):
+        print(f"Database size: {disk_size(adapter.db_path) / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Memory and scan speed of the dictionary-encoded string columns in lance-graph.
+
+`lance_graph/build_graph.py` dictionary-encodes string columns with few distinct
+values, such as `browserused` and `language` on the millions of Comment and
+Post rows, or `Organisation.type`. This harness compares them with plain UTF-8
+strings:
+
+- memory: the Arrow bytes of each encoded column, and of the same column
+  decoded;
+- filter speed: an equality filter on each column, decoded, and encoded, where
+  the value is compared with the dictionary once and the result gathered by
+  index;
+- queries: each query's latency with the tables as loaded, and with
+  `LanceAdapter(dictionary_strings=False)`, which decodes them on load, and
+  whether both return the same rows. The default queries are q29, which filters
+  `Post.browserused`, and q11, which filters `Organisation.type`.
+
+The report is written to `results/dictionary/<system>.json`.
+
+    uv run python -m harness.dictionary --queries 11,29
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from harness.adapters import REPO_ROOT, LanceAdapter
+from harness.adapters.lance import GraphDatasets
+from harness.catalog import QUERIES, parse_selection
+from harness.stats import median_query_ms
+from harness.verify import digest_table
+
+DICTIONARY_DIR = REPO_ROOT / "results" / "dictionary"
+
+DEFAULT_QUERIES = "11,29"
+
+
+def dictionary_equal(column: pa.ChunkedArray, value: Any) -> pa.ChunkedArray:
+    """`column == value` for a dictionary column, comparing each distinct value once."""
+    return pa.chunked_array(
+        [pc.take(pc.equal(chunk.dictionary, value), chunk.indices) for chunk in column.chunks],
+        type=pa.bool_(),
+    )
+
+
+def _filter_ms(column: pa.ChunkedArray, value: Any, runs: int) -> float:
+    equal = dictionary_equal if pa.types.is_dictionary(column.type) else pc.equal
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        equal(column, value)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def encoded_columns(datasets: GraphDatasets, runs: int) -> dict[str, dict[str, Any]]:
+    """Bytes and equality-filter time of every dictionary column, encoded and decoded."""
+    report: dict[str, dict[str, Any]] = {}
+    for name, table in datasets.items():
+        for field, column in zip(table.schema, table.columns):
+            if not pa.types.is_dictionary(field.type) or table.num_rows == 0:
+                continue
+            decoded = column.cast(field.type.value_type)
+            values = pc.drop_null(decoded)
+            if len(values) == 0:
+                continue
+            value = values[0]
+            report[f"{name}.{field.name}"] = {
+                "rows": table.num_rows,
+                "distinct": len(pc.unique(decoded)),
+                "encoded_bytes": column.nbytes,
+                "plain_bytes": decoded.nbytes,
+                "encoded_filter_ms": _filter_ms(column, value, runs),
+                "plain_filter_ms": _filter_ms(decoded, value, runs),
+            }
+    return report
+
+
+def time_queries(
+    adapter: LanceAdapter, queries: list[int], runs: int, warmup: int
+) -> dict[int, tuple[float, str]]:
+    timings = {}
+    for idx in queries:
+        ms, result = median_query_ms(adapter, QUERIES[idx], runs, warmup)
+        timings[idx] = (ms, digest_table(result).digest)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare dictionary-encoded and plain string columns in lance-graph."
+    )
+    parser.add_argument(
+        "--queries", "-q", default=DEFAULT_QUERIES, help="Comma-separated query numbers"
+    )
+    parser.add_argument("--runs", "-n", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--location", default=None, help="Graph root other than the benchmark one")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output JSON path (default: results/dictionary/<system>.json)",
+    )
+    args = parser.parse_args()
+    queries = parse_selection(args.queries)
+    options: dict[str, Any] = {"graph_root": args.location} if args.location else {}
+
+    adapter = LanceAdapter(**options)
+    system = adapter.system_name()
+    adapter.open()
+    try:
+        columns = encoded_columns(adapter.datasets, args.runs)
+        encoded = time_queries(adapter, queries, args.runs, args.warmup)
+    finally:
+        adapter.close()
+    if not columns:
+        raise SystemExit(
+            "No dictionary-encoded columns; rebuild with `uv run build_graph.py` in lance_graph/"
+        )
+    adapter = LanceAdapter(dictionary_strings=False, **options)
+    adapter.open()
+    try:
+        plain = time_queries(adapter, queries, args.runs, args.warmup)
+    finally:
+        adapter.close()
+
+    print(f"| Column | {system} plain (MB) | encoded (MB) | plain filter (ms) | encoded (ms) |")
+    print("| --- | --- | --- | --- | --- |")
+    for name, row in columns.items():
+        print(
+            f"| {name} | {row['plain_bytes'] / 2**20:.1f} | {row['encoded_bytes'] / 2**20:.1f} "
+            f"| {row['plain_filter_ms']:.2f} | {row['encoded_filter_ms']:.2f} |"
+        )
+    plain_bytes = sum(row["plain_bytes"] for row in columns.values())
+    encoded_bytes = sum(row["encoded_bytes"] for row in columns.values())
+    print(f"\nEncoded columns: {plain_bytes / 2**20:.1f} MB plain, {encoded_bytes / 2**20:.1f} MB")
+
+    report: dict[str, dict[str, Any]] = {}
+    print(f"\n| Query | {system} plain (ms) | encoded (ms) | same |")
+    print("| --- | --- | --- | --- |")
+    for idx in queries:
+        (plain_ms, plain_digest), (encoded_ms, encoded_digest) = plain[idx], encoded[idx]
+        same = plain_digest == encoded_digest
+        report[f"q{idx}"] = {"plain_ms": plain_ms, "encoded_ms": encoded_ms, "same_result": same}
+        print(f"| q{idx} | {plain_ms:.1f} | {encoded_ms:.1f} | {'yes' if same else 'NO'} |")
+
+    output = args.output or DICTIONARY_DIR / f"{system}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "system": system,
+                "plain_bytes": plain_bytes,
+                "encoded_bytes": encoded_bytes,
+                "columns": columns,
+                "queries": report,
+            },
+            indent=2,
+        )
+    )
+    print(f"\nWrote dictionary encoding report to {output}")
+
+
+if __name__ == "__main__":
+    main()
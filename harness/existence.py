@@ -0,0 +1,114 @@
+"""
+Existence mode for the yes/no queries (q21-q30): each is run as written, which
+counts every match with `COUNT(DISTINCT ...) > 0`, and in its existence form
+from `catalog.existence_spec()`, which returns the first match with `LIMIT 1`
+and answers True when it returns a row. The two are timed side by side on
+every engine, and must give the same answer.
+
+    uv run python -m harness.existence --engines kuzu,ladybug,lance,neo4j --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+
+from harness.adapters import ENGINES, REPO_ROOT, EngineAdapter, get_adapter, parse_engines
+from harness.catalog import QUERIES, existence_spec, parse_selection
+from harness.stats import median_query_ms
+
+EXISTENCE_DIR = REPO_ROOT / "results" / "existence"
+YES_NO_QUERIES = [idx for idx, spec in QUERIES.items() if spec.bool_column is not None]
+
+
+def answer(table: pa.Table, column: str, existence: bool) -> bool:
+    if existence:
+        return table.num_rows > 0
+    return table.num_rows > 0 and bool(table.column(column)[0].as_py())
+
+
+def compare(
+    adapter: EngineAdapter, queries: list[int], runs: int, warmup: int
+) -> dict[str, dict[str, Any]]:
+    report: dict[str, dict[str, Any]] = {}
+    for idx in queries:
+        spec = QUERIES[idx]
+        column = spec.bool_column
+        count_ms, counted = median_query_ms(adapter, spec, runs, warmup)
+        exists_ms, found = median_query_ms(adapter, existence_spec(spec), runs, warmup)
+        expected = answer(counted, column, existence=False)
+        report[f"q{idx}"] = {
+            "count_ms": count_ms,
+            "exists_ms": exists_ms,
+            "answer": expected,
+            "same_answer": expected == answer(found, column, existence=True),
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time the yes/no queries as counts and as LIMIT 1 existence checks."
+    )
+    parser.add_argument(
+        "--engines",
+        "-e",
+        default=",".join(ENGINES),
+        help=f"Comma-separated engines (default: {','.join(ENGINES)})",
+    )
+    parser.add_argument(
+        "--queries", "-q", default=None, help="Comma-separated yes/no queries (default: q21-q30)"
+    )
+    parser.add_argument("--runs", "-n", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=EXISTENCE_DIR,
+        help="Directory for the per-engine JSON (default: results/existence)",
+    )
+    args = parser.parse_args()
+
+    engines = parse_engines(args.engines)
+    queries = YES_NO_QUERIES if args.queries is None else parse_selection(args.queries)
+    not_yes_no = [idx for idx in queries if idx not in YES_NO_QUERIES]
+    if not_yes_no:
+        raise SystemExit(f"Not yes/no queries: {not_yes_no}. Expected some of {YES_NO_QUERIES}")
+
+    mismatched = 0
+    for engine in engines:
+        adapter = get_adapter(engine)
+        system = adapter.system_name()
+        adapter.open()
+        try:
+            report = compare(adapter, queries, args.runs, args.warmup)
+        finally:
+            adapter.close()
+
+        print(f"\n| Query | {system} count (ms) | exists (ms) | speedup | answer | same |")
+        print("| --- | --- | --- | --- | --- | --- |")
+        for name, row in report.items():
+            speedup = row["count_ms"] / row["exists_ms"]
+            print(
+                f"| {name} | {row['count_ms']:.1f} | {row['exists_ms']:.1f} | {speedup:.1f}x "
+                f"| {row['answer']} | {'yes' if row['same_answer'] else 'NO'} |"
+            )
+        mismatched += sum(not row["same_answer"] for row in report.values())
+
+        output = args.output_dir / f"{system}.json"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps({"system": system, "queries": report}, indent=2))
+        print(f"Wrote existence timings to {output}")
+
+    if mismatched:
+        print(f"\n{mismatched} existence check(s) disagree with the count form.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Literal-to-id resolution for the small dimension tables.
+
+Most queries start from a name filter on a small table: Place, Tag, Tagclass
+or Organisation by name, or Person by first and last name. `IdLookup` reads
+those tables from the engine once, into in-memory dictionaries from name to
+ids, and `resolve()` rewrites `WHERE t.name = $tag_name`-style predicates in a
+query into id equality, e.g. `t.ID = 1234`. The engine can then start its
+traversal from an id lookup instead of a string scan. A name can belong to
+several rows (`(t.ID = 1 OR t.ID = 2)`), and a name that matches no row becomes
+an id that can't match, so the result is unchanged.
+
+Patterns with property maps (`(:Tagclass {name: $tagclass_name})`) are left as
+written. A resolved query is tied to the parameter values it was resolved for.
+
+    uv run python -m harness.id_lookup --engines kuzu,ladybug,lance,neo4j
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import ENGINES, REPO_ROOT, EngineAdapter, get_adapter, parse_engines
+from harness.catalog import DIALECTS, QUERIES, QuerySpec, parse_selection
+from harness.stats import median_query_ms
+from harness.verify import digest_table
+
+ID_LOOKUP_DIR = REPO_ROOT / "results" / "id_lookup"
+
+# LDBC ids are non-negative, so this matches no row.
+NO_MATCH_ID = -1
+
+LABELED_VAR_RE = re.compile(r"\(\s*(\w+)\s*:\s*(\w+)")
+NAME_FILTER_RE = re.compile(r"\b(\w+)\.(name)\s*=\s*\$(\w+)", re.IGNORECASE)
+FULL_NAME_FILTER_RE = re.compile(
+    r"\b(\w+)\.(firstName)\s*=\s*\$(\w+)\s+AND\s+\1\.(lastName)\s*=\s*\$(\w+)", re.IGNORECASE
+)
+
+
+@dataclass(frozen=True)
+class Dimension:
+    label: str
+    # Key properties, as written in the Kuzu/Neo4j dialect.
+    keys: tuple[str, ...]
+
+
+DIMENSIONS: dict[str, Dimension] = {
+    dimension.label: dimension
+    for dimension in (
+        Dimension("Place", ("name",)),
+        Dimension("Tag", ("name",)),
+        Dimension("Tagclass", ("name",)),
+        Dimension("Organisation", ("name",)),
+        Dimension("Person", ("firstName", "lastName")),
+    )
+}
+
+
+def dimension_spec(dimension: Dimension) -> QuerySpec:
+    columns = ", ".join(f"n.{key} AS k{i}" for i, key in enumerate(dimension.keys))
+    return QuerySpec(
+        0,
+        f"Ids of every {dimension.label} by {', '.join(dimension.keys)}.",
+        f"MATCH (n:{dimension.label}) RETURN {columns}, n.ID AS id;",
+    )
+
+
+class IdLookup:
+    def __init__(self) -> None:
+        self.ids: dict[str, dict[tuple[Any, ...], tuple[int, ...]]] = {}
+
+    def load(self, adapter: EngineAdapter) -> None:
+        for label, dimension in DIMENSIONS.items():
+            table = adapter.execute(adapter.prepare(dimension_spec(dimension)))
+            keys = [table.column(i).to_pylist() for i in range(len(dimension.keys))]
+            index: dict[tuple[Any, ...], list[int]] = defaultdict(list)
+            for row, id_ in enumerate(table.column(table.num_columns - 1).to_pylist()):
+                index[tuple(column[row] for column in keys)].append(id_)
+            self.ids[label] = {key: tuple(ids) for key, ids in index.items()}
+
+    def lookup(self, label: str, key: tuple[Any, ...]) -> tuple[int, ...]:
+        return self.ids[label].get(key, (NO_MATCH_ID,))
+
+    def _rewrite(self, text: str, params: dict[str, Any], id_property: str) -> str:
+        labels = dict(LABELED_VAR_RE.findall(text))
+
+        def _ids_predicate(var: str, ids: tuple[int, ...]) -> str:
+            terms = [f"{var}.{id_property} = {id_}" for id_ in ids]
+            return terms[0] if len(terms) == 1 else f"({' OR '.join(terms)})"
+
+        def _full_name(match: re.Match[str]) -> str:
+            var, _, first, _, last = match.groups()
+            if labels.get(var) != "Person" or first not in params or last not in params:
+                return match.group(0)
+            return _ids_predicate(var, self.lookup("Person", (params[first], params[last])))
+
+        def _name(match: re.Match[str]) -> str:
+            var, _, param = match.groups()
+            label = labels.get(var)
+            dimension = DIMENSIONS.get(label or "")
+            if dimension is None or dimension.keys != ("name",) or param not in params:
+                return match.group(0)
+            return _ids_predicate(var, self.lookup(label, (params[param],)))
+
+        text = FULL_NAME_FILTER_RE.sub(_full_name, text)
+        return NAME_FILTER_RE.sub(_name, text)
+
+    def resolve(self, spec: QuerySpec, params: dict[str, Any] | None = None) -> QuerySpec:
+        """The query with its dimension-name filters replaced by id filters."""
+        values = {**spec.params, **(params or {})}
+        overrides = {
+            dialect: self._rewrite(
+                text, values, "id" if DIALECTS[dialect].lowercase_properties else "ID"
+            )
+            for dialect, text in spec.overrides.items()
+        }
+        cypher = self._rewrite(spec.cypher, values, "ID")
+        return replace(spec, cypher=cypher, params=values, overrides=overrides)
+
+
+def compare(
+    adapter: EngineAdapter, lookup: IdLookup, queries: list[int], runs: int, warmup: int
+) -> dict[str, dict[str, Any]]:
+    report: dict[str, dict[str, Any]] = {}
+    for idx in queries:
+        spec = QUERIES[idx]
+        resolved = lookup.resolve(spec)
+        if resolved.cypher == spec.cypher and resolved.overrides == spec.overrides:
+            continue
+        by_name_ms, by_name = median_query_ms(adapter, spec, runs, warmup)
+        by_id_ms, by_id = median_query_ms(adapter, resolved, runs, warmup)
+        report[f"q{idx}"] = {
+            "by_name_ms": by_name_ms,
+            "by_id_ms": by_id_ms,
+            "same_result": digest_table(by_name).digest == digest_table(by_id).digest,
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time queries with dimension names resolved to ids up front."
+    )
+    parser.add_argument(
+        "--engines",
+        "-e",
+        default=",".join(ENGINES),
+        help=f"Comma-separated engines (default: {','.join(ENGINES)})",
+    )
+    parser.add_argument("--queries", "-q", default=None, help="Comma-separated query numbers")
+    parser.add_argument("--runs", "-n", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=ID_LOOKUP_DIR,
+        help="Directory for the per-engine JSON (default: results/id_lookup)",
+    )
+    args = parser.parse_args()
+
+    engines = parse_engines(args.engines)
+    queries = parse_selection(args.queries)
+
+    mismatched = 0
+    for engine in engines:
+        adapter = get_adapter(engine)
+        system = adapter.system_name()
+        lookup = IdLookup()
+        adapter.open()
+        try:
+            start = time.perf_counter()
+            lookup.load(adapter)
+            load_ms = (time.perf_counter() - start) * 1000
+            report = compare(adapter, lookup, queries, args.runs, args.warmup)
+        finally:
+            adapter.close()
+
+        entries = sum(len(index) for index in lookup.ids.values())
+        print(f"\n{system}: loaded {entries} names in {load_ms:.0f} ms")
+        print(f"| Query | {system} by name (ms) | by id (ms) | speedup | same result |")
+        print("| --- | --- | --- | --- | --- |")
+        for name, row in report.items():
+            speedup = row["by_name_ms"] / row["by_id_ms"]
+            print(
+                f"| {name} | {row['by_name_ms']:.1f} | {row['by_id_ms']:.1f} | {speedup:.1f}x "
+                f"| {'yes' if row['same_result'] else 'NO'} |"
+            )
+        mismatched += sum(not row["same_result"] for row in report.values())
+
+        output = args.output_dir / f"{system}.json"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(
+            json.dumps(
+                {"system": system, "load_ms": load_ms, "names": entries, "queries": report},
+                indent=2,
+            )
+        )
+        print(f"Wrote id lookup timings to {output}")
+
+    if mismatched:
+        print(f"\n{mismatched} resolved queries differ from the original.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Statistics computed once at ingest, so counts don't have to be recomputed from
+raw edges at query time.
+
+- `stats/cardinality.json`: per node table, the row count and the number of
+  distinct values of each column; per relationship table, the row count, the
+  number of distinct sources and targets, and the mean and max out- and
+  in-degree. `count_nodes_and_rels.py` answers from it instead of scanning, and
+  `harness.planner` reads selectivities from it.
+- `stats/degrees/<Label>.csv`: per node, `out_<relType>` and `in_<relType>`
+  degree columns for every relationship type touching the label. The build
+  scripts add them as node properties with `--stats`, so e.g. the number of
+  employees of an organisation is `o.in_workAt`.
+
+Both describe the graph as built. The insert workloads don't maintain them, so
+the copy a build keeps next to the database (`<db>.stats.json`, or
+`graph_lance/_stats.json`) is only trusted while it is newer than the
+database's last write; see `current_cardinality`.
+
+    uv run python -m harness.ingest_stats
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from harness.ldbc import CSV_ROOT, DELIMITER, EDGE_FILES, NODE_FILES
+
+STATS_DIR = "stats"
+CARDINALITY_FILE = "cardinality.json"
+
+
+def _ids(path: Path) -> pl.Series:
+    frame = pl.read_csv(path, separator=DELIMITER, columns=[0])
+    return frame.to_series().rename("id")
+
+
+def _distinct_values(path: Path) -> dict[str, int]:
+    """Distinct values per column, keyed by the lowercased column name."""
+    frame = pl.read_csv(path, separator=DELIMITER, infer_schema_length=0)
+    counts = frame.select(pl.all().n_unique()).row(0)
+    return {name.lower(): count for name, count in zip(frame.columns, counts)}
+
+
+def _endpoints(path: Path) -> pl.DataFrame:
+    frame = pl.read_csv(path, separator=DELIMITER, columns=[0, 1])
+    return frame.rename({frame.columns[0]: "src", frame.columns[1]: "dst"})
+
+
+def compute_stats(csv_root: Path) -> tuple[dict[str, dict[str, Any]], dict[str, pl.DataFrame]]:
+    """Cardinality metadata per table, and degree columns per node label."""
+    tables: dict[str, dict[str, Any]] = {}
+    degrees: dict[str, pl.DataFrame] = {}
+    for node in NODE_FILES.values():
+        ids = _ids(csv_root / node.path)
+        tables[node.label] = {
+            "kind": "node",
+            "count": ids.len(),
+            "distinct": _distinct_values(csv_root / node.path),
+        }
+        degrees[node.label] = ids.to_frame()
+
+    for edge in EDGE_FILES.values():
+        frame = _endpoints(csv_root / edge.path)
+        out_name, in_name = f"out_{edge.rel_type}", f"in_{edge.rel_type}"
+        out_degree = frame.group_by("src").len(name=out_name).rename({"src": "id"})
+        in_degree = frame.group_by("dst").len(name=in_name).rename({"dst": "id"})
+        tables[edge.rel_type] = {
+            "kind": "rel",
+            "src": edge.src_label,
+            "dst": edge.dst_label,
+            "count": frame.height,
+            "distinct_src": out_degree.height,
+            "distinct_dst": in_degree.height,
+            "avg_out_degree": frame.height / out_degree.height if out_degree.height else 0.0,
+            "max_out_degree": int(out_degree[out_name].max() or 0),
+            "avg_in_degree": frame.height / in_degree.height if in_degree.height else 0.0,
+            "max_in_degree": int(in_degree[in_name].max() or 0),
+        }
+        degrees[edge.src_label] = degrees[edge.src_label].join(out_degree, on="id", how="left")
+        degrees[edge.dst_label] = degrees[edge.dst_label].join(in_degree, on="id", how="left")
+
+    for label, frame in degrees.items():
+        degree_columns = [name for name in frame.columns if name != "id"]
+        degrees[label] = frame.with_columns(
+            pl.col(degree_columns).fill_null(0).cast(pl.Int64)
+        )
+    return tables, degrees
+
+
+def write_stats(csv_root: Path) -> Path:
+    tables, degrees = compute_stats(csv_root)
+    output = csv_root / STATS_DIR
+    (output / "degrees").mkdir(parents=True, exist_ok=True)
+    (output / CARDINALITY_FILE).write_text(json.dumps(tables, indent=2))
+    for label, frame in degrees.items():
+        frame.write_csv(output / "degrees" / f"{label}.csv", separator=DELIMITER)
+    return output
+
+
+def load_cardinality(path: Path) -> dict[str, dict[str, Any]]:
+    return json.loads(path.read_text())
+
+
+def database_mtime(database: Path) -> float:
+    """
+    Time of the last write to an embedded database file (or its WAL), or to any
+    dataset of a Lance graph root, where each commit adds a manifest to `_versions`.
+    """
+    if database.is_dir():
+        paths = [*database.glob("*.lance/_versions")] or [database]
+    else:
+        paths = [database, database.with_name(f"{database.name}.wal")]
+    return max(path.stat().st_mtime for path in paths if path.exists())
+
+
+def current_cardinality(sidecar: Path, database: Path) -> dict[str, dict[str, Any]] | None:
+    """
+    The cardinalities a `--stats` build kept in `sidecar`, or None when there
+    are none or the database was written after them (an insert, or a rebuild
+    that didn't replace them), since they would describe another graph.
+    """
+    if not sidecar.exists() or not database.exists():
+        return None
+    if sidecar.stat().st_mtime < database_mtime(database):
+        return None
+    return load_cardinality(sidecar)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compute table cardinalities and per-node degree columns from the CSVs."
+    )
+    parser.add_argument("--csv-root", type=Path, default=CSV_ROOT)
+    args = parser.parse_args()
+
+    output = write_stats(args.csv_root)
+    tables = load_cardinality(output / CARDINALITY_FILE)
+    width = max(len(name) for name in tables)
+    for name, table in tables.items():
+        line = f"{name:<{width}}  {table['count']:>10}"
+        if table["kind"] == "rel":
+            line += f"  max out {table['max_out_degree']:>6}  max in {table['max_in_degree']:>6}"
+        print(line)
+    print(f"\nWrote statistics to {output}")
+
+
+if __name__ == "__main__":
+    main()
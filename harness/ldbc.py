@@ -0,0 +1,93 @@
+"""
+Layout of the LDBC SNB CSV dataset downloaded by `download_dataset.py`.
+
+Paths are relative to a CSV root (`csv/` by default), so the same layout
+describes the full dataset and any snapshot cut from it. Every file is
+`|`-delimited with a header row; node files start with an `id` column and edge
+files with the ids of their two endpoints, e.g. `Person.id|Tag.id`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from harness.adapters import REPO_ROOT
+
+CSV_ROOT = REPO_ROOT / "csv"
+DELIMITER = "|"
+
+
+@dataclass(frozen=True)
+class NodeFile:
+    label: str
+    path: Path
+    # Column holding the creation time; static nodes have none.
+    timestamp: str | None = None
+
+
+@dataclass(frozen=True)
+class EdgeFile:
+    rel_type: str
+    path: Path
+    src_label: str
+    dst_label: str
+    # Column holding the edge's own creation time, if it has one.
+    timestamp: str | None = None
+
+
+NODE_FILES: dict[str, NodeFile] = {
+    node.label: node
+    for node in (
+        NodeFile("Comment", Path("dynamic/comment_0_0.csv"), "creationDate"),
+        NodeFile("Forum", Path("dynamic/forum_0_0.csv"), "creationDate"),
+        NodeFile("Person", Path("dynamic/person_0_0.csv"), "creationDate"),
+        NodeFile("Post", Path("dynamic/post_0_0.csv"), "creationDate"),
+        NodeFile("Organisation", Path("static/organisation_0_0.csv")),
+        NodeFile("Place", Path("static/place_0_0.csv")),
+        NodeFile("Tag", Path("static/tag_0_0.csv")),
+        NodeFile("Tagclass", Path("static/tagclass_0_0.csv")),
+    )
+}
+
+EDGE_FILES: dict[str, EdgeFile] = {
+    edge.rel_type: edge
+    for edge in (
+        EdgeFile("containerOf", Path("dynamic/forum_containerOf_post_0_0.csv"), "Forum", "Post"),
+        EdgeFile("commentHasCreator", Path("dynamic/comment_hasCreator_person_0_0.csv"), "Comment", "Person"),
+        EdgeFile("postHasCreator", Path("dynamic/post_hasCreator_person_0_0.csv"), "Post", "Person"),
+        EdgeFile("hasInterest", Path("dynamic/person_hasInterest_tag_0_0.csv"), "Person", "Tag"),
+        EdgeFile("hasMember", Path("dynamic/forum_hasMember_person_0_0.csv"), "Forum", "Person", "joinDate"),
+        EdgeFile("hasModerator", Path("dynamic/forum_hasModerator_person_0_0.csv"), "Forum", "Person"),
+        EdgeFile("commentHasTag", Path("dynamic/comment_hasTag_tag_0_0.csv"), "Comment", "Tag"),
+        EdgeFile("forumHasTag", Path("dynamic/forum_hasTag_tag_0_0.csv"), "Forum", "Tag"),
+        EdgeFile("postHasTag", Path("dynamic/post_hasTag_tag_0_0.csv"), "Post", "Tag"),
+        EdgeFile("hasType", Path("static/tag_hasType_tagclass_0_0.csv"), "Tag", "Tagclass"),
+        EdgeFile("commentIsLocatedIn", Path("dynamic/comment_isLocatedIn_place_0_0.csv"), "Comment", "Place"),
+        EdgeFile("organisationIsLocatedIn", Path("static/organisation_isLocatedIn_place_0_0.csv"), "Organisation", "Place"),
+        EdgeFile("personIsLocatedIn", Path("dynamic/person_isLocatedIn_place_0_0.csv"), "Person", "Place"),
+        EdgeFile("postIsLocatedIn", Path("dynamic/post_isLocatedIn_place_0_0.csv"), "Post", "Place"),
+        EdgeFile("isPartOf", Path("static/place_isPartOf_place_0_0.csv"), "Place", "Place"),
+        EdgeFile("isSubclassOf", Path("static/tagclass_isSubclassOf_tagclass_0_0.csv"), "Tagclass", "Tagclass"),
+        EdgeFile("knows", Path("dynamic/person_knows_person_0_0.csv"), "Person", "Person", "creationDate"),
+        EdgeFile("likeComment", Path("dynamic/person_likes_comment_0_0.csv"), "Person", "Comment", "creationDate"),
+        EdgeFile("likePost", Path("dynamic/person_likes_post_0_0.csv"), "Person", "Post", "creationDate"),
+        EdgeFile("replyOfComment", Path("dynamic/comment_replyOf_comment_0_0.csv"), "Comment", "Comment"),
+        EdgeFile("replyOfPost", Path("dynamic/comment_replyOf_post_0_0.csv"), "Comment", "Post"),
+        EdgeFile("studyAt", Path("dynamic/person_studyAt_organisation_0_0.csv"), "Person", "Organisation"),
+        EdgeFile("workAt", Path("dynamic/person_workAt_organisation_0_0.csv"), "Person", "Organisation"),
+    )
+}
+
+# Date and time columns per table, as written in the CSVs ("2010-02-14T15:32:10.447+0000"
+# for timestamps, "1989-12-03" for dates). Every engine stores them as native temporal types.
+TEMPORAL_COLUMNS: dict[str, dict[str, str]] = {
+    "Comment": {"creationDate": "timestamp"},
+    "Forum": {"creationDate": "timestamp"},
+    "Person": {"birthday": "date", "creationDate": "timestamp"},
+    "Post": {"creationDate": "timestamp"},
+    "hasMember": {"joinDate": "timestamp"},
+    "knows": {"creationDate": "timestamp"},
+    "likeComment": {"creationDate": "timestamp"},
+    "likePost": {"creationDate": "timestamp"},
+}
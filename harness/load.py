@@ -0,0 +1,187 @@
+"""
+Open-loop load generator: latency against offered load, per engine.
+
+pytest-benchmark issues the next query as soon as the last one returns, so a
+slow query delays the ones behind it without their latency showing it
+(coordinated omission). Here queries arrive as a Poisson process at a fixed
+rate, picked at random from the selected mix, and are served by `--clients`
+connections. Latency is measured from the scheduled send time, so time spent
+waiting for a free connection counts.
+
+The rate starts at `--start-rate` and grows by `--factor` per step until the
+engine saturates: it completes less than 90% of the offered load, or the p99
+exceeds `--max-p99-ms`. The knee is the highest offered rate that is not
+saturated and whose p99 is at most `KNEE_SLOWDOWN` times the p99 of the first
+step. Each engine's curve is written to `results/load/<system>.json`;
+`results/plot_load_curves.py` draws them on one chart.
+
+    uv run python -m harness.load --engines kuzu,ladybug,lance,neo4j --queries 1,2,9,21
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import ENGINES, REPO_ROOT, EngineAdapter, get_adapter, parse_engines
+from harness.catalog import parse_selection
+from harness.mixed import Workload, run_open
+from harness.stats import latency_summary
+
+LOAD_DIR = REPO_ROOT / "results" / "load"
+# A step is saturated when it completes less than this share of the offered load.
+SATURATION = 0.9
+KNEE_SLOWDOWN = 2.0
+
+
+def run_step(
+    adapter: EngineAdapter,
+    queries: list[int],
+    rate: float,
+    clients: int,
+    duration_s: float,
+    seed: int,
+) -> dict[str, Any]:
+    workload = Workload(adapter, queries, None, 0.0)
+    recorder, elapsed = run_open(workload, clients, duration_s, rate, seed)
+    return {
+        "offered_per_s": rate,
+        "achieved_per_s": len(recorder.reads) / elapsed,
+        **latency_summary(recorder.reads),
+        "errors": len(recorder.errors),
+    }
+
+
+def is_saturated(step: dict[str, Any], max_p99_ms: float) -> bool:
+    return (
+        step["achieved_per_s"] < SATURATION * step["offered_per_s"]
+        or step["p99_ms"] > max_p99_ms
+    )
+
+
+def find_knee(steps: list[dict[str, Any]], max_p99_ms: float) -> float | None:
+    if not steps:
+        return None
+    limit = KNEE_SLOWDOWN * steps[0]["p99_ms"]
+    knee = None
+    for step in steps:
+        if is_saturated(step, max_p99_ms) or step["p99_ms"] > limit:
+            break
+        knee = step["offered_per_s"]
+    return knee
+
+
+def sweep(
+    adapter: EngineAdapter,
+    queries: list[int],
+    rates: list[float] | None,
+    start_rate: float,
+    factor: float,
+    max_rate: float,
+    clients: int,
+    duration_s: float,
+    max_p99_ms: float,
+    seed: int,
+) -> list[dict[str, Any]]:
+    steps: list[dict[str, Any]] = []
+    rate = rates[0] if rates else start_rate
+    while rate <= max_rate:
+        step = run_step(adapter, queries, rate, clients, duration_s, seed + len(steps))
+        steps.append(step)
+        print(
+            f"{step['offered_per_s']:.1f}/s offered: {step['achieved_per_s']:.1f}/s done, "
+            f"p50 {step['p50_ms']:.1f}ms, p99 {step['p99_ms']:.1f}ms"
+        )
+        if is_saturated(step, max_p99_ms):
+            break
+        if rates:
+            if len(steps) == len(rates):
+                break
+            rate = rates[len(steps)]
+        else:
+            rate *= factor
+    return steps
+
+
+def _parse_rates(text: str | None) -> list[float] | None:
+    if not text:
+        return None
+    return sorted(float(part) for part in text.split(",") if part.strip())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Sweep open-loop arrival rates to get latency-vs-throughput curves."
+    )
+    parser.add_argument(
+        "--engines",
+        default=",".join(ENGINES),
+        help=f"Comma-separated engines (default: {','.join(ENGINES)})",
+    )
+    parser.add_argument(
+        "--queries", "-q", default=None, help="Comma-separated query numbers (default: all)"
+    )
+    parser.add_argument("--clients", "-c", type=int, default=8, help="Concurrent connections")
+    parser.add_argument("--duration", "-d", type=float, default=30, help="Seconds per rate")
+    parser.add_argument("--start-rate", type=float, default=10, help="First rate, queries/s")
+    parser.add_argument("--factor", type=float, default=1.5, help="Rate multiplier per step")
+    parser.add_argument("--max-rate", type=float, default=100_000)
+    parser.add_argument(
+        "--rates", default=None, help="Explicit comma-separated rates instead of the sweep"
+    )
+    parser.add_argument(
+        "--max-p99-ms", type=float, default=1000, help="p99 beyond which a step is saturated"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output-dir", type=Path, default=LOAD_DIR, help="Directory for <system>.json curves"
+    )
+    args = parser.parse_args()
+
+    engines = parse_engines(args.engines)
+    queries = parse_selection(args.queries)
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    knees: dict[str, float | None] = {}
+    for engine in engines:
+        adapter = get_adapter(engine)
+        system = adapter.system_name()
+        print(f"== {system} ==")
+        adapter.open()
+        try:
+            steps = sweep(
+                adapter,
+                queries,
+                _parse_rates(args.rates),
+                args.start_rate,
+                args.factor,
+                args.max_rate,
+                args.clients,
+                args.duration,
+                args.max_p99_ms,
+                args.seed,
+            )
+        finally:
+            adapter.close()
+        knees[system] = find_knee(steps, args.max_p99_ms)
+        payload = {
+            "system": system,
+            "queries": queries,
+            "clients": args.clients,
+            "duration_s": args.duration,
+            "knee_per_s": knees[system],
+            "steps": steps,
+        }
+        output = args.output_dir / f"{system}.json"
+        output.write_text(json.dumps(payload, indent=2))
+        print(f"Wrote the curve to {output}\n")
+
+    print("| System | Knee (queries/s) |")
+    print("| --- | --- |")
+    for system, knee in knees.items():
+        print(f"| {system} | {'-' if knee is None else f'{knee:.1f}'} |")
+
+
+if __name__ == "__main__":
+    main()
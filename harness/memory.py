@@ -0,0 +1,125 @@
+"""
+Memory instrumentation mode: per-query memory readings for one engine.
+
+For every query, after one untimed warmup execution, the harness records:
+
+- `peak_rss_delta_bytes`: peak RSS during the query minus RSS before it. The
+  peak is reset before each query on Linux; elsewhere it is the process-wide
+  high-water mark, so only queries that push it higher register a delta.
+- `python_peak_bytes`: peak Python-level allocations seen by `tracemalloc`
+  (result conversion, row dicts, etc.; native engine memory is not included).
+- `arrow_bytes`: growth of `pa.total_allocated_bytes()` across the query while
+  the result is still alive, i.e. Arrow memory held by the result.
+
+Each reading is the maximum over `--runs` executions. Neo4j executes queries in
+the server process, so its readings only cover the client side. For
+`lance-sharded` the RSS of each worker process once its shard is loaded, and
+the private part of it, is saved as `workers`.
+
+The readings are written to `results/memory/<system>.json`, which
+`results/compare.py --memory` picks up as extra columns.
+
+    uv run python -m harness.memory --engine lance --runs 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+
+from harness.adapters import ADAPTERS, REPO_ROOT, EngineAdapter, PreparedQuery, get_adapter
+from harness.catalog import QUERIES, parse_selection
+from harness.system import current_rss_bytes, peak_rss_bytes, reset_peak_rss
+
+MEMORY_DIR = REPO_ROOT / "results" / "memory"
+
+
+def measure_query(adapter: EngineAdapter, prepared: PreparedQuery) -> dict[str, int]:
+    gc.collect()
+    reset_peak_rss()
+    rss_before = current_rss_bytes()
+    arrow_before = pa.total_allocated_bytes()
+    tracemalloc.reset_peak()
+    result = adapter.execute(prepared)
+    _, python_peak = tracemalloc.get_traced_memory()
+    arrow_after = pa.total_allocated_bytes()
+    rss_peak = peak_rss_bytes()
+    del result
+    return {
+        "peak_rss_delta_bytes": max(rss_peak - rss_before, 0),
+        "python_peak_bytes": python_peak,
+        "arrow_bytes": max(arrow_after - arrow_before, 0),
+    }
+
+
+def profile_engine(
+    adapter: EngineAdapter, queries: list[int], runs: int
+) -> dict[str, dict[str, int]]:
+    readings: dict[str, dict[str, int]] = {}
+    tracemalloc.start()
+    try:
+        for idx in queries:
+            prepared = adapter.prepare(QUERIES[idx])
+            adapter.execute(prepared)
+            samples = [measure_query(adapter, prepared) for _ in range(runs)]
+            reading = {key: max(sample[key] for sample in samples) for key in samples[0]}
+            # Same key as the pytest-benchmark tables so compare.py can join on it.
+            readings[prepared.spec.test_name] = reading
+            print(
+                f"q{idx}: rss +{reading['peak_rss_delta_bytes'] / 2**20:.1f}MB, "
+                f"python {reading['python_peak_bytes'] / 2**20:.1f}MB, "
+                f"arrow {reading['arrow_bytes'] / 2**20:.1f}MB"
+            )
+    finally:
+        tracemalloc.stop()
+    return readings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record per-query memory usage for an engine.")
+    parser.add_argument("--engine", "-e", required=True, choices=sorted(ADAPTERS))
+    parser.add_argument(
+        "--queries", "-q", default=None, help="Comma-separated query numbers (default: all)"
+    )
+    parser.add_argument("--runs", "-n", type=int, default=3, help="Executions per query")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output JSON path (default: results/memory/<system>.json)",
+    )
+    args = parser.parse_args()
+
+    adapter = get_adapter(args.engine)
+    system = adapter.system_name()
+    adapter.open()
+    try:
+        readings = profile_engine(adapter, parse_selection(args.queries), args.runs)
+        workers = getattr(adapter, "worker_memory", None)
+    finally:
+        adapter.close()
+
+    output = args.output or MEMORY_DIR / f"{system}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    payload: dict[str, Any] = {"system": system, "queries": readings}
+    if workers:
+        payload["workers"] = workers
+        for i, worker in enumerate(workers):
+            private = worker["private_bytes"]
+            print(
+                f"worker {i}: rss {worker['rss_bytes'] / 2**20:.1f}MB"
+                + (f", private {private / 2**20:.1f}MB" if private is not None else "")
+            )
+    output.write_text(json.dumps(payload, indent=2))
+    print(f"\nWrote memory readings to {output}")
+
+
+if __name__ == "__main__":
+    main()
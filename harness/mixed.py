@@ -0,0 +1,427 @@
+"""
+Mixed read/write workload: the catalog queries interleaved with inserts from
+the update stream written by `harness.updates`, at a configured ratio.
+
+Every operation is a read (one of the selected queries, picked at random) or a
+write (the next batch of the stream, `--write-window-minutes` of event time).
+Writes are applied one at a time, in event-time order, since the embedded
+engines allow a single write transaction.
+
+Two schedules are supported:
+
+- `closed`: each of `--clients` threads issues its next operation as soon as
+  the previous one returns. Latency is the service time.
+- `open`: operations arrive as a Poisson process at `--rate` per second and
+  wait for a free client. Latency is measured from the scheduled arrival, so
+  queueing behind slow operations counts (no coordinated omission).
+
+After each write returns, a separate connection polls for the newest node in
+the batch; the time until it shows up is the visibility lag. Unless
+`--no-baseline` is given, the same schedule is first run read-only, so read
+latency can be compared with and without write pressure. The run meets the SLA
+when the p99 read latency under writes is within `--sla-ms`, and the achieved
+throughput is then reported as the throughput under SLA.
+
+    uv run python -m harness.mixed --engine kuzu \\
+      --location updates/2012-06-01/ldbc_snb_sf1.kuzu --stream updates/2012-06-01/stream \\
+      --mix 95/5 --schedule open --rate 200 --clients 8 --duration 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import queue
+import random
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import ADAPTERS, REPO_ROOT, EngineAdapter, PreparedQuery, get_adapter
+from harness.catalog import QUERIES, QuerySpec, parse_selection
+from harness.stats import latency_summary
+from harness.updates import UpdateBatch, iter_batches
+
+MIXED_DIR = REPO_ROOT / "results" / "mixed"
+WRITE = "write"
+VISIBILITY_TIMEOUT_S = 10.0
+
+
+def lookup_spec(label: str) -> QuerySpec:
+    """Query that finds one node by id, rendered like any catalog query."""
+    return QuerySpec(
+        0,
+        f"Is the {label} with this id visible?",
+        f"MATCH (n:{label}) WHERE n.ID = $id RETURN n.ID AS id;",
+        {"id": 0},
+    )
+
+
+def parse_mix(text: str) -> float:
+    """Write fraction from a `reads/writes` ratio such as `95/5`."""
+    reads, _, writes = text.partition("/")
+    total = float(reads) + float(writes or 0)
+    if total <= 0:
+        raise ValueError(f"Invalid mix: {text}")
+    return float(writes or 0) / total
+
+
+def poisson_arrivals(rate: float, duration_s: float, rng: random.Random) -> Iterator[float]:
+    """Arrival offsets in seconds of a Poisson process with `rate` events per second."""
+    t = rng.expovariate(rate)
+    while t < duration_s:
+        yield t
+        t += rng.expovariate(rate)
+
+
+class WriteStream:
+    """Hands out update batches in event-time order to whichever client asks next."""
+
+    def __init__(self, stream_dir: Path, window: timedelta) -> None:
+        self._batches = iter_batches(stream_dir, window)
+        self._lock = threading.Lock()
+
+    def next(self) -> UpdateBatch | None:
+        with self._lock:
+            return next(self._batches, None)
+
+
+@dataclass
+class Recorder:
+    reads: list[float] = field(default_factory=list)
+    writes: list[float] = field(default_factory=list)
+    visibility: list[float] = field(default_factory=list)
+    inserted_rows: int = 0
+    skipped_writes: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def merge(self, other: Recorder) -> None:
+        self.reads += other.reads
+        self.writes += other.writes
+        self.visibility += other.visibility
+        self.inserted_rows += other.inserted_rows
+        self.skipped_writes += other.skipped_writes
+        self.errors += other.errors
+
+
+class Workload:
+    """The operations of a run, shared by all clients."""
+
+    def __init__(
+        self,
+        adapter: EngineAdapter,
+        queries: list[int],
+        stream: WriteStream | None,
+        write_fraction: float,
+    ) -> None:
+        self.adapter = adapter
+        self.queries = queries
+        self.stream = stream
+        self.write_fraction = write_fraction if stream is not None else 0.0
+        self.write_lock = threading.Lock()
+        self._probe: EngineAdapter | None = None
+        self._probe_lock = threading.Lock()
+
+    def choose(self, rng: random.Random) -> int | str:
+        if rng.random() < self.write_fraction:
+            return WRITE
+        return rng.choice(self.queries)
+
+    def perform(
+        self,
+        client: EngineAdapter,
+        prepared: dict[int, PreparedQuery],
+        op: int | str,
+        recorder: Recorder,
+    ) -> float | None:
+        """
+        Run one operation. Returns when it completed (a `perf_counter()` reading;
+        for a write, the commit, before the visibility probe), or None if it
+        failed or there was nothing left to write.
+        """
+        try:
+            if op == WRITE:
+                return self._write(recorder)
+            client.execute(prepared[op])
+        except Exception as exc:  # noqa: BLE001 - keep the load going, report at the end
+            recorder.errors.append(f"{'insert' if op == WRITE else f'q{op}'}: {exc}")
+            return None
+        return time.perf_counter()
+
+    def _write(self, recorder: Recorder) -> float | None:
+        assert self.stream is not None
+        with self.write_lock:
+            batch = self.stream.next()
+            if batch is None:
+                recorder.skipped_writes += 1
+                return None
+            self.adapter.insert(batch)
+        committed = time.perf_counter()
+        recorder.inserted_rows += batch.num_rows
+        lag_ms = self._visibility_lag(batch, committed)
+        if lag_ms is not None:
+            recorder.visibility.append(lag_ms)
+        return committed
+
+    def _visibility_lag(self, batch: UpdateBatch, committed: float) -> float | None:
+        nodes = batch.ordered_nodes()
+        if not nodes:
+            return None
+        label, table = nodes[-1]
+        with self._probe_lock:
+            if self._probe is None:
+                self._probe = self.adapter.fork()
+            probe = self._probe.prepare(lookup_spec(label), {"id": table.column("id")[-1].as_py()})
+            deadline = committed + VISIBILITY_TIMEOUT_S
+            while time.perf_counter() < deadline:
+                if self._probe.execute(probe).num_rows:
+                    return (time.perf_counter() - committed) * 1000
+        return None
+
+    def close(self) -> None:
+        if self._probe is not None:
+            self._probe.close()
+            self._probe = None
+
+
+def _prepare_all(client: EngineAdapter, queries: list[int]) -> dict[int, PreparedQuery]:
+    return {idx: client.prepare(QUERIES[idx]) for idx in queries}
+
+
+def run_closed(
+    workload: Workload, clients: int, duration_s: float, seed: int
+) -> tuple[Recorder, float]:
+    deadline = time.perf_counter() + duration_s
+    recorders = [Recorder() for _ in range(clients)]
+
+    def _client(i: int) -> None:
+        rng = random.Random(seed + i)
+        adapter = workload.adapter.fork()
+        try:
+            prepared = _prepare_all(adapter, workload.queries)
+            while time.perf_counter() < deadline:
+                op = workload.choose(rng)
+                start = time.perf_counter()
+                end = workload.perform(adapter, prepared, op, recorders[i])
+                if end is not None:
+                    latencies = recorders[i].writes if op == WRITE else recorders[i].reads
+                    latencies.append((end - start) * 1000)
+        finally:
+            adapter.close()
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=_client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    total = Recorder()
+    for recorder in recorders:
+        total.merge(recorder)
+    return total, elapsed
+
+
+def run_open(
+    workload: Workload, clients: int, duration_s: float, rate: float, seed: int
+) -> tuple[Recorder, float]:
+    rng = random.Random(seed)
+    pending: queue.Queue[tuple[float, int | str] | None] = queue.Queue()
+    recorders = [Recorder() for _ in range(clients)]
+    forks = [workload.adapter.fork() for _ in range(clients)]
+    prepared = [_prepare_all(adapter, workload.queries) for adapter in forks]
+
+    def _client(i: int) -> None:
+        while (item := pending.get()) is not None:
+            scheduled, op = item
+            end = workload.perform(forks[i], prepared[i], op, recorders[i])
+            if end is not None:
+                latencies = recorders[i].writes if op == WRITE else recorders[i].reads
+                latencies.append((end - scheduled) * 1000)
+
+    threads = [threading.Thread(target=_client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    try:
+        for offset in poisson_arrivals(rate, duration_s, rng):
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pending.put((start + offset, workload.choose(rng)))
+    finally:
+        for _ in threads:
+            pending.put(None)
+        for thread in threads:
+            thread.join()
+        for adapter in forks:
+            adapter.close()
+    elapsed = time.perf_counter() - start
+    total = Recorder()
+    for recorder in recorders:
+        total.merge(recorder)
+    return total, elapsed
+
+
+def summarize(recorder: Recorder, elapsed_s: float) -> dict[str, Any]:
+    ops = len(recorder.reads) + len(recorder.writes)
+    return {
+        "elapsed_s": elapsed_s,
+        "ops_per_s": ops / elapsed_s,
+        "reads_per_s": len(recorder.reads) / elapsed_s,
+        "writes_per_s": len(recorder.writes) / elapsed_s,
+        "inserted_rows_per_s": recorder.inserted_rows / elapsed_s,
+        "read_latency": latency_summary(recorder.reads),
+        "write_latency": latency_summary(recorder.writes),
+        "visibility_lag": latency_summary(recorder.visibility),
+        "skipped_writes": recorder.skipped_writes,
+        "errors": recorder.errors,
+    }
+
+
+def run_workload(
+    adapter: EngineAdapter,
+    queries: list[int],
+    stream: WriteStream | None,
+    write_fraction: float,
+    schedule: str,
+    clients: int,
+    duration_s: float,
+    rate: float | None,
+    seed: int,
+) -> dict[str, Any]:
+    workload = Workload(adapter, queries, stream, write_fraction)
+    try:
+        if schedule == "open":
+            assert rate is not None
+            recorder, elapsed = run_open(workload, clients, duration_s, rate, seed)
+        else:
+            recorder, elapsed = run_closed(workload, clients, duration_s, seed)
+    finally:
+        workload.close()
+    return summarize(recorder, elapsed)
+
+
+def _row(name: str, summary: dict[str, float]) -> str:
+    return (
+        f"| {name} | {summary['count']} | {summary['p50_ms']:.1f} "
+        f"| {summary['p95_ms']:.1f} | {summary['p99_ms']:.1f} |"
+    )
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    mixed = report["mixed"]
+    print("\n| Operation | Count | p50 (ms) | p95 (ms) | p99 (ms) |")
+    print("| --- | --- | --- | --- | --- |")
+    if report["read_only"] is not None:
+        print(_row("reads, read-only", report["read_only"]["read_latency"]))
+    print(_row(f"reads, {report['mix']}", mixed["read_latency"]))
+    print(_row("writes", mixed["write_latency"]))
+    print(_row("visibility lag", mixed["visibility_lag"]))
+    print(
+        f"\n{mixed['ops_per_s']:.1f} ops/s ({mixed['reads_per_s']:.1f} reads/s, "
+        f"{mixed['writes_per_s']:.1f} writes/s, {mixed['inserted_rows_per_s']:.0f} rows/s)"
+    )
+    verdict = "meets" if report["meets_sla"] else "misses"
+    print(
+        f"p99 read latency {mixed['read_latency']['p99_ms']:.1f}ms {verdict} the "
+        f"{report['sla_ms']:.0f}ms SLA; throughput under SLA: {report['throughput_under_sla']:.1f} ops/s"
+    )
+    if mixed["skipped_writes"]:
+        print(f"The update stream ran out; {mixed['skipped_writes']} writes were skipped.")
+    if mixed["errors"]:
+        print(f"{len(mixed['errors'])} operations failed, first: {mixed['errors'][0]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Run the catalog queries interleaved with inserts at a configured mix."
+    )
+    parser.add_argument("--engine", "-e", required=True, choices=sorted(ADAPTERS))
+    parser.add_argument(
+        "--location",
+        required=True,
+        help="Database built from the snapshot: a path, or a database name for Neo4j",
+    )
+    parser.add_argument(
+        "--stream", type=Path, required=True, help="Stream directory written by harness.updates"
+    )
+    parser.add_argument("--mix", default="95/5", help="Reads/writes ratio, e.g. 95/5 or 80/20")
+    parser.add_argument("--schedule", choices=("closed", "open"), default="closed")
+    parser.add_argument(
+        "--rate", type=float, default=None, help="Target operations per second (open loop)"
+    )
+    parser.add_argument("--clients", "-c", type=int, default=4, help="Concurrent clients")
+    parser.add_argument("--duration", "-d", type=float, default=60, help="Seconds per run")
+    parser.add_argument(
+        "--write-window-minutes", type=float, default=10, help="Event time per write"
+    )
+    parser.add_argument(
+        "--queries", "-q", default=None, help="Comma-separated query numbers (default: all)"
+    )
+    parser.add_argument("--sla-ms", type=float, default=100, help="p99 read latency target")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-baseline", action="store_true", help="Skip the read-only run of the same schedule"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output JSON path (default: results/mixed/<system>-<mix>-<schedule>.json)",
+    )
+    args = parser.parse_args()
+    if args.schedule == "open" and args.rate is None:
+        parser.error("--schedule open needs --rate")
+
+    write_fraction = parse_mix(args.mix)
+    queries = parse_selection(args.queries)
+    adapter = get_adapter(args.engine, args.location)
+    system = adapter.system_name()
+    adapter.open()
+    try:
+        run = {
+            "queries": queries,
+            "schedule": args.schedule,
+            "clients": args.clients,
+            "duration_s": args.duration,
+            "rate": args.rate,
+            "seed": args.seed,
+        }
+        read_only = None
+        if not args.no_baseline:
+            print("Running read-only baseline...")
+            read_only = run_workload(adapter, stream=None, write_fraction=0.0, **run)
+        print(f"Running {args.mix} mix...")
+        stream = WriteStream(args.stream, timedelta(minutes=args.write_window_minutes))
+        mixed = run_workload(adapter, stream=stream, write_fraction=write_fraction, **run)
+    finally:
+        adapter.close()
+
+    meets_sla = mixed["read_latency"]["p99_ms"] <= args.sla_ms
+    report = {
+        "system": system,
+        "mix": args.mix,
+        **run,
+        "sla_ms": args.sla_ms,
+        "read_only": read_only,
+        "mixed": mixed,
+        "meets_sla": meets_sla,
+        "throughput_under_sla": mixed["ops_per_s"] if meets_sla else 0.0,
+    }
+    _print_report(report)
+
+    mix_name = args.mix.replace("/", "-")
+    output = args.output or MIXED_DIR / f"{system}-{mix_name}-{args.schedule}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nWrote mixed workload results to {output}")
+
+
+if __name__ == "__main__":
+    main()
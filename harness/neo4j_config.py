@@ -0,0 +1,215 @@
+"""
+Neo4j runtime and memory sweep.
+
+`neo4j/docker-compose.yml` pins the page cache and heap, and queries run on
+whichever Cypher runtime the server picks. This harness times the suite under
+each runtime given in `--runtimes` (`CYPHER runtime=slotted|pipelined|parallel`)
+and, with `--memory`, under each page cache/heap setting. For each memory setting
+the container is recreated with that environment (the data volume is kept) and
+the harness waits for the server to accept connections. That shows whether the
+q20/q30 outliers move with the runtime or memory, or are the same everywhere.
+Afterwards, even if the sweep fails, the container is recreated once more with
+the environment it was started from, so later runs don't inherit the last setting.
+
+A runtime the server doesn't offer (e.g. `parallel` outside Enterprise) or
+can't use for a query is recorded as an error instead of a latency. The settings
+the server reports are saved with each configuration, so a setting that didn't
+take effect shows up in the output.
+
+    uv run python -m harness.neo4j_config --runtimes slotted,pipelined,parallel \\
+      --memory 2G/4G,4G/8G --queries 20,30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import REPO_ROOT, Neo4jAdapter
+from harness.catalog import QUERIES, parse_selection
+from harness.stats import median_query_ms
+
+NEO4J_CONFIG_DIR = REPO_ROOT / "results" / "neo4j_config"
+COMPOSE_FILE = REPO_ROOT / "neo4j" / "docker-compose.yml"
+
+RUNTIMES = ("slotted", "pipelined", "parallel")
+# Settings read back from the server for each configuration.
+REPORTED_SETTINGS = (
+    "server.memory.pagecache.size",
+    "server.memory.heap.initial_size",
+    "server.memory.heap.max_size",
+)
+
+
+def parse_memory(value: str) -> dict[str, str]:
+    """`PAGECACHE/HEAP`, e.g. `4G/8G`, as the compose environment; the heap is fixed."""
+    pagecache, sep, heap = value.partition("/")
+    if not sep or not pagecache or not heap:
+        raise ValueError(f"Expected PAGECACHE/HEAP, e.g. 4G/8G, got '{value}'")
+    return {
+        "NEO4J_PAGECACHE_SIZE": pagecache,
+        "NEO4J_HEAP_INITIAL_SIZE": heap,
+        "NEO4J_HEAP_MAX_SIZE": heap,
+    }
+
+
+def recreate_server(compose_file: Path, environment: dict[str, str]) -> None:
+    subprocess.run(
+        ["docker", "compose", "-f", str(compose_file), "up", "-d", "--force-recreate"],
+        env={**os.environ, **environment},
+        check=True,
+    )
+
+
+def wait_for_server(timeout_s: float) -> float:
+    """Seconds until the server accepts a session."""
+    start = time.perf_counter()
+    while True:
+        adapter = Neo4jAdapter()
+        try:
+            adapter.open()
+        except Exception:
+            if time.perf_counter() - start >= timeout_s:
+                raise
+            time.sleep(1)
+            continue
+        finally:
+            adapter.close()
+        return time.perf_counter() - start
+
+
+def server_settings(adapter: Neo4jAdapter) -> dict[str, str]:
+    try:
+        result = adapter.session.run(
+            "SHOW SETTINGS YIELD name, value WHERE name IN $names RETURN name, value",
+            names=list(REPORTED_SETTINGS),
+        )
+        return {record["name"]: record["value"] for record in result}
+    except Exception as exc:
+        return {"error": str(exc)}
+
+
+def time_runtime(
+    runtime: str, queries: list[int], runs: int, warmup: int
+) -> dict[str, dict[str, Any]]:
+    adapter = Neo4jAdapter(runtime=runtime)
+    adapter.open()
+    report: dict[str, dict[str, Any]] = {}
+    try:
+        for idx in queries:
+            try:
+                ms, _ = median_query_ms(adapter, QUERIES[idx], runs, warmup)
+            except Exception as exc:
+                report[f"q{idx}"] = {"ms": None, "error": str(exc).splitlines()[0]}
+                continue
+            report[f"q{idx}"] = {"ms": ms}
+    finally:
+        adapter.close()
+    return report
+
+
+def to_markdown(label: str, runtimes: list[str], report: dict[str, dict[str, Any]]) -> str:
+    lines = [
+        f"\n{label}:",
+        "| Query | " + " | ".join(f"{runtime} (ms)" for runtime in runtimes) + " |",
+        "| --- |" + " --- |" * len(runtimes),
+    ]
+    for name in next(iter(report.values()), {}):
+        cells = []
+        for runtime in runtimes:
+            ms = report[runtime][name]["ms"]
+            cells.append("error" if ms is None else f"{ms:.1f}")
+        lines.append(f"| {name} | {' | '.join(cells)} |")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time the suite on Neo4j across Cypher runtimes and memory settings."
+    )
+    parser.add_argument(
+        "--runtimes",
+        default=",".join(RUNTIMES),
+        help=f"Comma-separated Cypher runtimes (default: {','.join(RUNTIMES)})",
+    )
+    parser.add_argument(
+        "--memory",
+        default=None,
+        help="Comma-separated PAGECACHE/HEAP settings, e.g. 2G/4G,4G/8G. Each recreates the "
+        "container; without it the running server is used as configured",
+    )
+    parser.add_argument("--compose-file", type=Path, default=COMPOSE_FILE)
+    parser.add_argument(
+        "--startup-timeout",
+        type=float,
+        default=120.0,
+        help="Seconds to wait for the server after recreating it",
+    )
+    parser.add_argument("--queries", "-q", default=None, help="Comma-separated query numbers")
+    parser.add_argument("--runs", "-n", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output JSON path (default: results/neo4j_config/<system>.json)",
+    )
+    args = parser.parse_args()
+
+    runtimes = [name.strip() for name in args.runtimes.split(",") if name.strip()]
+    unknown = [name for name in runtimes if name not in RUNTIMES]
+    if unknown:
+        raise SystemExit(f"Unknown runtime(s): {unknown}. Expected one of {RUNTIMES}")
+    memory = [value.strip() for value in args.memory.split(",")] if args.memory else [None]
+    try:
+        environments = {setting: parse_memory(setting) for setting in memory if setting}
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    queries = parse_selection(args.queries)
+
+    system = Neo4jAdapter().system_name()
+    configs = []
+    restored: dict[str, float] | None = None
+    try:
+        for setting in memory:
+            entry: dict[str, Any] = {"memory": setting}
+            if setting is not None:
+                recreate_server(args.compose_file, environments[setting])
+                entry["startup_s"] = wait_for_server(args.startup_timeout)
+            adapter = Neo4jAdapter()
+            adapter.open()
+            try:
+                entry["settings"] = server_settings(adapter)
+            finally:
+                adapter.close()
+            entry["runtimes"] = {
+                runtime: time_runtime(runtime, queries, args.runs, args.warmup)
+                for runtime in runtimes
+            }
+            label = f"{system}, page cache/heap {setting}" if setting else f"{system}, as running"
+            print(to_markdown(label, runtimes, entry["runtimes"]))
+            configs.append(entry)
+    finally:
+        if environments:
+            print("\nRecreating the container with the memory settings it was started with")
+            recreate_server(args.compose_file, {})
+            restored = {"startup_s": wait_for_server(args.startup_timeout)}
+
+    report: dict[str, Any] = {"system": system, "configs": configs}
+    if restored is not None:
+        report["restored"] = restored
+
+    output = args.output or NEO4J_CONFIG_DIR / f"{system}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nWrote runtime and memory timings to {output}")
+
+
+if __name__ == "__main__":
+    main()
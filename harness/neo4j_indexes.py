@@ -0,0 +1,135 @@
+"""
+Per-query impact of the Neo4j secondary indexes.
+
+`neo4j/build_graph.py` builds an index plan after loading: RANGE indexes on the
+names the queries filter by, TEXT indexes for the CONTAINS filters, and RANGE
+indexes on relationship dates. This harness times every query with those
+indexes online, drops them, times the queries again on label scans, and then
+recreates the indexes from the statements the server reports and waits for them
+to come back online. Uniqueness-constraint indexes on `ID` and the built-in
+token lookup indexes are left in place.
+
+The timings, the index list, and the time to rebuild the indexes are written to
+`results/neo4j_indexes/<system>.json`.
+
+    uv run python -m harness.neo4j_indexes --queries 1,7,13
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import REPO_ROOT, Neo4jAdapter
+from harness.catalog import QUERIES, parse_selection
+from harness.stats import median_query_ms
+
+NEO4J_INDEXES_DIR = REPO_ROOT / "results" / "neo4j_indexes"
+
+
+def secondary_indexes(adapter: Neo4jAdapter) -> dict[str, str]:
+    """Index name -> create statement, for the RANGE and TEXT indexes not owned by a constraint."""
+    result = adapter.session.run(
+        "SHOW INDEXES YIELD name, type, owningConstraint, createStatement "
+        "WHERE type IN ['RANGE', 'TEXT'] AND owningConstraint IS NULL "
+        "RETURN name, createStatement"
+    )
+    return {record["name"]: record["createStatement"] for record in result}
+
+
+def drop_indexes(adapter: Neo4jAdapter, names: list[str]) -> None:
+    for name in names:
+        adapter.session.run(f"DROP INDEX {name} IF EXISTS").consume()
+
+
+def create_indexes(adapter: Neo4jAdapter, statements: list[str], timeout_s: int) -> float:
+    """Run the create statements and wait for the indexes; returns the seconds taken."""
+    start = time.perf_counter()
+    for statement in statements:
+        adapter.session.run(statement).consume()
+    adapter.session.run(f"CALL db.awaitIndexes({timeout_s})").consume()
+    return time.perf_counter() - start
+
+
+def time_queries(
+    adapter: Neo4jAdapter, queries: list[int], runs: int, warmup: int
+) -> dict[int, float]:
+    return {idx: median_query_ms(adapter, QUERIES[idx], runs, warmup)[0] for idx in queries}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time Neo4j queries with and without the secondary indexes."
+    )
+    parser.add_argument("--queries", "-q", default=None, help="Comma-separated query numbers")
+    parser.add_argument("--runs", "-n", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument(
+        "--index-timeout",
+        type=int,
+        default=1800,
+        help="Seconds to wait for the indexes to come back online",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output JSON path (default: results/neo4j_indexes/<system>.json)",
+    )
+    args = parser.parse_args()
+    queries = parse_selection(args.queries)
+
+    adapter = Neo4jAdapter()
+    system = adapter.system_name()
+    adapter.open()
+    try:
+        indexes = secondary_indexes(adapter)
+        if not indexes:
+            raise SystemExit(
+                "No secondary indexes found; build them with "
+                "`uv run build_graph.py --indexes only` in neo4j/"
+            )
+        indexed = time_queries(adapter, queries, args.runs, args.warmup)
+        drop_indexes(adapter, list(indexes))
+        try:
+            scanned = time_queries(adapter, queries, args.runs, args.warmup)
+        finally:
+            rebuild_s = create_indexes(adapter, list(indexes.values()), args.index_timeout)
+    finally:
+        adapter.close()
+
+    report: dict[str, dict[str, Any]] = {}
+    print(f"| Query | {system} without indexes (ms) | with indexes (ms) | speedup |")
+    print("| --- | --- | --- | --- |")
+    for idx in queries:
+        speedup = scanned[idx] / indexed[idx]
+        report[f"q{idx}"] = {
+            "without_indexes_ms": scanned[idx],
+            "with_indexes_ms": indexed[idx],
+            "speedup": speedup,
+        }
+        print(f"| q{idx} | {scanned[idx]:.1f} | {indexed[idx]:.1f} | {speedup:.2f}x |")
+    print(f"\nRebuilt {len(indexes)} indexes in {rebuild_s:.1f}s")
+
+    output = args.output or NEO4J_INDEXES_DIR / f"{system}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "system": system,
+                "indexes": sorted(indexes),
+                "rebuild_s": rebuild_s,
+                "queries": report,
+            },
+            indent=2,
+        )
+    )
+    print(f"Wrote index timings to {output}")
+
+
+if __name__ == "__main__":
+    main()
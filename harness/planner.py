@@ -0,0 +1,331 @@
+"""
+Join-order pre-planner for lance-graph, which joins a MATCH pattern in the
+order it is written. Several catalog queries start from a large table (e.g.
+q10 and q27 from Comment) when a filter makes another end tiny, and q1 and q22
+have hand-rotated lance-graph overrides for this reason.
+
+`reorder()` rewrites a single-MATCH query so that the pattern starts at the node
+with the fewest estimated rows after its filters, and then expands greedily
+along the hop with the smallest estimated output. The estimates use the
+statistics gathered at build time (`harness.ingest_stats`): row counts, average
+degrees per relationship, and distinct values per column for equality filters.
+If the new order isn't estimated cheaper, the written one is kept. The WHERE
+and RETURN clauses are kept as written, so the result is the same set of rows.
+
+Queries the parser doesn't cover (several clauses, anonymous nodes, property
+maps, variable-length hops, or disconnected patterns) are left unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from harness.ldbc import EDGE_FILES, NODE_FILES
+
+QUERY_RE = re.compile(r"^\s*MATCH\s+(.*?)\s+((?:WHERE|RETURN)\b.*)$", re.IGNORECASE | re.DOTALL)
+UNSUPPORTED_RE = re.compile(r"\b(?:MATCH|WITH|OPTIONAL|UNWIND|UNION|CALL)\b", re.IGNORECASE)
+NODE_RE = re.compile(r"\(\s*(\w+)\s*(?::\s*(\w+))?\s*\)")
+REL_RE = re.compile(r"(<)?-\[\s*(\w*)\s*:\s*(\w+)\s*\]-(>)?")
+CONJUNCT_RE = re.compile(
+    r"^\s*(\w+)\.(\w+)\s*(=|<>|<=|>=|<|>|CONTAINS|STARTS WITH)\s*(.+?)\s*$", re.IGNORECASE
+)
+OPERAND_PROPERTY_RE = re.compile(r"^\w+\.\w+$")
+
+# Selectivities for filters the statistics don't describe.
+DEFAULT_EQUALITY = 0.1
+RANGE = 1 / 3
+CONTAINS = 0.1
+
+
+@dataclass(frozen=True)
+class Hop:
+    src: str
+    rel_var: str
+    rel_type: str
+    dst: str
+
+
+@dataclass
+class Statistics:
+    rows: dict[str, int]
+    # (label, lowercased property) -> distinct values.
+    distinct: dict[tuple[str, str], int]
+    avg_out: dict[str, float]
+    avg_in: dict[str, float]
+
+    @classmethod
+    def from_cardinality(cls, tables: dict[str, dict[str, Any]]) -> Statistics:
+        stats = cls({}, {}, {}, {})
+        for name, table in tables.items():
+            stats.rows[name] = table["count"]
+            if table["kind"] == "node":
+                for column, count in table.get("distinct", {}).items():
+                    stats.distinct[(name, column)] = count
+            else:
+                stats.avg_out[name] = table["avg_out_degree"]
+                stats.avg_in[name] = table["avg_in_degree"]
+        return stats
+
+    @classmethod
+    def from_row_counts(cls, rows: dict[str, int]) -> Statistics:
+        """Averages from row counts alone, for a graph built without `--stats`."""
+        stats = cls(dict(rows), {}, {}, {})
+        for edge in EDGE_FILES.values():
+            count = rows.get(edge.rel_type, 0)
+            stats.avg_out[edge.rel_type] = count / max(rows.get(edge.src_label, 1), 1)
+            stats.avg_in[edge.rel_type] = count / max(rows.get(edge.dst_label, 1), 1)
+        return stats
+
+    def selectivity(self, label: str, prop: str, operator: str) -> float:
+        operator = operator.upper()
+        if prop.lower() == "id" and operator == "=":
+            return 1 / max(self.rows.get(label, 1), 1)
+        distinct = self.distinct.get((label, prop.lower()))
+        if operator == "=":
+            return 1 / distinct if distinct else DEFAULT_EQUALITY
+        if operator == "<>":
+            return 1 - 1 / distinct if distinct else 1 - DEFAULT_EQUALITY
+        if operator in ("CONTAINS", "STARTS WITH"):
+            return CONTAINS
+        return RANGE
+
+
+def load_statistics(path: Path) -> Statistics:
+    return Statistics.from_cardinality(json.loads(path.read_text()))
+
+
+@dataclass
+class Pattern:
+    labels: dict[str, str]
+    hops: list[Hop]
+    # Nodes in order of first mention.
+    nodes: list[str]
+
+
+def parse_pattern(text: str) -> Pattern | None:
+    if "{" in text or "*" in text:
+        return None
+    pattern = Pattern({}, [], [])
+    for path in text.split(","):
+        path = path.strip()
+        position = 0
+        previous: str | None = None
+        pending: tuple[bool, str, str, bool] | None = None
+        while position < len(path):
+            if path[position].isspace():
+                position += 1
+                continue
+            node = NODE_RE.match(path, position)
+            if node is not None:
+                var, label = node.group(1), node.group(2)
+                if label:
+                    if pattern.labels.get(var, label) != label:
+                        return None
+                    pattern.labels[var] = label
+                if var not in pattern.nodes:
+                    pattern.nodes.append(var)
+                if pending is not None:
+                    incoming, rel_var, rel_type, outgoing = pending
+                    if previous is None or incoming == outgoing:
+                        return None
+                    src, dst = (var, previous) if incoming else (previous, var)
+                    pattern.hops.append(Hop(src, rel_var, rel_type, dst))
+                    pending = None
+                previous = var
+                position = node.end()
+                continue
+            rel = REL_RE.match(path, position)
+            if rel is None or pending is not None:
+                return None
+            pending = (bool(rel.group(1)), rel.group(2), rel.group(3), bool(rel.group(4)))
+            position = rel.end()
+        if pending is not None:
+            return None
+    if any(var not in pattern.labels for var in pattern.nodes):
+        return None
+    return pattern
+
+
+def node_filters(where: str, labels: dict[str, str]) -> dict[str, list[tuple[str, str, str]]]:
+    """
+    The conjuncts of `where` that filter a single variable, as (property,
+    operator, conjunct text) per variable. None are returned for a condition
+    with OR or NOT, which doesn't split into independent filters.
+    """
+    filters: dict[str, list[tuple[str, str, str]]] = {var: [] for var in labels}
+    if not where or re.search(r"\b(?:OR|NOT)\b", where, re.IGNORECASE):
+        return filters
+    for conjunct in re.split(r"\s+AND\s+", where, flags=re.IGNORECASE):
+        match = CONJUNCT_RE.match(conjunct)
+        if match is None or match.group(1) not in labels:
+            continue
+        var, prop, operator, operand = match.groups()
+        # Comparisons between two variables are join conditions, not filters.
+        if OPERAND_PROPERTY_RE.match(operand):
+            continue
+        filters[var].append((prop, operator, conjunct.strip()))
+    return filters
+
+
+def filter_selectivity(where: str, labels: dict[str, str], stats: Statistics) -> dict[str, float]:
+    """Combined selectivity of the single-node filters on each variable."""
+    selectivity = {var: 1.0 for var in labels}
+    for var, filters in node_filters(where, labels).items():
+        for prop, operator, _ in filters:
+            selectivity[var] *= stats.selectivity(labels[var], prop, operator)
+    return selectivity
+
+
+def _expansion(
+    hop: Hop,
+    visited: set[str],
+    rows: float,
+    pattern: Pattern,
+    sel: dict[str, float],
+    stats: Statistics,
+) -> float:
+    if hop.src not in visited and hop.dst not in visited:
+        # A hop not yet connected to what is joined is a cross product.
+        edges = stats.rows.get(hop.rel_type, 1) * sel[hop.src] * sel[hop.dst]
+        return rows * edges
+    if hop.src in visited and hop.dst in visited:
+        # Closing a cycle filters the rows already there.
+        target = stats.rows.get(pattern.labels[hop.dst], 1)
+        return rows * min(1.0, stats.avg_out.get(hop.rel_type, 1.0) / max(target, 1))
+    if hop.src in visited:
+        return rows * stats.avg_out.get(hop.rel_type, 1.0) * sel[hop.dst]
+    return rows * stats.avg_in.get(hop.rel_type, 1.0) * sel[hop.src]
+
+
+def estimate(
+    start: str, hops: list[Hop], pattern: Pattern, sel: dict[str, float], stats: Statistics
+) -> float:
+    """Sum of the estimated intermediate rows when joining `hops` in order from `start`."""
+    rows = stats.rows.get(pattern.labels[start], 1) * sel[start]
+    total = rows
+    visited = {start}
+    for hop in hops:
+        rows = _expansion(hop, visited, rows, pattern, sel, stats)
+        visited |= {hop.src, hop.dst}
+        total += rows
+    return total
+
+
+def greedy_order(
+    pattern: Pattern, sel: dict[str, float], stats: Statistics
+) -> tuple[str, list[Hop]] | None:
+    start = min(
+        pattern.nodes, key=lambda var: stats.rows.get(pattern.labels[var], 1) * sel[var]
+    )
+    rows = stats.rows.get(pattern.labels[start], 1) * sel[start]
+    visited = {start}
+    remaining = list(pattern.hops)
+    order: list[Hop] = []
+    while remaining:
+        adjacent = [hop for hop in remaining if hop.src in visited or hop.dst in visited]
+        if not adjacent:
+            return None
+        hop = min(adjacent, key=lambda h: _expansion(h, visited, rows, pattern, sel, stats))
+        rows = _expansion(hop, visited, rows, pattern, sel, stats)
+        visited |= {hop.src, hop.dst}
+        remaining.remove(hop)
+        order.append(hop)
+    return start, order
+
+
+def render_pattern(start: str, hops: list[Hop], labels: dict[str, str]) -> str:
+    mentioned: set[str] = set()
+
+    def _node(var: str) -> str:
+        if var in mentioned:
+            return f"({var})"
+        mentioned.add(var)
+        return f"({var}:{labels[var]})"
+
+    paths: list[str] = [_node(start)]
+    last = start
+    for hop in hops:
+        bound = hop.src if hop.src in mentioned else hop.dst
+        if bound != last:
+            paths.append(_node(bound))
+        rel = f"[{hop.rel_var}:{hop.rel_type}]"
+        if bound == hop.src:
+            paths[-1] += f"-{rel}->{_node(hop.dst)}"
+            last = hop.dst
+        else:
+            paths[-1] += f"<-{rel}-{_node(hop.src)}"
+            last = hop.src
+    return ", ".join(paths)
+
+
+@dataclass(frozen=True)
+class Plan:
+    text: str
+    original_cost: float
+    cost: float
+
+
+@dataclass(frozen=True)
+class ParsedQuery:
+    pattern: Pattern
+    # The WHERE condition, without the keyword; empty if there is none.
+    where: str
+    # Everything after the pattern, kept as written.
+    rest: str
+
+
+def parse_query(text: str) -> ParsedQuery | None:
+    match = QUERY_RE.match(text)
+    if match is None:
+        return None
+    pattern_text, rest = match.groups()
+    if UNSUPPORTED_RE.search(rest):
+        return None
+    pattern = parse_pattern(pattern_text)
+    if pattern is None or not pattern.hops:
+        return None
+    where = re.split(r"\bRETURN\b", rest, maxsplit=1, flags=re.IGNORECASE)[0]
+    where = re.sub(r"^\s*WHERE\b", "", where, flags=re.IGNORECASE).strip()
+    return ParsedQuery(pattern, where, rest)
+
+
+def reorder(text: str, stats: Statistics) -> Plan | None:
+    """The query with its pattern in the estimated cheapest order, or None if not handled."""
+    parsed = parse_query(text)
+    if parsed is None:
+        return None
+    pattern = parsed.pattern
+    sel = filter_selectivity(parsed.where, pattern.labels, stats)
+    ordered = greedy_order(pattern, sel, stats)
+    if ordered is None:
+        return None
+    start, hops = ordered
+    original_cost = estimate(pattern.nodes[0], pattern.hops, pattern, sel, stats)
+    cost = estimate(start, hops, pattern, sel, stats)
+    # Greedy expansion can do worse than the written order; keep that then.
+    if cost >= original_cost:
+        return Plan(text, original_cost, original_cost)
+    return Plan(
+        f"MATCH {render_pattern(start, hops, pattern.labels)}\n{parsed.rest}", original_cost, cost
+    )
+
+
+def default_statistics(graph_root: Path, row_counts: dict[str, int]) -> Statistics:
+    """
+    Statistics kept with the graph by a `--stats` build, else from row counts.
+    Statistics older than the last write to the graph are ignored.
+    """
+    # Imported here: harness.ingest_stats needs polars, which the planner doesn't.
+    from harness.ingest_stats import current_cardinality
+
+    tables = current_cardinality(graph_root / "_stats.json", graph_root)
+    if tables is not None:
+        return Statistics.from_cardinality(tables)
+    known = set(NODE_FILES) | set(EDGE_FILES)
+    return Statistics.from_row_counts(
+        {name: rows for name, rows in row_counts.items() if name in known}
+    )
@@ -0,0 +1,99 @@
+"""
+Join reordering on lance-graph: each query as written against the order chosen
+by `harness.planner` from the graph's statistics, side by side. Queries the
+planner leaves unchanged are listed but not timed. Both orders must return the
+same rows; the rewritten texts are saved with the timings.
+
+    uv run python -m harness.reorder --queries 10,19,27
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import REPO_ROOT, LanceAdapter
+from harness.catalog import QUERIES, parse_selection
+from harness.planner import default_statistics, reorder
+from harness.stats import median_prepared_ms
+from harness.verify import digest_table
+
+REORDER_DIR = REPO_ROOT / "results" / "reorder"
+
+
+def compare(
+    adapter: LanceAdapter, queries: list[int], runs: int, warmup: int
+) -> dict[str, dict[str, Any]]:
+    row_counts = {name: table.num_rows for name, table in adapter.datasets.items()}
+    stats = default_statistics(adapter.graph_root, row_counts)
+    report: dict[str, dict[str, Any]] = {}
+    for idx in queries:
+        prepared = adapter.prepare(QUERIES[idx])
+        plan = reorder(prepared.text, stats)
+        if plan is None or plan.text == prepared.text:
+            report[f"q{idx}"] = {"reordered": False}
+            continue
+        written_ms, written = median_prepared_ms(adapter, prepared, runs, warmup)
+        reordered_ms, reordered = median_prepared_ms(
+            adapter, replace(prepared, text=plan.text), runs, warmup
+        )
+        report[f"q{idx}"] = {
+            "reordered": True,
+            "written_ms": written_ms,
+            "reordered_ms": reordered_ms,
+            "estimated_rows_written": plan.original_cost,
+            "estimated_rows_reordered": plan.cost,
+            "same_result": digest_table(written).digest == digest_table(reordered).digest,
+            "text": plan.text,
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time lance-graph queries in written and planner-chosen join order."
+    )
+    parser.add_argument("--queries", "-q", default=None, help="Comma-separated query numbers")
+    parser.add_argument("--runs", "-n", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--location", default=None, help="Graph root other than the benchmark one")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output JSON path (default: results/reorder/<system>.json)",
+    )
+    args = parser.parse_args()
+
+    adapter = LanceAdapter(args.location) if args.location else LanceAdapter()
+    system = adapter.system_name()
+    adapter.open()
+    try:
+        report = compare(adapter, parse_selection(args.queries), args.runs, args.warmup)
+    finally:
+        adapter.close()
+
+    print(f"| Query | {system} as written (ms) | reordered (ms) | speedup | same result |")
+    print("| --- | --- | --- | --- | --- |")
+    for name, row in report.items():
+        if not row["reordered"]:
+            print(f"| {name} | - | unchanged | - | - |")
+            continue
+        speedup = row["written_ms"] / row["reordered_ms"]
+        print(
+            f"| {name} | {row['written_ms']:.1f} | {row['reordered_ms']:.1f} | {speedup:.1f}x "
+            f"| {'yes' if row['same_result'] else 'NO'} |"
+        )
+
+    output = args.output or REORDER_DIR / f"{system}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"system": system, "queries": report}, indent=2))
+    print(f"\nWrote join-order timings to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Replay the update stream written by `harness.updates` into an engine while
+reader threads run catalog queries, the way the graph is used in production.
+
+Point `--location` at a database built from the snapshot CSVs (see the README).
+The harness first runs the readers alone for `--baseline-seconds` to get idle
+read latency, then inserts one batch per `--window-hours` of event time, as
+fast as the engine accepts them, while the readers keep going. It reports:
+
+- insert throughput: rows per second of insert time, and per-batch latency;
+- read latency (p50/p95/p99) without writes and under concurrent writes.
+
+Each reader uses its own connection or session from `EngineAdapter.fork()`.
+Results are written to `results/updates/<system>.json`.
+
+    uv run python -m harness.replay --engine kuzu \\
+      --location updates/2012-06-01/ldbc_snb_sf1.kuzu --stream updates/2012-06-01/stream
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import ADAPTERS, REPO_ROOT, EngineAdapter, get_adapter
+from harness.catalog import QUERIES, parse_selection
+from harness.stats import latency_summary
+from harness.updates import iter_batches, stream_size
+
+UPDATES_DIR = REPO_ROOT / "results" / "updates"
+
+# Error messages kept per reader; later failures are only counted.
+MAX_ERROR_MESSAGES = 5
+# A reader backs off after a failed read, doubling up to the cap, and gives up
+# after this many failures in a row (e.g. the engine went away).
+ERROR_BACKOFF_S = 0.01
+MAX_ERROR_BACKOFF_S = 1.0
+MAX_CONSECUTIVE_ERRORS = 20
+
+
+class Reader(threading.Thread):
+    """Runs the selected queries round-robin, recording latencies per phase."""
+
+    def __init__(self, adapter: EngineAdapter, queries: list[int], phase: list[str]) -> None:
+        super().__init__(daemon=True)
+        self.adapter = adapter
+        self.prepared = [adapter.prepare(QUERIES[idx]) for idx in queries]
+        # Shared one-element list holding the current phase name.
+        self.phase = phase
+        self.stop = threading.Event()
+        self.latencies: dict[str, list[float]] = {}
+        # Failed reads per query, and the first few messages.
+        self.error_counts: dict[str, int] = {}
+        self.errors: list[str] = []
+        self.gave_up = False
+
+    def run(self) -> None:
+        i = 0
+        consecutive = 0
+        while not self.stop.is_set():
+            prepared = self.prepared[i % len(self.prepared)]
+            i += 1
+            current = self.phase[0]
+            start = time.perf_counter()
+            try:
+                self.adapter.execute(prepared)
+            except Exception as exc:  # noqa: BLE001 - keep reading, report at the end
+                name = f"q{prepared.spec.idx}"
+                self.error_counts[name] = self.error_counts.get(name, 0) + 1
+                if len(self.errors) < MAX_ERROR_MESSAGES:
+                    self.errors.append(f"{name}: {exc}")
+                consecutive += 1
+                if consecutive >= MAX_CONSECUTIVE_ERRORS:
+                    self.gave_up = True
+                    return
+                self.stop.wait(min(ERROR_BACKOFF_S * 2 ** (consecutive - 1), MAX_ERROR_BACKOFF_S))
+                continue
+            consecutive = 0
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.latencies.setdefault(current, []).append(elapsed_ms)
+
+
+def replay(
+    adapter: EngineAdapter,
+    stream_dir: Path,
+    window: timedelta,
+    queries: list[int],
+    readers: int,
+    baseline_s: float,
+    max_batches: int | None,
+) -> dict[str, Any]:
+    phase = ["idle"]
+    workers = [Reader(adapter.fork(), queries, phase) for _ in range(readers)]
+    for worker in workers:
+        worker.start()
+    try:
+        time.sleep(baseline_s)
+        phase[0] = "writes"
+        total = stream_size(stream_dir)
+        inserted = 0
+        batch_ms: list[float] = []
+        for batch in iter_batches(stream_dir, window):
+            start = time.perf_counter()
+            adapter.insert(batch)
+            batch_ms.append((time.perf_counter() - start) * 1000)
+            inserted += batch.num_rows
+            print(
+                f"{batch.start:%Y-%m-%d %H:%M}: {batch.num_rows} rows in {batch_ms[-1]:.1f}ms "
+                f"({inserted}/{total})"
+            )
+            if max_batches is not None and len(batch_ms) >= max_batches:
+                break
+    finally:
+        for worker in workers:
+            worker.stop.set()
+        for worker in workers:
+            worker.join()
+            worker.adapter.close()
+
+    insert_s = sum(batch_ms) / 1000
+    reads = {
+        name: latency_summary([ms for worker in workers for ms in worker.latencies.get(name, [])])
+        for name in ("idle", "writes")
+    }
+    error_counts: dict[str, int] = {}
+    for worker in workers:
+        for name, count in worker.error_counts.items():
+            error_counts[name] = error_counts.get(name, 0) + count
+    return {
+        "window_hours": window / timedelta(hours=1),
+        "readers": readers,
+        "queries": queries,
+        "inserted_rows": inserted,
+        "inserts_per_s": inserted / insert_s if insert_s else float("nan"),
+        "batch_latency": latency_summary(batch_ms),
+        "read_latency": reads,
+        "read_errors": error_counts,
+        "read_error_messages": [error for worker in workers for error in worker.errors],
+        "readers_stopped": sum(worker.gave_up for worker in workers),
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    batches = report["batch_latency"]
+    print(
+        f"\nInserted {report['inserted_rows']} rows in {batches['count']} batches: "
+        f"{report['inserts_per_s']:.0f} rows/s, "
+        f"batch p50 {batches['p50_ms']:.1f}ms, p99 {batches['p99_ms']:.1f}ms"
+    )
+    print("\n| Reads | Count | p50 (ms) | p95 (ms) | p99 (ms) |")
+    print("| --- | --- | --- | --- | --- |")
+    for name, summary in report["read_latency"].items():
+        print(
+            f"| {name} | {summary['count']} | {summary['p50_ms']:.1f} "
+            f"| {summary['p95_ms']:.1f} | {summary['p99_ms']:.1f} |"
+        )
+    if report["read_errors"]:
+        failed = sum(report["read_errors"].values())
+        print(f"\n{failed} reads failed, first: {report['read_error_messages'][0]}")
+    if report["readers_stopped"]:
+        print(
+            f"{report['readers_stopped']} readers stopped after "
+            f"{MAX_CONSECUTIVE_ERRORS} failed reads in a row"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay timestamped insert batches into an engine under concurrent reads."
+    )
+    parser.add_argument("--engine", "-e", required=True, choices=sorted(ADAPTERS))
+    parser.add_argument(
+        "--location",
+        required=True,
+        help="Database built from the snapshot: a path, or a database name for Neo4j",
+    )
+    parser.add_argument(
+        "--stream", type=Path, required=True, help="Stream directory written by harness.updates"
+    )
+    parser.add_argument("--window-hours", type=float, default=24, help="Event time per batch")
+    parser.add_argument("--readers", "-r", type=int, default=1, help="Concurrent reader threads")
+    parser.add_argument(
+        "--queries", "-q", default=None, help="Comma-separated query numbers (default: all)"
+    )
+    parser.add_argument("--baseline-seconds", type=float, default=10, help="Reads without writes")
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output JSON path (default: results/updates/<system>.json)",
+    )
+    args = parser.parse_args()
+
+    adapter = get_adapter(args.engine, args.location)
+    system = adapter.system_name()
+    adapter.open()
+    try:
+        report = replay(
+            adapter,
+            args.stream,
+            timedelta(hours=args.window_hours),
+            parse_selection(args.queries),
+            args.readers,
+            args.baseline_seconds,
+            args.max_batches,
+        )
+    finally:
+        adapter.close()
+    _print_report(report)
+
+    output = args.output or UPDATES_DIR / f"{system}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"system": system, **report}, indent=2))
+    print(f"\nWrote update results to {output}")
+
+
+if __name__ == "__main__":
+    main()
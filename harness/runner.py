@@ -0,0 +1,134 @@
+"""
+Run the query suite on one engine and echo each query and its result. This is
+what every engine's `query.py` runs:
+
+    uv run query.py              # all 30 queries
+    uv run query.py "1,2,6"      # a subset
+    uv run query.py --profile    # save plans to results/plans/<system>/q<N>.txt
+
+lance-graph can also serve repeated queries from a result cache:
+
+    uv run query.py --cache-mb 256 --repeat 3
+
+plan each pattern's join order from the graph's statistics:
+
+    uv run query.py --reorder
+
+and run multi-hop queries in stages, cutting the tables to the rows reachable
+from the most selective filter in memory or in a filtered Lance scan:
+
+    uv run query.py --semi-join memory|lance
+
+On Neo4j, `--runtime slotted|pipelined|parallel` picks the Cypher runtime.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from harness.adapters import REPO_ROOT, EngineAdapter, get_adapter
+from harness.catalog import QUERIES, parse_selection
+
+PLANS_ROOT = REPO_ROOT / "results" / "plans"
+
+
+def save_plan(plan_dir: Path, idx: int, plan: str) -> Path:
+    plan_dir.mkdir(parents=True, exist_ok=True)
+    path = plan_dir / f"q{idx}.txt"
+    path.write_text(plan + "\n")
+    return path
+
+
+def run_suite(
+    adapter: EngineAdapter,
+    selected: list[int],
+    *,
+    plan_dir: Path | None = None,
+    verbose: bool = True,
+) -> None:
+    """
+    Run the selected queries on an open adapter. With `plan_dir` set, each
+    query is profiled instead and its plan is saved there.
+    """
+    start = time.perf_counter()
+    for idx in selected:
+        spec = QUERIES.get(idx)
+        if spec is None:
+            print(f"Skipping unknown query index: {idx}")
+            continue
+        prepared = adapter.prepare(spec)
+        if plan_dir is not None:
+            plan = adapter.profile(prepared)
+            path = save_plan(plan_dir, idx, plan)
+            if verbose:
+                print(f"\nQuery {idx} plan saved to {path}:\n{plan}")
+            continue
+        if verbose:
+            print(f"\nQuery {idx}:\n{prepared.text}")
+        result = adapter.execute(prepared)
+        if verbose:
+            print(pl.from_arrow(result))
+    elapsed = time.perf_counter() - start
+    print(f"\nCompleted {len(selected)} query(ies) in {elapsed:.2f}s")
+
+
+def _pop_value(args: list[str], flag: str) -> str | None:
+    if flag not in args:
+        return None
+    position = args.index(flag)
+    if position + 1 >= len(args):
+        raise SystemExit(f"{flag} needs a value")
+    value = args[position + 1]
+    del args[position : position + 2]
+    return value
+
+
+def main(engine: str, argv: list[str]) -> None:
+    args = list(argv)
+    profile = "--profile" in args
+    if profile:
+        args.remove("--profile")
+    reorder = "--reorder" in args
+    if reorder:
+        args.remove("--reorder")
+    cache_mb = _pop_value(args, "--cache-mb")
+    repeat = int(_pop_value(args, "--repeat") or 1)
+    runtime = _pop_value(args, "--runtime")
+    semi_join = _pop_value(args, "--semi-join")
+    selected = parse_selection(args[0] if args else None)
+
+    options: dict[str, Any] = {}
+    if (cache_mb is not None or reorder or semi_join is not None) and engine != "lance":
+        raise SystemExit("--cache-mb, --reorder and --semi-join are only supported on lance-graph")
+    if cache_mb is not None:
+        options["cache_bytes"] = int(float(cache_mb) * 2**20)
+    if reorder:
+        options["reorder_joins"] = True
+    if semi_join is not None:
+        if semi_join not in ("memory", "lance"):
+            raise SystemExit("--semi-join must be memory or lance")
+        options["semi_join"] = semi_join
+    if runtime is not None:
+        if engine != "neo4j":
+            raise SystemExit("--runtime is only supported on Neo4j")
+        options["runtime"] = runtime
+    adapter = get_adapter(engine, **options)
+    adapter.open()
+    try:
+        plan_dir = PLANS_ROOT / adapter.system_name() if profile else None
+        for _ in range(repeat):
+            run_suite(adapter, selected, plan_dir=plan_dir)
+        cache = getattr(adapter, "result_cache", None)
+        if cache is not None:
+            stats = cache.stats()
+            print(
+                f"Result cache: {stats.hits} hits, {stats.misses} misses "
+                f"({stats.hit_rate:.0%}), {stats.evictions} evictions, "
+                f"{stats.entries} entries, {stats.bytes / 2**20:.1f} MB"
+            )
+    finally:
+        adapter.close()
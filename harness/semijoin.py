@@ -0,0 +1,234 @@
+"""
+Staged execution for lance-graph multi-hop joins (sideways information
+passing).
+
+In queries such as q7, q13 and q22, a filter leaves a handful of nodes that are
+then joined against edge tables with millions of rows. Staged execution first
+evaluates the most selective node filter on its own, then walks the pattern
+from that node: each hop keeps only the edges whose bound end is among the ids
+reached so far, and their other ends become the ids for the next hop. The
+query then runs as written on tables reduced to those rows, so the joins only
+see edges that can take part in a result.
+
+The reduction is a hash-set membership filter (`pyarrow.compute.is_in`) over
+the in-memory tables, or with `scan="lance"` a filter pushed into a fresh scan
+of each Lance dataset (`src IN (...)`). Empty id sets and sets above
+`LANCE_IN_LIMIT` are filtered in memory either way.
+
+    uv run python -m harness.semijoin --queries 7,13,22
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from harness.adapters import REPO_ROOT, LanceAdapter
+from harness.adapters.lance import GraphDatasets, dataset_path, to_arrow
+from harness.catalog import QUERIES, parse_selection
+from harness.planner import ParsedQuery, Statistics, filter_selectivity, node_filters
+from harness.stats import median_query_ms
+from harness.verify import digest_table
+
+SEMIJOIN_DIR = REPO_ROOT / "results" / "semijoin"
+
+SCANS = ("memory", "lance")
+DEFAULT_QUERIES = "7,13,22"
+# Largest id set pushed into a Lance scan as an IN list.
+LANCE_IN_LIMIT = 10_000
+
+# Column name -> ids it must be one of; several conditions on a table are ORed.
+Condition = dict[str, pa.Array]
+
+
+def choose_seed(parsed: ParsedQuery, stats: Statistics) -> str | None:
+    """The filtered variable with the fewest estimated rows, if any is filtered."""
+    pattern = parsed.pattern
+    filters = node_filters(parsed.where, pattern.labels)
+    sel = filter_selectivity(parsed.where, pattern.labels, stats)
+    filtered = [var for var in pattern.nodes if filters[var]]
+    if not filtered:
+        return None
+    return min(filtered, key=lambda var: stats.rows.get(pattern.labels[var], 1) * sel[var])
+
+
+def seed_query(parsed: ParsedQuery, seed: str) -> str:
+    conjuncts = [text for _, _, text in node_filters(parsed.where, parsed.pattern.labels)[seed]]
+    label = parsed.pattern.labels[seed]
+    return f"MATCH ({seed}:{label}) WHERE {' AND '.join(conjuncts)} RETURN {seed}.id AS id"
+
+
+def _mask(table: pa.Table, condition: Condition) -> pa.ChunkedArray:
+    mask = None
+    for column, ids in condition.items():
+        term = pc.is_in(table[column], value_set=ids)
+        mask = term if mask is None else pc.and_(mask, term)
+    return mask
+
+
+def _in_list(condition: Condition) -> str:
+    return " AND ".join(
+        f"{column} IN ({', '.join(str(id_) for id_ in ids.to_pylist())})"
+        for column, ids in condition.items()
+    )
+
+
+def _filter(
+    name: str,
+    table: pa.Table,
+    conditions: list[Condition],
+    graph_root: Path,
+    scan: str,
+) -> pa.Table:
+    if scan == "lance" and all(
+        0 < len(ids) <= LANCE_IN_LIMIT for condition in conditions for ids in condition.values()
+    ):
+        import lance
+
+        where = " OR ".join(f"({_in_list(condition)})" for condition in conditions)
+        dataset = lance.dataset(str(dataset_path(graph_root, name)))
+        return dataset.to_table(filter=where).select(table.column_names).cast(table.schema)
+    mask = _mask(table, conditions[0])
+    for condition in conditions[1:]:
+        mask = pc.or_(mask, _mask(table, condition))
+    return table.filter(mask)
+
+
+def reduce_datasets(
+    parsed: ParsedQuery,
+    seed: str,
+    seed_ids: pa.Array,
+    datasets: GraphDatasets,
+    graph_root: Path,
+    scan: str = "memory",
+) -> GraphDatasets | None:
+    """
+    The datasets with the pattern's tables cut to the rows reachable from
+    `seed_ids`, or None if the pattern isn't connected.
+    """
+    pattern = parsed.pattern
+    reached: dict[str, pa.Array] = {seed: seed_ids}
+    edge_conditions: dict[str, list[Condition]] = defaultdict(list)
+    # Edges cut on the way, reused when the table has no other condition.
+    cut: dict[str, pa.Table] = {}
+    remaining = list(pattern.hops)
+    while remaining:
+        hop = next((h for h in remaining if h.src in reached or h.dst in reached), None)
+        if hop is None:
+            return None
+        remaining.remove(hop)
+        condition = {
+            column: reached[var]
+            for column, var in (("src", hop.src), ("dst", hop.dst))
+            if var in reached
+        }
+        edge_conditions[hop.rel_type].append(condition)
+        if hop.src in reached and hop.dst in reached:
+            continue
+        edges = _filter(hop.rel_type, datasets[hop.rel_type], [condition], graph_root, scan)
+        cut[hop.rel_type] = edges
+        new_var, column = (hop.dst, "dst") if hop.src in reached else (hop.src, "src")
+        reached[new_var] = pc.unique(edges[column]).combine_chunks()
+
+    node_ids: dict[str, list[pa.Array]] = defaultdict(list)
+    for var, ids in reached.items():
+        node_ids[pattern.labels[var]].append(ids)
+    reduced = dict(datasets)
+    for rel_type, conditions in edge_conditions.items():
+        if len(conditions) == 1 and rel_type in cut:
+            reduced[rel_type] = cut[rel_type]
+        else:
+            reduced[rel_type] = _filter(rel_type, datasets[rel_type], conditions, graph_root, scan)
+    for label, id_sets in node_ids.items():
+        conditions = [{"id": ids} for ids in id_sets]
+        reduced[label] = _filter(label, datasets[label], conditions, graph_root, scan)
+    return reduced
+
+
+def stage(
+    parsed: ParsedQuery,
+    stats: Statistics,
+    engine: Any,
+    datasets: GraphDatasets,
+    graph_root: Path,
+    scan: str = "memory",
+) -> GraphDatasets | None:
+    """Reduced datasets for the query, or None if it has no filter to start from."""
+    seed = choose_seed(parsed, stats)
+    if seed is None:
+        return None
+    seed_ids = to_arrow(engine.execute(seed_query(parsed, seed))).column("id").combine_chunks()
+    return reduce_datasets(parsed, seed, seed_ids, datasets, graph_root, scan)
+
+
+def compare(
+    adapter: LanceAdapter, queries: list[int], runs: int, warmup: int
+) -> dict[str, dict[str, Any]]:
+    report: dict[str, dict[str, Any]] = {}
+    for idx in queries:
+        adapter.semi_join = None
+        row: dict[str, Any] = {}
+        row["joined_ms"], joined = median_query_ms(adapter, QUERIES[idx], runs, warmup)
+        digest = digest_table(joined).digest
+        for scan in SCANS:
+            adapter.semi_join = scan
+            row[f"staged_{scan}_ms"], staged = median_query_ms(adapter, QUERIES[idx], runs, warmup)
+            row[f"same_result_{scan}"] = digest_table(staged).digest == digest
+        report[f"q{idx}"] = row
+    adapter.semi_join = None
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time lance-graph queries joined as written and staged from their seed filter."
+    )
+    parser.add_argument(
+        "--queries", "-q", default=DEFAULT_QUERIES, help="Comma-separated query numbers"
+    )
+    parser.add_argument("--runs", "-n", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--location", default=None, help="Graph root other than the benchmark one")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output JSON path (default: results/semijoin/<system>.json)",
+    )
+    args = parser.parse_args()
+
+    options: dict[str, Any] = {"semi_join": "memory"}
+    if args.location:
+        options["graph_root"] = args.location
+    adapter = LanceAdapter(**options)
+    system = adapter.system_name()
+    adapter.open()
+    try:
+        report = compare(adapter, parse_selection(args.queries), args.runs, args.warmup)
+    finally:
+        adapter.close()
+
+    print(f"| Query | {system} joined (ms) | staged, memory (ms) | staged, lance (ms) | same |")
+    print("| --- | --- | --- | --- | --- |")
+    for name, row in report.items():
+        same = all(row[f"same_result_{scan}"] for scan in SCANS)
+        print(
+            f"| {name} | {row['joined_ms']:.1f} | {row['staged_memory_ms']:.1f} "
+            f"| {row['staged_lance_ms']:.1f} | {'yes' if same else 'NO'} |"
+        )
+
+    output = args.output or SEMIJOIN_DIR / f"{system}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"system": system, "queries": report}, indent=2))
+    print(f"\nWrote staged join timings to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Startup benchmark: how long each engine takes to get to its first query result.
+
+Every sample runs in a fresh subprocess so that imports are cold, and records:
+
+- `import`: loading the engine's client library
+- the open phases for the engine (kuzu/ladybug: `Database`, `Connection`;
+  neo4j: driver, connect + auth, session; lance: `build_config()`,
+  `load_datasets()`, `CypherEngine(config, datasets)`)
+- RSS of the process right after the open
+- `first_result`: the first execution of q1
+- `total`: process-local time from the start of the import to the q1 result
+
+    uv run python -m harness.startup --engines kuzu,ladybug,lance --samples 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import ENGINES, REPO_ROOT, get_adapter, parse_engines
+from harness.catalog import QUERIES
+from harness.system import current_rss_bytes
+
+FIRST_QUERY = 1
+
+
+def run_worker(engine: str) -> dict[str, Any]:
+    timings: dict[str, float] = {}
+    adapter = get_adapter(engine)
+    start = time.perf_counter()
+    adapter.open(timings)
+    try:
+        rss_after_open = current_rss_bytes()
+        query_start = time.perf_counter()
+        adapter.execute(adapter.prepare(QUERIES[FIRST_QUERY]))
+        end = time.perf_counter()
+    finally:
+        adapter.close()
+    timings["first_result"] = (end - query_start) * 1000
+    timings["total"] = (end - start) * 1000
+    return {"phases_ms": timings, "rss_after_open_bytes": rss_after_open}
+
+
+def _spawn_worker(engine: str) -> dict[str, Any]:
+    cmd = [sys.executable, "-m", "harness.startup", "--worker", "--engines", engine]
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Startup worker failed for {engine}:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples: list[dict[str, Any]]) -> dict[str, Any]:
+    phases = list(samples[0]["phases_ms"])
+    return {
+        "phases_ms": {
+            phase: statistics.median(sample["phases_ms"][phase] for sample in samples)
+            for phase in phases
+        },
+        "rss_after_open_mb": statistics.median(
+            sample["rss_after_open_bytes"] for sample in samples
+        )
+        / (1024 * 1024),
+    }
+
+
+def to_markdown(summaries: dict[str, dict[str, Any]]) -> str:
+    lines = [
+        "| System | Phase breakdown (ms) | Open (ms) | RSS after open (MB) "
+        "| q1 first result (ms) | Time to first result (ms) |",
+        "| --- | --- | --- | --- | --- | --- |",
+    ]
+    for system, summary in summaries.items():
+        phases = summary["phases_ms"]
+        open_phases = {
+            name: value
+            for name, value in phases.items()
+            if name not in {"import", "first_result", "total"}
+        }
+        shown = {"import": phases["import"], **open_phases}
+        breakdown = ", ".join(f"{name} {value:.1f}" for name, value in shown.items())
+        lines.append(
+            f"| {system} | {breakdown} | {sum(open_phases.values()):.1f} "
+            f"| {summary['rss_after_open_mb']:.0f} | {phases['first_result']:.1f} "
+            f"| {phases['total']:.1f} |"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time import, open and first-result phases for each engine."
+    )
+    parser.add_argument(
+        "--engines",
+        "-e",
+        default=",".join(ENGINES),
+        help=f"Comma-separated engines to measure (default: {','.join(ENGINES)})",
+    )
+    parser.add_argument(
+        "--samples", "-n", type=int, default=5, help="Fresh processes per engine"
+    )
+    parser.add_argument("--output", "-o", type=Path, default=None, help="Write raw samples as JSON")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    engines = parse_engines(args.engines)
+
+    if args.worker:
+        print(json.dumps(run_worker(engines[0])))
+        return
+
+    raw: dict[str, list[dict[str, Any]]] = {}
+    summaries: dict[str, dict[str, Any]] = {}
+    for engine in engines:
+        system = get_adapter(engine).system_name()
+        raw[system] = [_spawn_worker(engine) for _ in range(args.samples)]
+        summaries[system] = summarize(raw[system])
+        print(f"{system}: {summaries[system]['phases_ms']['total']:.1f}ms to first result")
+
+    print()
+    print(to_markdown(summaries))
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({"samples": raw, "summary": summaries}, indent=2))
+        print(f"\nWrote raw samples to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Latency summaries and timing helpers shared by the workload harnesses.
+"""
+
+from __future__ import annotations
+
+import math
+import statistics
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from harness.adapters import EngineAdapter, PreparedQuery
+    from harness.catalog import QuerySpec
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile, `q` in [0, 100]; NaN for no values."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def latency_summary(values_ms: Sequence[float]) -> dict[str, float]:
+    return {
+        "count": len(values_ms),
+        "mean_ms": sum(values_ms) / len(values_ms) if values_ms else float("nan"),
+        "p50_ms": percentile(values_ms, 50),
+        "p95_ms": percentile(values_ms, 95),
+        "p99_ms": percentile(values_ms, 99),
+    }
+
+
+def median_query_ms(
+    adapter: EngineAdapter, spec: QuerySpec, runs: int, warmup: int
+) -> tuple[float, Any]:
+    """Median latency of a query over `runs` executions, and its last result."""
+    return median_prepared_ms(adapter, adapter.prepare(spec), runs, warmup)
+
+
+def median_prepared_ms(
+    adapter: EngineAdapter, prepared: PreparedQuery, runs: int, warmup: int
+) -> tuple[float, Any]:
+    for _ in range(warmup):
+        adapter.execute(prepared)
+    timings = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = adapter.execute(prepared)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
@@ -0,0 +1,91 @@
+"""
+OS-level helpers for page-cache control and process memory readings.
+"""
+
+from __future__ import annotations
+
+import os
+import resource
+import shutil
+import subprocess
+import sys
+
+
+def _proc_status_kib(field: str) -> int | None:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def drop_page_cache() -> bool:
+    """
+    Ask the OS to drop its page cache. Returns False when the platform
+    doesn't allow it (non-root on Linux, no `purge` on macOS, etc.).
+    """
+    if sys.platform.startswith("linux"):
+        os.sync()
+        try:
+            with open("/proc/sys/vm/drop_caches", "w") as f:
+                f.write("3\n")
+        except OSError:
+            return False
+        return True
+    if sys.platform == "darwin" and shutil.which("purge") is not None:
+        result = subprocess.run(["purge"], capture_output=True)
+        return result.returncode == 0
+    return False
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process, in bytes."""
+    rss = _proc_status_kib("VmRSS")
+    if rss is not None:
+        return rss * 1024
+    # No /proc elsewhere (macOS); `ps` reports RSS in KiB.
+    out = subprocess.run(
+        ["ps", "-o", "rss=", "-p", str(os.getpid())],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(out.stdout.strip()) * 1024
+
+
+def private_rss_bytes() -> int | None:
+    """
+    Anonymous (heap) part of the RSS, in bytes, leaving out file pages that can
+    be shared with other processes. None where `/proc` doesn't report it.
+    """
+    anon = _proc_status_kib("RssAnon")
+    return anon * 1024 if anon is not None else None
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset the peak-RSS high-water mark so the next `peak_rss_bytes()` covers
+    only what follows. Only Linux supports this; elsewhere the peak keeps
+    covering the whole process lifetime and this returns False.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5\n")
+    except OSError:
+        return False
+    return True
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process, in bytes."""
+    hwm = _proc_status_kib("VmHWM")
+    if hwm is not None:
+        return hwm * 1024
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB everywhere else.
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
@@ -0,0 +1,243 @@
+"""
+Time-window queries, the access pattern of time-bounded feeds.
+
+Of the 30 catalog queries only q8 filters on a date. `TEMPORAL_QUERIES` adds
+range predicates on the typed date and time columns: posts and comments created
+in a window, `knows` and `hasMember` edges created in one, a person's feed of
+recent posts by the people they know, and birthdays in a range. The queries are
+written in the Kuzu dialect (`timestamp($start)`, `date($min_birthday)`); the Neo4j
+variant uses `datetime()`, and lance-graph compares the columns with the
+literals directly.
+
+For each engine the harness first checks that every column in
+`harness.ldbc.TEMPORAL_COLUMNS` comes back as a temporal type rather than a
+string. It then times the queries, checks that all engines return the same
+rows (exiting with status 1 if not), and writes
+`results/temporal/<system>.json`.
+
+    uv run python -m harness.temporal --engines kuzu,ladybug,lance,neo4j
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import ENGINES, REPO_ROOT, EngineAdapter, get_adapter, parse_engines
+from harness.catalog import DIALECTS, QuerySpec, dialect_text, parse_selection
+from harness.ldbc import EDGE_FILES, TEMPORAL_COLUMNS
+from harness.stats import median_query_ms
+from harness.verify import ResultDigest, agrees, digest_table
+
+TEMPORAL_DIR = REPO_ROOT / "results" / "temporal"
+
+TIMESTAMP_CALL_RE = re.compile(r"\btimestamp\((\$\w+)\)")
+TEMPORAL_CALL_RE = re.compile(r"\b(?:timestamp|date)\((\$\w+)\)")
+
+MAY_2012 = {"start": "2012-05-01T00:00:00", "end": "2012-06-01T00:00:00"}
+
+
+def temporal_spec(idx: int, question: str, cypher: str, params: dict[str, Any]) -> QuerySpec:
+    """A query in the Kuzu dialect, with its Neo4j and lance-graph variants derived."""
+    spec = QuerySpec(idx, question, cypher, params)
+    lance = replace(spec, cypher=TEMPORAL_CALL_RE.sub(r"\1", cypher))
+    return replace(
+        spec,
+        overrides={
+            "neo4j": TIMESTAMP_CALL_RE.sub(r"datetime(\1)", cypher),
+            "lance": dialect_text(lance, DIALECTS["lance"]),
+        },
+    )
+
+
+TEMPORAL_QUERIES: dict[int, QuerySpec] = {
+    spec.idx: spec
+    for spec in (
+        temporal_spec(
+            1,
+            "How many posts were created in May 2012?",
+            """
+            MATCH (p:Post)
+            WHERE p.creationDate >= timestamp($start) AND p.creationDate < timestamp($end)
+            RETURN COUNT(p.ID) AS posts;
+            """,
+            MAY_2012,
+        ),
+        temporal_spec(
+            2,
+            "How many knows edges were created in the first quarter of 2012?",
+            """
+            MATCH (a:Person)-[k:knows]->(b:Person)
+            WHERE k.creationDate >= timestamp($start) AND k.creationDate < timestamp($end)
+            RETURN COUNT(*) AS edges;
+            """,
+            {"start": "2012-01-01T00:00:00", "end": "2012-04-01T00:00:00"},
+        ),
+        temporal_spec(
+            3,
+            "The 10 latest posts in May 2012 by people person 1786706544494 knows.",
+            """
+            MATCH (p:Person)-[:knows]->(f:Person)<-[:postHasCreator]-(post:Post)
+            WHERE p.ID = $person_id
+              AND post.creationDate >= timestamp($start) AND post.creationDate < timestamp($end)
+            RETURN post.ID AS post_id, post.creationDate AS created
+            ORDER BY created DESC, post_id
+            LIMIT 10;
+            """,
+            {"person_id": 1786706544494, **MAY_2012},
+        ),
+        temporal_spec(
+            4,
+            "How many comments tagged Napoleon were created in May 2012?",
+            """
+            MATCH (c:Comment)-[:commentHasTag]->(t:Tag)
+            WHERE t.name = $tag_name
+              AND c.creationDate >= timestamp($start) AND c.creationDate < timestamp($end)
+            RETURN COUNT(c.ID) AS comments;
+            """,
+            {"tag_name": "Napoleon", **MAY_2012},
+        ),
+        temporal_spec(
+            5,
+            "How many forum memberships started in May 2012?",
+            """
+            MATCH (f:Forum)-[m:hasMember]->(p:Person)
+            WHERE m.joinDate >= timestamp($start) AND m.joinDate < timestamp($end)
+            RETURN COUNT(*) AS memberships;
+            """,
+            MAY_2012,
+        ),
+        temporal_spec(
+            6,
+            "How many people of each gender were born in the 1980s?",
+            """
+            MATCH (p:Person)
+            WHERE p.birthday >= date($min_birthday) AND p.birthday < date($max_birthday)
+            RETURN p.gender AS gender, COUNT(p.ID) AS persons
+            ORDER BY gender;
+            """,
+            {"min_birthday": "1980-01-01", "max_birthday": "1990-01-01"},
+        ),
+    )
+}
+
+
+def _column_spec(table: str, column: str) -> QuerySpec:
+    if table in EDGE_FILES:
+        edge = EDGE_FILES[table]
+        pattern = f"(a:{edge.src_label})-[x:{table}]->(b:{edge.dst_label})"
+    else:
+        pattern = f"(x:{table})"
+    return QuerySpec(
+        0,
+        f"One {table}.{column} value.",
+        f"MATCH {pattern} RETURN x.{column} AS value LIMIT 1;",
+    )
+
+
+def column_types(adapter: EngineAdapter) -> dict[str, str]:
+    """Arrow type of each temporal column as the engine returns it."""
+    types = {}
+    for table, columns in TEMPORAL_COLUMNS.items():
+        for column in columns:
+            result = adapter.execute(adapter.prepare(_column_spec(table, column)))
+            types[f"{table}.{column}"] = str(result.schema.field("value").type)
+    return types
+
+
+def is_temporal(type_name: str) -> bool:
+    return type_name.startswith(("timestamp", "date"))
+
+
+def run_engine(
+    adapter: EngineAdapter, queries: list[int], runs: int, warmup: int
+) -> tuple[dict[str, str], dict[int, float], dict[int, ResultDigest]]:
+    types = column_types(adapter)
+    timings: dict[int, float] = {}
+    digests: dict[int, ResultDigest] = {}
+    for idx in queries:
+        timings[idx], result = median_query_ms(adapter, TEMPORAL_QUERIES[idx], runs, warmup)
+        digests[idx] = digest_table(result)
+    return types, timings, digests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Check temporal column types and time the date-range queries."
+    )
+    parser.add_argument(
+        "--engines",
+        "-e",
+        default=",".join(ENGINES),
+        help=f"Comma-separated engines (default: {','.join(ENGINES)})",
+    )
+    parser.add_argument("--queries", "-q", default=None, help="Comma-separated query numbers")
+    parser.add_argument("--runs", "-n", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=TEMPORAL_DIR,
+        help="Directory for the per-engine JSON (default: results/temporal)",
+    )
+    args = parser.parse_args()
+
+    engines = parse_engines(args.engines)
+    queries = parse_selection(args.queries) if args.queries else sorted(TEMPORAL_QUERIES)
+    missing = [idx for idx in queries if idx not in TEMPORAL_QUERIES]
+    if missing:
+        raise SystemExit(f"Unknown temporal query(ies): {missing}")
+
+    systems: dict[str, str] = {}
+    timings: dict[str, dict[int, float]] = {}
+    digests: dict[str, dict[int, ResultDigest]] = {}
+    untyped = 0
+    for engine in engines:
+        adapter = get_adapter(engine)
+        system = systems[engine] = adapter.system_name()
+        adapter.open()
+        try:
+            types, timings[engine], digests[engine] = run_engine(
+                adapter, queries, args.runs, args.warmup
+            )
+        finally:
+            adapter.close()
+        strings = [name for name, type_name in types.items() if not is_temporal(type_name)]
+        untyped += len(strings)
+        print(f"{system}: {len(types) - len(strings)}/{len(types)} temporal columns typed")
+        for name in strings:
+            print(f"  {name} is {types[name]}")
+
+        report = {
+            f"t{idx}": {"ms": timings[engine][idx], "rows": digests[engine][idx].num_rows}
+            for idx in queries
+        }
+        output = args.output_dir / f"{system}.json"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(
+            json.dumps({"system": system, "column_types": types, "queries": report}, indent=2)
+        )
+
+    mismatched = 0
+    header = " | ".join(f"{systems[engine]} (ms)" for engine in engines)
+    print(f"\n| Query | {header} | same |")
+    print("| --- |" + " --- |" * (len(engines) + 1))
+    for idx in queries:
+        same = agrees({engine: digests[engine][idx] for engine in engines})
+        mismatched += not same
+        cells = " | ".join(f"{timings[engine][idx]:.1f}" for engine in engines)
+        print(f"| t{idx} | {cells} | {'yes' if same else 'NO'} |")
+    print(f"\nWrote temporal query timings to {args.output_dir}")
+
+    if mismatched or untyped:
+        print(f"\n{mismatched} queries disagree; {untyped} temporal columns are not typed.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Thread and buffer pool sweep for the embedded engines.
+
+Kuzu and Ladybug run a query on every core and size their buffer pool to most
+of RAM unless told otherwise. This harness reopens the database once per
+(`buffer_pool_size`, `max_num_threads`) setting and times each query, to show
+which queries scale with threads (scans and joins over Comment and Post, e.g.
+q12, q13 and q30) and which are bound by a single pipeline, and so how many
+cores a pod needs.
+
+For each buffer pool size the speedup of a query is its latency at the fewest
+threads swept (1 by default) over its latency at N threads. `best_threads` is
+the fewest threads that get within 10% of the query's fastest time: adding
+cores past it buys little.
+
+    uv run python -m harness.threads --threads 1,2,4,8 --buffer-pool-mb 0,1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from harness.adapters import REPO_ROOT, get_adapter, parse_engines
+from harness.catalog import QUERIES, parse_selection
+from harness.stats import median_query_ms
+
+THREADS_DIR = REPO_ROOT / "results" / "threads"
+
+EMBEDDED_ENGINES = ("kuzu", "ladybug")
+# Latency within this fraction of a query's fastest counts as saturated.
+SATURATION = 0.10
+
+
+def default_threads() -> str:
+    """Powers of two up to the core count, and the core count itself."""
+    cores = os.cpu_count() or 1
+    counts = []
+    n = 1
+    while n < cores:
+        counts.append(n)
+        n *= 2
+    counts.append(cores)
+    return ",".join(str(count) for count in counts)
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def best_threads(latencies: dict[int, float]) -> int:
+    fastest = min(latencies.values())
+    return min(n for n, ms in latencies.items() if ms <= fastest * (1 + SATURATION))
+
+
+def sweep(
+    engine: str,
+    queries: list[int],
+    thread_counts: list[int],
+    buffer_pool_bytes: int,
+    runs: int,
+    warmup: int,
+) -> dict[str, dict[str, Any]]:
+    """Median latency per query and thread count, with speedups over the fewest threads."""
+    latencies: dict[int, dict[int, float]] = {idx: {} for idx in queries}
+    for threads in thread_counts:
+        adapter = get_adapter(engine, buffer_pool_size=buffer_pool_bytes, max_num_threads=threads)
+        adapter.open()
+        try:
+            for idx in queries:
+                latencies[idx][threads], _ = median_query_ms(adapter, QUERIES[idx], runs, warmup)
+        finally:
+            adapter.close()
+
+    baseline = min(thread_counts)
+    report: dict[str, dict[str, Any]] = {}
+    for idx, by_threads in latencies.items():
+        report[f"q{idx}"] = {
+            "ms": {str(n): ms for n, ms in by_threads.items()},
+            "speedup": {str(n): by_threads[baseline] / ms for n, ms in by_threads.items()},
+            "best_threads": best_threads(by_threads),
+        }
+    return report
+
+
+def to_markdown(
+    system: str, buffer_pool_mb: int, thread_counts: list[int], report: dict[str, dict[str, Any]]
+) -> str:
+    pool = f"{buffer_pool_mb} MB buffer pool" if buffer_pool_mb else "default buffer pool"
+    header = " | ".join(f"{n} thr" for n in thread_counts)
+    lines = [
+        f"\n{system}, {pool} (speedup over {min(thread_counts)} thread(s)):",
+        f"| Query | {header} | best threads |",
+        "| --- |" + " --- |" * (len(thread_counts) + 1),
+    ]
+    for name, row in report.items():
+        cells = " | ".join(f"{row['speedup'][str(n)]:.2f}x" for n in thread_counts)
+        lines.append(f"| {name} | {cells} | {row['best_threads']} |")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time the suite on Kuzu/Ladybug across thread counts and buffer pool sizes."
+    )
+    parser.add_argument(
+        "--engines",
+        "-e",
+        default=",".join(EMBEDDED_ENGINES),
+        help=f"Comma-separated engines (default: {','.join(EMBEDDED_ENGINES)})",
+    )
+    parser.add_argument(
+        "--threads",
+        default=default_threads(),
+        help="Comma-separated max_num_threads values (default: powers of two up to the cores)",
+    )
+    parser.add_argument(
+        "--buffer-pool-mb",
+        default="0",
+        help="Comma-separated buffer pool sizes in MB; 0 is the engine default (default: 0)",
+    )
+    parser.add_argument("--queries", "-q", default=None, help="Comma-separated query numbers")
+    parser.add_argument("--runs", "-n", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=THREADS_DIR,
+        help="Directory for the per-engine JSON (default: results/threads)",
+    )
+    args = parser.parse_args()
+
+    engines = parse_engines(args.engines, EMBEDDED_ENGINES)
+    thread_counts = sorted(set(_int_list(args.threads)))
+    if not thread_counts or thread_counts[0] < 1:
+        raise SystemExit("--threads needs positive thread counts")
+    pool_sizes = _int_list(args.buffer_pool_mb)
+    queries = parse_selection(args.queries)
+
+    for engine in engines:
+        system = get_adapter(engine).system_name()
+        configs = []
+        for pool_mb in pool_sizes:
+            report = sweep(engine, queries, thread_counts, pool_mb * 2**20, args.runs, args.warmup)
+            print(to_markdown(system, pool_mb, thread_counts, report))
+            configs.append({"buffer_pool_mb": pool_mb, "queries": report})
+
+        output = args.output_dir / f"{system}.json"
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(
+            json.dumps({"system": system, "threads": thread_counts, "configs": configs}, indent=2)
+        )
+        print(f"Wrote thread sweep to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Top-K for lance-graph aggregates that end in `ORDER BY ... LIMIT k` (q11, q17,
+q19): a full sort of the aggregated groups against a heap-based selection of
+the first k (`LanceAdapter(push_top_k=True)`).
+
+Two parts:
+
+- a micro-benchmark of the two strategies alone, over synthetic aggregates
+  with a growing number of groups, standing in for larger scale factors;
+- the ORDER BY queries run by lance-graph as written, and with the ORDER BY
+  and LIMIT taken out and replaced by the heap selection. Both must return the
+  same rows, except that groups tied at the k-th value may be picked differently.
+
+    uv run python -m harness.topk --groups 1000,100000,10000000 --k 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+
+from harness.adapters import REPO_ROOT, LanceAdapter
+from harness.adapters.lance import TOP_K_RE, select_top_k
+from harness.catalog import DIALECTS, QUERIES, dialect_text, parse_selection
+from harness.stats import median_query_ms
+from harness.verify import digest_table
+
+TOPK_DIR = REPO_ROOT / "results" / "topk"
+ORDER_BY_QUERIES = [
+    idx for idx, spec in QUERIES.items() if TOP_K_RE.search(dialect_text(spec, DIALECTS["lance"]))
+]
+
+
+def synthetic_groups(groups: int, seed: int) -> pa.Table:
+    """One row per group: an id and a skewed count, like a grouped COUNT(*)."""
+    rng = np.random.default_rng(seed)
+    return pa.table(
+        {"group_id": np.arange(groups, dtype=np.int64), "count": rng.zipf(1.5, groups)}
+    )
+
+
+def _median_ms(fn: Callable[[], Any], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def micro_benchmark(groups: list[int], k: int, runs: int, seed: int) -> list[dict[str, Any]]:
+    rows = []
+    for count in groups:
+        table = synthetic_groups(count, seed)
+        sort_ms = _median_ms(
+            lambda: table.sort_by([("count", "descending")]).slice(0, k), runs
+        )
+        heap_ms = _median_ms(lambda: select_top_k(table, "count", True, k), runs)
+        rows.append({"groups": count, "k": k, "full_sort_ms": sort_ms, "top_k_ms": heap_ms})
+    return rows
+
+
+def same_top_k(expected: pa.Table, actual: pa.Table, column: str) -> bool:
+    """
+    Whether two top-k results agree. Groups tied with the k-th value of `column`
+    may be kept by either strategy (q19 has several places with the top count),
+    so results whose rows differ agree if their `column` values are the same.
+    """
+    if digest_table(expected).digest == digest_table(actual).digest:
+        return True
+    values = [table.select([column]) for table in (expected, actual)]
+    return digest_table(values[0]).digest == digest_table(values[1]).digest
+
+
+def compare_queries(
+    adapter: LanceAdapter, queries: list[int], runs: int, warmup: int
+) -> dict[str, dict[str, Any]]:
+    report: dict[str, dict[str, Any]] = {}
+    for idx in queries:
+        top = TOP_K_RE.search(dialect_text(QUERIES[idx], DIALECTS["lance"]))
+        adapter.push_top_k = False
+        sort_ms, sorted_result = median_query_ms(adapter, QUERIES[idx], runs, warmup)
+        adapter.push_top_k = True
+        heap_ms, heap_result = median_query_ms(adapter, QUERIES[idx], runs, warmup)
+        same_rows = digest_table(sorted_result).digest == digest_table(heap_result).digest
+        report[f"q{idx}"] = {
+            "engine_sort_ms": sort_ms,
+            "top_k_ms": heap_ms,
+            "same_rows": same_rows,
+            "same_result": same_rows
+            or (top is not None and same_top_k(sorted_result, heap_result, top.group(1))),
+        }
+    adapter.push_top_k = False
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare full sorts and heap top-K selection.")
+    parser.add_argument(
+        "--groups",
+        default="1000,10000,100000,1000000,10000000",
+        help="Comma-separated group counts for the micro-benchmark",
+    )
+    parser.add_argument("--k", type=int, default=1)
+    parser.add_argument("--runs", "-n", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--queries",
+        "-q",
+        default=None,
+        help=f"ORDER BY ... LIMIT queries to run (default: {ORDER_BY_QUERIES})",
+    )
+    parser.add_argument("--no-queries", action="store_true", help="Only run the micro-benchmark")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output JSON path (default: results/topk/<system>.json)",
+    )
+    args = parser.parse_args()
+
+    groups = [int(float(value)) for value in args.groups.split(",") if value.strip()]
+    micro = micro_benchmark(groups, args.k, args.runs, args.seed)
+    print("| Groups | full sort (ms) | top-k (ms) | speedup |")
+    print("| --- | --- | --- | --- |")
+    for row in micro:
+        speedup = row["full_sort_ms"] / row["top_k_ms"]
+        print(
+            f"| {row['groups']} | {row['full_sort_ms']:.2f} | {row['top_k_ms']:.2f} "
+            f"| {speedup:.1f}x |"
+        )
+
+    adapter = LanceAdapter()
+    system = adapter.system_name()
+    report: dict[str, dict[str, Any]] = {}
+    if not args.no_queries:
+        queries = ORDER_BY_QUERIES if args.queries is None else parse_selection(args.queries)
+        adapter.open()
+        try:
+            report = compare_queries(adapter, queries, args.runs, args.warmup)
+        finally:
+            adapter.close()
+        print(f"\n| Query | {system} ORDER BY (ms) | top-k (ms) | same result |")
+        print("| --- | --- | --- | --- |")
+        for name, row in report.items():
+            print(
+                f"| {name} | {row['engine_sort_ms']:.1f} | {row['top_k_ms']:.1f} "
+                f"| {'yes' if row['same_result'] else 'NO'} |"
+            )
+
+    output = args.output or TOPK_DIR / f"{system}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"system": system, "micro": micro, "queries": report}, indent=2))
+    print(f"\nWrote top-k timings to {output}")
+
+
+if __name__ == "__main__":
+    main()
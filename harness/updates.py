@@ -0,0 +1,193 @@
+"""
+Update stream in the style of the LDBC SNB interactive workload: split the
+dataset at a cutoff date into a snapshot to build each engine from, and a
+remainder that is replayed as timestamped insert batches.
+
+Every dynamic row gets an event time. For a node, this is its `creationDate`.
+For an edge, it is the latest of three times: the edge's own `creationDate` or
+`joinDate`, and the creation times of both endpoints. So a post's tags and
+creator edge arrive together with the post. Static rows (places, tags,
+organisations, ...) have no event time and always belong to the snapshot.
+
+The output directory holds:
+
+- `csv/`: the rows before the cutoff, in the same layout as the full dataset.
+  Lines are copied verbatim, so every engine's loader sees the rows unchanged.
+- `stream/nodes/<Label>.parquet` and `stream/edges/<relType>.parquet`: the
+  rows from the cutoff on, sorted by a `ts` column. Edge endpoints are renamed
+  to `src` and `dst`.
+
+    uv run python -m harness.updates --cutoff 2012-06-01
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from harness.adapters import REPO_ROOT
+from harness.ldbc import CSV_ROOT, DELIMITER, EDGE_FILES, NODE_FILES
+
+UPDATES_ROOT = REPO_ROOT / "updates"
+TS_FORMAT = "%Y-%m-%dT%H:%M:%S%.3f%z"
+# Rows are inserted in this order within a batch so edge endpoints exist first.
+NODE_ORDER = ("Person", "Forum", "Post", "Comment")
+
+
+@dataclass
+class UpdateBatch:
+    start: datetime
+    end: datetime
+    nodes: dict[str, pa.Table] = field(default_factory=dict)
+    edges: dict[str, pa.Table] = field(default_factory=dict)
+
+    @property
+    def num_rows(self) -> int:
+        tables = [*self.nodes.values(), *self.edges.values()]
+        return sum(table.num_rows for table in tables)
+
+    def ordered_nodes(self) -> list[tuple[str, pa.Table]]:
+        return sorted(self.nodes.items(), key=lambda item: NODE_ORDER.index(item[0]))
+
+
+def _read_csv(path: Path) -> pl.DataFrame:
+    return pl.read_csv(path, separator=DELIMITER, infer_schema_length=10_000)
+
+
+def _copy_rows(src: Path, dst: Path, keep: list[bool]) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with src.open("r", encoding="utf-8") as fin, dst.open("w", encoding="utf-8") as fout:
+        fout.write(fin.readline())
+        for line, kept in zip(fin, keep, strict=True):
+            if kept:
+                fout.write(line)
+
+
+def split_dataset(cutoff: datetime, csv_root: Path, output: Path) -> dict[str, tuple[int, int]]:
+    """Write the snapshot CSVs and the update stream; returns (snapshot, stream) row counts."""
+    snapshot_root = output / "csv"
+    stream_root = output / "stream"
+    counts: dict[str, tuple[int, int]] = {}
+    created: dict[str, pl.DataFrame] = {}
+
+    def _write(name: str, kind: str, path: Path, frame: pl.DataFrame) -> None:
+        keep = frame["ts"].is_null() | (frame["ts"] < cutoff)
+        _copy_rows(csv_root / path, snapshot_root / path, keep.to_list())
+        stream = frame.filter(~keep).sort("ts")
+        target = stream_root / kind / f"{name}.parquet"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        stream.write_parquet(target)
+        counts[name] = (int(keep.sum()), stream.height)
+
+    for node in NODE_FILES.values():
+        frame = _read_csv(csv_root / node.path)
+        if node.timestamp is None:
+            frame = frame.with_columns(ts=pl.lit(None, dtype=pl.Datetime("us", "UTC")))
+        else:
+            frame = frame.with_columns(
+                ts=pl.col(node.timestamp).str.to_datetime(TS_FORMAT, time_unit="us")
+            )
+            created[node.label] = frame.select("id", "ts")
+        _write(node.label, "nodes", node.path, frame)
+
+    for edge in EDGE_FILES.values():
+        frame = _read_csv(csv_root / edge.path).with_row_index("_row")
+        src, dst = frame.columns[1:3]
+        frame = frame.rename({src: "src", dst: "dst"})
+        times: list[pl.Expr] = []
+        if edge.timestamp is not None:
+            times.append(pl.col(edge.timestamp).str.to_datetime(TS_FORMAT, time_unit="us"))
+        for end, label in (("src", edge.src_label), ("dst", edge.dst_label)):
+            if label in created:
+                frame = frame.join(
+                    created[label].rename({"id": end, "ts": f"{end}_ts"}), on=end, how="left"
+                )
+                times.append(pl.col(f"{end}_ts"))
+        ts = pl.max_horizontal(times) if times else pl.lit(None, dtype=pl.Datetime("us", "UTC"))
+        # Joins don't promise to keep row order, which the snapshot copy relies on.
+        frame = frame.with_columns(ts=ts).sort("_row")
+        frame = frame.drop(["_row", "src_ts", "dst_ts"], strict=False)
+        _write(edge.rel_type, "edges", edge.path, frame)
+    return counts
+
+
+def _split_table(table: pa.Table) -> tuple[pa.Table, list[int]]:
+    ts = table.column("ts").cast(pa.timestamp("us", "UTC")).cast(pa.int64()).to_pylist()
+    return table.drop_columns(["ts"]), ts
+
+
+def iter_batches(stream_dir: Path, window: timedelta) -> Iterator[UpdateBatch]:
+    """Yield the stream in time order, one batch per `window` of event time."""
+    tables: dict[tuple[str, str], tuple[pa.Table, list[int]]] = {}
+    for kind in ("nodes", "edges"):
+        for path in sorted((stream_dir / kind).glob("*.parquet")):
+            table = pq.read_table(path)
+            if table.num_rows:
+                tables[(kind, path.stem)] = _split_table(table)
+    if not tables:
+        return
+    first = min(ts[0] for _, ts in tables.values())
+    last = max(ts[-1] for _, ts in tables.values())
+    step = int(window / timedelta(microseconds=1))
+    positions = {key: 0 for key in tables}
+    for start in range(first, last + 1, step):
+        end = start + step
+        batch = UpdateBatch(
+            start=datetime.fromtimestamp(start / 1e6, UTC),
+            end=datetime.fromtimestamp(end / 1e6, UTC),
+        )
+        for (kind, name), (table, ts) in tables.items():
+            lo = positions[(kind, name)]
+            hi = bisect.bisect_left(ts, end, lo)
+            if hi > lo:
+                getattr(batch, kind)[name] = table.slice(lo, hi - lo)
+                positions[(kind, name)] = hi
+        if batch.num_rows:
+            yield batch
+
+
+def stream_size(stream_dir: Path) -> int:
+    return sum(
+        pq.read_metadata(path).num_rows for path in stream_dir.glob("*/*.parquet")
+    )
+
+
+def parse_cutoff(text: str) -> datetime:
+    return datetime.fromisoformat(text).replace(tzinfo=UTC)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Split the LDBC CSVs at a cutoff into a snapshot and a timestamped update stream."
+    )
+    parser.add_argument("--cutoff", required=True, help="ISO date, e.g. 2012-06-01")
+    parser.add_argument("--csv-root", type=Path, default=CSV_ROOT)
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output directory (default: updates/<cutoff>)",
+    )
+    args = parser.parse_args()
+
+    cutoff = parse_cutoff(args.cutoff)
+    output = args.output or UPDATES_ROOT / args.cutoff
+    counts = split_dataset(cutoff, args.csv_root, output)
+    width = max(len(name) for name in counts)
+    for name, (snapshot, stream) in counts.items():
+        print(f"{name:<{width}}  snapshot {snapshot:>9}  stream {stream:>9}")
+    total = sum(stream for _, stream in counts.values())
+    print(f"\nWrote the snapshot to {output / 'csv'} and {total} updates to {output / 'stream'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Cross-engine result-equivalence check: run every query on every engine and
+compare the results.
+
+Each result is normalized before it is compared: column names are lowercased
+(lance-graph lowercases properties), integers are widened to int64, floats to
+float64, timestamps to UTC microseconds, strings and temporal values are cast
+to string, and the rows are sorted on every column. The normalized table is then hashed one serialized
+Arrow record batch at a time, so large results are compared without turning
+rows into Python objects. Only the digest, row count and a few sample rows are
+kept per query, and engines are opened one at a time.
+
+    uv run python -m harness.verify --engines kuzu,ladybug,lance --queries 1,7,30
+
+`--param name=value` overrides a parameter in every selected query that uses it,
+to check a new binding against all engines before benchmarking it:
+
+    uv run python -m harness.verify --queries 7 --param person_id=933
+
+The exit status is 1 if any query disagrees between engines.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from harness.adapters import ENGINES, EngineAdapter, get_adapter, parse_engines
+from harness.catalog import QUERIES, parse_selection
+
+BATCH_ROWS = 64 * 1024
+SAMPLE_ROWS = 5
+
+
+@dataclass
+class ResultDigest:
+    digest: str
+    num_rows: int
+    columns: list[str]
+    sample: list[dict[str, Any]] = field(default_factory=list)
+    error: str | None = None
+
+
+def _normalize_type(array: pa.ChunkedArray) -> pa.ChunkedArray:
+    dtype = array.type
+    if pa.types.is_integer(dtype):
+        return array.cast(pa.int64())
+    if pa.types.is_floating(dtype) or pa.types.is_decimal(dtype):
+        return array.cast(pa.float64())
+    if pa.types.is_dictionary(dtype):
+        return _normalize_type(array.cast(dtype.value_type))
+    if pa.types.is_timestamp(dtype):
+        # Engines differ in unit and time zone; compare instants as UTC microseconds.
+        array = array.cast(pa.timestamp("us", dtype.tz)).cast(pa.timestamp("us"))
+        return array.cast(pa.string())
+    if (
+        pa.types.is_string(dtype)
+        or pa.types.is_large_string(dtype)
+        or pa.types.is_string_view(dtype)
+        or pa.types.is_temporal(dtype)
+    ):
+        return array.cast(pa.string())
+    return array
+
+
+def normalize(table: pa.Table) -> pa.Table:
+    """Lowercase column names, unify types and sort rows on every column."""
+    columns = [_normalize_type(column) for column in table.columns]
+    names = [name.lower() for name in table.column_names]
+    schema = pa.schema([pa.field(name, column.type) for name, column in zip(names, columns)])
+    normalized = pa.Table.from_arrays(columns, schema=schema)
+    if normalized.num_rows > 1 and names:
+        sort_keys = [(name, "ascending") for name in names]
+        normalized = normalized.take(pc.sort_indices(normalized, sort_keys=sort_keys))
+    return normalized.combine_chunks()
+
+
+_NULL_FILL = {pa.int64(): 0, pa.float64(): 0.0, pa.string(): "", pa.int8(): 0}
+
+
+def _byte_exact(batch: pa.RecordBatch) -> pa.RecordBatch:
+    """
+    Bitmaps (bool values, validity) may carry arbitrary bits past the last
+    row, which would leak into the serialized bytes. Store bools as int8 and
+    nulls as an int8 validity column plus a filled value column instead.
+    """
+    arrays: list[pa.Array] = []
+    names: list[str] = []
+    for name, column in zip(batch.schema.names, batch.columns):
+        if pa.types.is_boolean(column.type):
+            column = column.cast(pa.int8())
+        if column.null_count:
+            arrays.append(pc.is_valid(column).cast(pa.int8()))
+            names.append(f"{name}#valid")
+            column = pc.fill_null(column, _NULL_FILL.get(column.type, 0))
+        arrays.append(column)
+        names.append(name)
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def digest_table(table: pa.Table) -> ResultDigest:
+    normalized = normalize(table)
+    hasher = hashlib.sha256()
+    hasher.update("\x1f".join(normalized.column_names).encode())
+    # An empty result has no batches, so it hashes the same whatever types the
+    # engine reported for it.
+    for batch in normalized.to_batches(max_chunksize=BATCH_ROWS):
+        hasher.update(_byte_exact(batch).serialize())
+    return ResultDigest(
+        digest=hasher.hexdigest(),
+        num_rows=normalized.num_rows,
+        columns=normalized.column_names,
+        sample=normalized.slice(0, SAMPLE_ROWS).to_pylist(),
+    )
+
+
+def digest_engine(
+    adapter: EngineAdapter,
+    queries: list[int],
+    overrides: Mapping[str, Any],
+) -> dict[int, ResultDigest]:
+    digests: dict[int, ResultDigest] = {}
+    for idx in queries:
+        spec = QUERIES[idx]
+        params = {name: value for name, value in overrides.items() if name in spec.params}
+        try:
+            result = adapter.execute(adapter.prepare(spec, params))
+        except Exception as exc:  # noqa: BLE001 - reported as a mismatch
+            digests[idx] = ResultDigest("", 0, [], error=f"{type(exc).__name__}: {exc}")
+            continue
+        digests[idx] = digest_table(result)
+    return digests
+
+
+def agrees(digests: Mapping[str, ResultDigest]) -> bool:
+    values = list(digests.values())
+    return all(value.error is None for value in values) and (
+        len({value.digest for value in values}) == 1
+    )
+
+
+def _describe(digest: ResultDigest) -> str:
+    if digest.error is not None:
+        return f"error: {digest.error}"
+    return f"{digest.num_rows} rows, {digest.digest[:12]}, first rows: {digest.sample}"
+
+
+def parse_param(text: str) -> tuple[str, Any]:
+    name, sep, value = text.partition("=")
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"Expected name=value, got {text!r}")
+    try:
+        return name, int(value)
+    except ValueError:
+        return name, value
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check that every engine returns the same results.")
+    parser.add_argument(
+        "--engines",
+        "-e",
+        default=",".join(ENGINES),
+        help=f"Comma-separated engines to compare (default: {','.join(ENGINES)})",
+    )
+    parser.add_argument(
+        "--queries", "-q", default=None, help="Comma-separated query numbers (default: all)"
+    )
+    parser.add_argument(
+        "--param",
+        "-p",
+        action="append",
+        type=parse_param,
+        default=[],
+        help="Override a query parameter, e.g. person_id=933 (repeatable)",
+    )
+    args = parser.parse_args()
+
+    engines = parse_engines(args.engines)
+    queries = parse_selection(args.queries)
+    overrides = dict(args.param)
+    unused = [name for name in overrides if not any(name in QUERIES[idx].params for idx in queries)]
+    if unused:
+        raise SystemExit(f"No selected query takes parameter(s): {unused}")
+
+    by_engine: dict[str, dict[int, ResultDigest]] = {}
+    for engine in engines:
+        adapter = get_adapter(engine)
+        adapter.open()
+        try:
+            by_engine[adapter.system_name()] = digest_engine(adapter, queries, overrides)
+        finally:
+            adapter.close()
+
+    systems = list(by_engine)
+    lines = [
+        "| Query | " + " | ".join(systems) + " | Match |",
+        "| --- | " + " | ".join("---" for _ in systems) + " | --- |",
+    ]
+    mismatched: list[int] = []
+    for idx in queries:
+        digests = {system: by_engine[system][idx] for system in systems}
+        ok = agrees(digests)
+        if not ok:
+            mismatched.append(idx)
+        cells = [
+            "error" if d.error is not None else f"{d.num_rows} rows `{d.digest[:8]}`"
+            for d in digests.values()
+        ]
+        lines.append(f"| q{idx} | " + " | ".join(cells) + f" | {'yes' if ok else 'NO'} |")
+    print("\n".join(lines))
+
+    for idx in mismatched:
+        print(f"\nq{idx} differs:")
+        for system in systems:
+            print(f"  {system}: {_describe(by_engine[system][idx])}")
+
+    if mismatched:
+        print(f"\n{len(mismatched)} of {len(queries)} queries differ between engines.")
+        sys.exit(1)
+    print(f"\nAll {len(queries)} queries agree across {len(systems)} engines.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Materialized views: derived edge tables for multi-hop patterns that several
+queries recompute, plus query variants that read them.
+
+- `commentRepliesToPostBy` (Comment -> Person, the comment's creator), with the
+  `post` replied to and that post's creator as `postCreator`. It folds
+  comment->replyOfPost->post->postHasCreator and comment->commentHasCreator
+  into one edge, for q22 and q30.
+- `commentOnPostTagged` (Comment -> Tag), one edge per tag of the post the
+  comment replies to, with the `post` in between. It folds
+  comment->replyOfPost->post->postHasTag, for q10.
+
+The views are written once as CSVs in the LDBC layout under `csv/views/`; each
+build script loads them when given `--views`. `compare` runs each query with and
+without its view on one engine, and checks that both return the same rows.
+
+    uv run python -m harness.views materialize
+    uv run python -m harness.views compare --engine kuzu
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from harness.adapters import ADAPTERS, REPO_ROOT, EngineAdapter, get_adapter
+from harness.catalog import QUERIES, QuerySpec
+from harness.ldbc import CSV_ROOT, DELIMITER, EDGE_FILES
+from harness.stats import median_query_ms
+from harness.verify import digest_table
+
+VIEWS_DIR = REPO_ROOT / "results" / "views"
+
+
+@dataclass(frozen=True)
+class View:
+    rel_type: str
+    # File under the CSV root, named like the LDBC edge files so every build
+    # script derives the same dataset and table names from it.
+    path: Path
+    src_label: str
+    dst_label: str
+
+
+VIEWS: dict[str, View] = {
+    view.rel_type: view
+    for view in (
+        View(
+            "commentRepliesToPostBy",
+            Path("views/comment_repliesToPostBy_person_0_0.csv"),
+            "Comment",
+            "Person",
+        ),
+        View(
+            "commentOnPostTagged",
+            Path("views/comment_onPostTagged_tag_0_0.csv"),
+            "Comment",
+            "Tag",
+        ),
+    )
+}
+
+# Variants of catalog queries that read a view; same index, parameters and
+# output columns as the query they replace.
+VIEW_QUERIES: dict[int, QuerySpec] = {
+    spec.idx: spec
+    for spec in (
+        QuerySpec(
+            10,
+            QUERIES[10].question,
+            """
+            MATCH (t:Tag)<-[:commentOnPostTagged]-(c:Comment)-[:commentHasCreator]->(p:Person)
+            WHERE t.name = $tag_name
+            RETURN DISTINCT p.ID;
+            """,
+            QUERIES[10].params,
+        ),
+        QuerySpec(
+            22,
+            QUERIES[22].question,
+            """
+            MATCH (o:Organisation)<-[:workAt]-(p:Person)<-[:commentRepliesToPostBy]-(c:Comment)
+            WHERE o.name = $organization_name
+            RETURN COUNT(DISTINCT c.ID) > 0 AS has_reply_comment;
+            """,
+            QUERIES[22].params,
+        ),
+        QuerySpec(
+            30,
+            QUERIES[30].question,
+            """
+            MATCH (c:Comment)-[r:commentRepliesToPostBy]->(p:Person)
+            WHERE r.postCreator = p.ID
+            RETURN COUNT(DISTINCT c.ID) > 0 AS has_self_reply;
+            """,
+            QUERIES[30].params,
+        ),
+    )
+}
+
+
+def _edges(csv_root: Path, rel_type: str, src: str, dst: str) -> pl.DataFrame:
+    frame = pl.read_csv(csv_root / EDGE_FILES[rel_type].path, separator=DELIMITER)
+    return frame.select(pl.col(frame.columns[0]).alias(src), pl.col(frame.columns[1]).alias(dst))
+
+
+def compute_views(csv_root: Path) -> dict[str, pl.DataFrame]:
+    replies = _edges(csv_root, "replyOfPost", "comment", "post")
+    comment_creator = _edges(csv_root, "commentHasCreator", "comment", "creator")
+    post_creator = _edges(csv_root, "postHasCreator", "post", "postCreator")
+    post_tags = _edges(csv_root, "postHasTag", "post", "tag")
+    return {
+        "commentRepliesToPostBy": replies.join(comment_creator, on="comment")
+        .join(post_creator, on="post")
+        .select(
+            pl.col("comment").alias("Comment.id"),
+            pl.col("creator").alias("Person.id"),
+            "post",
+            "postCreator",
+        ),
+        "commentOnPostTagged": replies.join(post_tags, on="post").select(
+            pl.col("comment").alias("Comment.id"), pl.col("tag").alias("Tag.id"), "post"
+        ),
+    }
+
+
+def materialize(csv_root: Path) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for rel_type, frame in compute_views(csv_root).items():
+        target = csv_root / VIEWS[rel_type].path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        frame.write_csv(target, separator=DELIMITER)
+        counts[rel_type] = frame.height
+    return counts
+
+
+def compare(adapter: EngineAdapter, runs: int, warmup: int) -> dict[str, dict[str, Any]]:
+    report: dict[str, dict[str, Any]] = {}
+    for idx, view_spec in VIEW_QUERIES.items():
+        base_ms, base = median_query_ms(adapter, QUERIES[idx], runs, warmup)
+        view_ms, viewed = median_query_ms(adapter, view_spec, runs, warmup)
+        report[f"q{idx}"] = {
+            "without_views_ms": base_ms,
+            "with_views_ms": view_ms,
+            "same_result": digest_table(base).digest == digest_table(viewed).digest,
+        }
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Materialize derived edge tables and time them.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("materialize", help="Write the view CSVs under the CSV root")
+    build.add_argument("--csv-root", type=Path, default=CSV_ROOT)
+    run = commands.add_parser("compare", help="Time each query with and without its view")
+    run.add_argument("--engine", "-e", required=True, choices=sorted(ADAPTERS))
+    run.add_argument("--location", default=None, help="Database built with --views")
+    run.add_argument("--runs", "-n", type=int, default=10)
+    run.add_argument("--warmup", type=int, default=2)
+    run.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output JSON path (default: results/views/<system>.json)",
+    )
+    args = parser.parse_args()
+
+    if args.command == "materialize":
+        for rel_type, rows in materialize(args.csv_root).items():
+            print(f"{rel_type}: {rows} edges -> {args.csv_root / VIEWS[rel_type].path}")
+        return
+
+    adapter = get_adapter(args.engine, args.location)
+    system = adapter.system_name()
+    adapter.open()
+    try:
+        report = compare(adapter, args.runs, args.warmup)
+    finally:
+        adapter.close()
+
+    print(f"| Query | {system} without views (ms) | with views (ms) | speedup | same result |")
+    print("| --- | --- | --- | --- | --- |")
+    for name, row in report.items():
+        speedup = row["without_views_ms"] / row["with_views_ms"]
+        print(
+            f"| {name} | {row['without_views_ms']:.1f} | {row['with_views_ms']:.1f} "
+            f"| {speedup:.1f}x | {'yes' if row['same_result'] else 'NO'} |"
+        )
+
+    output = args.output or VIEWS_DIR / f"{system}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"system": system, "queries": report}, indent=2))
+    print(f"\nWrote view timings to {output}")
+
+
+if __name__ == "__main__":
+    main()
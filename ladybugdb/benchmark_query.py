@@ -1,26 +1,24 @@
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Any, Iterable
 
 import pytest
-import ladybug as lb
 
-import query
-
-DB_PATH = Path(__file__).with_name("ldbc_snb_sf1.lbdb")
+from harness.adapters import EngineAdapter, LadybugAdapter
+from harness.catalog import QUERIES
 
 
 @pytest.fixture(scope="session")
-def connection():
-    db = lb.Database(str(DB_PATH))
-    conn = lb.Connection(db)
-    yield conn
+def adapter():
+    adapter = LadybugAdapter()
+    adapter.open()
+    yield adapter
+    adapter.close()
 
 
 def _rows(result: Any) -> list[dict[str, Any]]:
-    if hasattr(result, "to_dicts"):
-        return result.to_dicts()
+    if hasattr(result, "to_pylist"):
+        return result.to_pylist()
     return result
 
 
@@ -47,8 +45,14 @@ def _assert_single_value(result: Any, key: str, expected_value: Any) -> None:
     assert rows == [{key: expected_value}]
 
 
-def test_benchmark_query1(benchmark, connection):
-    result = benchmark(query.run_query1, connection)
+def _bench(benchmark, adapter: EngineAdapter, idx: int) -> Any:
+    # Rendering the query text is not part of what is timed.
+    prepared = adapter.prepare(QUERIES[idx])
+    return benchmark(adapter.execute, prepared)
+
+
+def test_benchmark_query1(benchmark, adapter):
+    result = _bench(benchmark, adapter, 1)
     _assert_rows(
         result,
         [{"p.firstName": "Thomas", "p.lastName": "Brown"}],
@@ -56,8 +60,8 @@ def test_benchmark_query1(benchmark, connection):
     )
 
 
-def test_benchmark_query2(benchmark, connection):
-    result = benchmark(query.run_query2, connection)
+def test_benchmark_query2(benchmark, adapter):
+    result = _bench(benchmark, adapter, 2)
     _assert_rows(
         result,
         [
@@ -67,8 +71,8 @@ def test_benchmark_query2(benchmark, connection):
     )
 
 
-def test_benchmark_query3(benchmark, connection):
-    result = benchmark(query.run_query3, connection)
+def test_benchmark_query3(benchmark, adapter):
+    result = _bench(benchmark, adapter, 3)
     _assert_rows(
         result,
         [
@@ -82,13 +86,13 @@ def test_benchmark_query3(benchmark, connection):
     )
 
 
-def test_benchmark_query4(benchmark, connection):
-    result = benchmark(query.run_query4, connection)
+def test_benchmark_query4(benchmark, adapter):
+    result = _bench(benchmark, adapter, 4)
     _assert_rows(result, [{"c.ID": 1924145496676}], order_sensitive=True)
 
 
-def test_benchmark_query5(benchmark, connection):
-    result = benchmark(query.run_query5, connection)
+def test_benchmark_query5(benchmark, adapter):
+    result = _bench(benchmark, adapter, 5)
     _assert_rows(
         result,
         [{"p.firstName": "Akihiko", "p.lastName": "Choi"}],
@@ -96,8 +100,8 @@ def test_benchmark_query5(benchmark, connection):
     )
 
 
-def test_benchmark_query6(benchmark, connection):
-    result = benchmark(query.run_query6, connection)
+def test_benchmark_query6(benchmark, adapter):
+    result = _bench(benchmark, adapter, 6)
     _assert_rows(
         result,
         [
@@ -110,18 +114,18 @@ def test_benchmark_query6(benchmark, connection):
     )
 
 
-def test_benchmark_query7(benchmark, connection):
-    result = benchmark(query.run_query7, connection)
+def test_benchmark_query7(benchmark, adapter):
+    result = _bench(benchmark, adapter, 7)
     _assert_rows(result, [])
 
 
-def test_benchmark_query8(benchmark, connection):
-    result = benchmark(query.run_query8, connection)
+def test_benchmark_query8(benchmark, adapter):
+    result = _bench(benchmark, adapter, 8)
     _assert_rows(result, [{"p.ID": 13194139534410}], order_sensitive=True)
 
 
-def test_benchmark_query9(benchmark, connection):
-    result = benchmark(query.run_query9, connection)
+def test_benchmark_query9(benchmark, adapter):
+    result = _bench(benchmark, adapter, 9)
     _assert_rows(
         result,
         [{"p.ID": 1242, "p.firstName": "Hans", "p.lastName": "Johansson"}],
@@ -129,8 +133,8 @@ def test_benchmark_query9(benchmark, connection):
     )
 
 
-def test_benchmark_query10(benchmark, connection):
-    result = benchmark(query.run_query10, connection)
+def test_benchmark_query10(benchmark, adapter):
+    result = _bench(benchmark, adapter, 10)
     _assert_rows(
         result,
         [
@@ -141,101 +145,101 @@ def test_benchmark_query10(benchmark, connection):
     )
 
 
-def test_benchmark_query11(benchmark, connection):
-    result = benchmark(query.run_query11, connection)
+def test_benchmark_query11(benchmark, adapter):
+    result = _bench(benchmark, adapter, 11)
     _assert_rows(result, [{"num_e": 190, "o.name": "MDLR_Airlines"}])
 
 
-def test_benchmark_query12(benchmark, connection):
-    result = benchmark(query.run_query12, connection)
+def test_benchmark_query12(benchmark, adapter):
+    result = _bench(benchmark, adapter, 12)
     _assert_single_value(result, "num_comments", 3229)
 
 
-def test_benchmark_query13(benchmark, connection):
-    result = benchmark(query.run_query13, connection)
+def test_benchmark_query13(benchmark, adapter):
+    result = _bench(benchmark, adapter, 13)
     _assert_single_value(result, "num_persons", 2293)
 
 
-def test_benchmark_query14(benchmark, connection):
-    result = benchmark(query.run_query14, connection)
+def test_benchmark_query14(benchmark, adapter):
+    result = _bench(benchmark, adapter, 14)
     _assert_single_value(result, "num_forums", 37)
 
 
-def test_benchmark_query15(benchmark, connection):
-    result = benchmark(query.run_query15, connection)
+def test_benchmark_query15(benchmark, adapter):
+    result = _bench(benchmark, adapter, 15)
     _assert_single_value(result, "num_forums", 278)
 
 
-def test_benchmark_query16(benchmark, connection):
-    result = benchmark(query.run_query16, connection)
+def test_benchmark_query16(benchmark, adapter):
+    result = _bench(benchmark, adapter, 16)
     _assert_single_value(result, "num_posts", 3)
 
 
-def test_benchmark_query17(benchmark, connection):
-    result = benchmark(query.run_query17, connection)
+def test_benchmark_query17(benchmark, adapter):
+    result = _bench(benchmark, adapter, 17)
     _assert_rows(result, [{"t.name": "Hamid_Karzai", "tag_count": 32}])
 
 
-def test_benchmark_query18(benchmark, connection):
-    result = benchmark(query.run_query18, connection)
+def test_benchmark_query18(benchmark, adapter):
+    result = _bench(benchmark, adapter, 18)
     _assert_single_value(result, "num_p", 20)
 
 
-def test_benchmark_query19(benchmark, connection):
-    result = benchmark(query.run_query19, connection)
+def test_benchmark_query19(benchmark, adapter):
+    result = _bench(benchmark, adapter, 19)
     _assert_rows(result, [{"l.name": "India", "comment_count": 242}])
 
 
-def test_benchmark_query20(benchmark, connection):
-    result = benchmark(query.run_query20, connection)
+def test_benchmark_query20(benchmark, adapter):
+    result = _bench(benchmark, adapter, 20)
     _assert_single_value(result, "long_comment_count", 3)
 
 
-def test_benchmark_query21(benchmark, connection):
-    result = benchmark(query.run_query21, connection)
+def test_benchmark_query21(benchmark, adapter):
+    result = _bench(benchmark, adapter, 21)
     _assert_single_value(result, "liked", True)
 
 
-def test_benchmark_query22(benchmark, connection):
-    result = benchmark(query.run_query22, connection)
+def test_benchmark_query22(benchmark, adapter):
+    result = _bench(benchmark, adapter, 22)
     _assert_single_value(result, "has_reply_comment", True)
 
 
-def test_benchmark_query23(benchmark, connection):
-    result = benchmark(query.run_query23, connection)
+def test_benchmark_query23(benchmark, adapter):
+    result = _bench(benchmark, adapter, 23)
     _assert_single_value(result, "has_moderator", True)
 
 
-def test_benchmark_query24(benchmark, connection):
-    result = benchmark(query.run_query24, connection)
+def test_benchmark_query24(benchmark, adapter):
+    result = _bench(benchmark, adapter, 24)
     _assert_single_value(result, "has_person", False)
 
 
-def test_benchmark_query25(benchmark, connection):
-    result = benchmark(query.run_query25, connection)
+def test_benchmark_query25(benchmark, adapter):
+    result = _bench(benchmark, adapter, 25)
     _assert_single_value(result, "knows_someone", False)
 
 
-def test_benchmark_query26(benchmark, connection):
-    result = benchmark(query.run_query26, connection)
+def test_benchmark_query26(benchmark, adapter):
+    result = _bench(benchmark, adapter, 26)
     _assert_single_value(result, "has_forum", False)
 
 
-def test_benchmark_query27(benchmark, connection):
-    result = benchmark(query.run_query27, connection)
+def test_benchmark_query27(benchmark, adapter):
+    result = _bench(benchmark, adapter, 27)
     _assert_single_value(result, "has_comment", True)
 
 
-def test_benchmark_query28(benchmark, connection):
-    result = benchmark(query.run_query28, connection)
+def test_benchmark_query28(benchmark, adapter):
+    result = _bench(benchmark, adapter, 28)
     _assert_single_value(result, "has_people", True)
 
 
-def test_benchmark_query29(benchmark, connection):
-    result = benchmark(query.run_query29, connection)
+def test_benchmark_query29(benchmark, adapter):
+    result = _bench(benchmark, adapter, 29)
     _assert_single_value(result, "has_written_post_with_safari", False)
 
 
-def test_benchmark_query30(benchmark, connection):
-    result = benchmark(query.run_query30, connection)
+def test_benchmark_query30(benchmark, adapter):
+    result = _bench(benchmark, adapter, 30)
     _assert_single_value(result, "has_self_reply", True)
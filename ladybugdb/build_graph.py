@@ -1,3 +1,5 @@
+import argparse
+import shutil
 from pathlib import Path
 
 import ladybug as lb
@@ -9,6 +11,8 @@ def setup_db(db_name: str, overwrite: bool = True) -> lb.Connection:
     """
     if overwrite:
         Path(db_name).unlink(missing_ok=True)
+        # Cardinalities of the previous build; `keep_cardinalities` writes new ones.
+        Path(f"{db_name}.stats.json").unlink(missing_ok=True)
     db = lb.Database(db_name)
     conn = lb.Connection(db)
 
@@ -27,12 +31,74 @@ def ingest_data(conn: lb.Connection, data_path: str):
     with open("./etl/copy.cypher", "r") as f:
         copy_ddl = f.read()
     assert copy_ddl.startswith("COPY")
-    conn.execute(copy_ddl)
+    # copy.cypher points at the full dataset; rebase it onto `data_path`.
+    conn.execute(copy_ddl.replace("'../csv/", f"'{Path(data_path).as_posix()}/"))
     print("Data ingested successfully.")
 
 
+def create_views(conn: lb.Connection, data_path: str):
+    """
+    Create and load the materialized views written by `harness.views`.
+    """
+    with open("./etl/views.cypher", "r") as f:
+        views_ddl = f.read()
+    conn.execute(views_ddl.replace("'../csv/", f"'{Path(data_path).as_posix()}/"))
+    print("Views created successfully.")
+
+
+def add_statistics(conn: lb.Connection, data_path: str):
+    """
+    Add the per-node degree columns written by `harness.ingest_stats`.
+    """
+    stats = Path(data_path) / "stats"
+    for path in sorted((stats / "degrees").glob("*.csv")):
+        label = path.stem
+        with open(path, "r") as f:
+            columns = f.readline().strip().split("|")[1:]
+        for column in columns:
+            conn.execute(f"ALTER TABLE {label} ADD {column} INT64 DEFAULT 0;")
+        assignments = ", ".join(f"n.{column} = {column}" for column in columns)
+        conn.execute(
+            f"LOAD FROM '{path.as_posix()}' (header=true, delim='|') "
+            f"MATCH (n:{label}) WHERE n.ID = id SET {assignments};"
+        )
+    print("Statistics added successfully.")
+
+
+def keep_cardinalities(data_path: str, db_name: str):
+    """
+    Keep the table cardinalities written by `harness.ingest_stats` next to the
+    database, in `<db>.stats.json`. Run after the database is closed: readers
+    ignore the file once the database has been written after it.
+    """
+    shutil.copyfile(Path(data_path) / "stats" / "cardinality.json", f"{db_name}.stats.json")
+
+
 if __name__ == "__main__":
-    DB_NAME = "ldbc_snb_sf1.lbdb"
-    DATA_PATH = "../csv"
-    conn = setup_db(DB_NAME, overwrite=True)
-    ingest_data(conn, DATA_PATH)
+    parser = argparse.ArgumentParser("Build Ladybug graph from files")
+    parser.add_argument("--db", default="ldbc_snb_sf1.lbdb", help="Database to create")
+    parser.add_argument(
+        "--csv",
+        default="../csv",
+        help="CSV root, e.g. a snapshot written by harness.updates",
+    )
+    parser.add_argument(
+        "--views", action="store_true", help="Also load the materialized views in csv/views"
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="Add the degree columns and cardinalities in csv/stats"
+    )
+    args = parser.parse_args()
+
+    conn = setup_db(args.db, overwrite=True)
+    ingest_data(conn, args.csv)
+    if args.views:
+        create_views(conn, args.csv)
+    if args.stats:
+        add_statistics(conn, args.csv)
+    db = conn.database
+    conn.close()
+    db.close()
+    if args.stats:
+        keep_cardinalities(args.csv, args.db)
+
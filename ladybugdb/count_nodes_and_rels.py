@@ -2,16 +2,30 @@
 Script to count total number of node/relationship tables,
 and the total number of nodes and relationships PER table,
 in the Ladybug database.
+
+When the database was built with `--stats`, the counts are read from the
+cardinalities kept next to it (`<db>.stats.json`) instead of scanning every
+table, unless the database was written after them (e.g. by the insert
+workloads); pass `--scan` to count from the tables anyway. `python -m harness.counts`
+does the same for every engine.
 """
 from __future__ import annotations
 
+import argparse
+import sys
 from pathlib import Path
 
 import ladybug as lb
 from ladybug import Connection
 
+# The harness package lives at the repo root, one level up.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from harness.ingest_stats import current_cardinality  # noqa: E402
+
 DB_NAME = "ldbc_snb_sf1.lbdb"
 DB_PATH = Path(__file__).with_name(DB_NAME)
+STATS_PATH = Path(__file__).with_name(f"{DB_NAME}.stats.json")
 
 
 def _execute(conn: Connection, query: str):
@@ -72,25 +86,45 @@ def _count_relationships(conn: Connection, rel_type: str) -> int:
     return int(df["count"][0])
 
 
-def main() -> None:
+def _counts_from_scan() -> tuple[dict[str, int], dict[str, int]]:
     db = lb.Database(str(DB_PATH))
     conn = lb.Connection(db)
-
     node_tables, rel_tables = _table_names_by_type(conn)
-    print(f"Node tables: {len(node_tables)}")
-    print(f"Relationship tables: {len(rel_tables)}")
+    node_counts = {label: _count_nodes(conn, label) for label in node_tables}
+    rel_counts = {rel_type: _count_relationships(conn, rel_type) for rel_type in rel_tables}
+    return node_counts, rel_counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser("Count nodes and relationships per table")
+    parser.add_argument(
+        "--scan", action="store_true", help="Count from the tables even if statistics exist"
+    )
+    args = parser.parse_args()
+
+    tables = None if args.scan else current_cardinality(STATS_PATH, DB_PATH)
+    if STATS_PATH.exists() and tables is None and not args.scan:
+        print(f"{STATS_PATH.name} is older than the database; counting from the tables")
+    if tables is not None:
+        print(f"Counts from ingest statistics in {STATS_PATH.name} (pass --scan to recount)")
+        node_counts = {name: t["count"] for name, t in tables.items() if t["kind"] == "node"}
+        rel_counts = {name: t["count"] for name, t in tables.items() if t["kind"] == "rel"}
+    else:
+        node_counts, rel_counts = _counts_from_scan()
+    print(f"Node tables: {len(node_counts)}")
+    print(f"Relationship tables: {len(rel_counts)}")
 
     total_nodes = 0
     print("\nNode counts:")
-    for label in sorted(node_tables):
-        count = _count_nodes(conn, label)
+    for label in sorted(node_counts):
+        count = node_counts[label]
         total_nodes += count
         print(f"- {label}: {count}")
 
     total_rels = 0
     print("\nRelationship counts:")
-    for rel_type in sorted(rel_tables):
-        count = _count_relationships(conn, rel_type)
+    for rel_type in sorted(rel_counts):
+        count = rel_counts[rel_type]
         total_rels += count
         print(f"- {rel_type}: {count}")
 
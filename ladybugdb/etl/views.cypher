@@ -0,0 +1,4 @@
+CREATE REL TABLE commentRepliesToPostBy(FROM Comment TO Person, post INT64, postCreator INT64, MANY_ONE);
+CREATE REL TABLE commentOnPostTagged(FROM Comment TO Tag, post INT64);
+COPY commentRepliesToPostBy FROM '../csv/views/comment_repliesToPostBy_person_0_0.csv' (header=true);
+COPY commentOnPostTagged FROM '../csv/views/comment_onPostTagged_tag_0_0.csv' (header=true);
@@ -4,23 +4,21 @@ from typing import Any, Iterable
 
 import pytest
 
-import query
+from harness.adapters import EngineAdapter, LanceAdapter
+from harness.catalog import QUERIES
 
 
 @pytest.fixture(scope="session")
-def graph_context():
-    config = query.build_config()
-    datasets = query.load_datasets(query.GRAPH_ROOT)
-    return query.QueryContext(
-        config=config,
-        datasets=datasets,
-        engine=query.CypherEngine(config, datasets),
-    )
+def adapter():
+    adapter = LanceAdapter()
+    adapter.open()
+    yield adapter
+    adapter.close()
 
 
 def _rows(result: Any) -> list[dict[str, Any]]:
-    if hasattr(result, "to_dicts"):
-        return result.to_dicts()
+    if hasattr(result, "to_pylist"):
+        return result.to_pylist()
     return result
 
 
@@ -54,8 +52,14 @@ def _assert_single_value(result: Any, key: str, expected_value: Any) -> None:
     assert rows == [{key.lower(): expected_value}]
 
 
-def test_benchmark_query1(benchmark, graph_context):
-    result = benchmark(query.run_query1, graph_context)
+def _bench(benchmark, adapter: EngineAdapter, idx: int) -> Any:
+    # Rendering the query text is not part of what is timed.
+    prepared = adapter.prepare(QUERIES[idx])
+    return benchmark(adapter.execute, prepared)
+
+
+def test_benchmark_query1(benchmark, adapter):
+    result = _bench(benchmark, adapter, 1)
     _assert_rows(
         result,
         [{"p.firstname": "Thomas", "p.lastname": "Brown"}],
@@ -63,8 +67,8 @@ def test_benchmark_query1(benchmark, graph_context):
     )
 
 
-def test_benchmark_query2(benchmark, graph_context):
-    result = benchmark(query.run_query2, graph_context)
+def test_benchmark_query2(benchmark, adapter):
+    result = _bench(benchmark, adapter, 2)
     _assert_rows(
         result,
         [
@@ -74,8 +78,8 @@ def test_benchmark_query2(benchmark, graph_context):
     )
 
 
-def test_benchmark_query3(benchmark, graph_context):
-    result = benchmark(query.run_query3, graph_context)
+def test_benchmark_query3(benchmark, adapter):
+    result = _bench(benchmark, adapter, 3)
     _assert_rows(
         result,
         [
@@ -89,13 +93,13 @@ def test_benchmark_query3(benchmark, graph_context):
     )
 
 
-def test_benchmark_query4(benchmark, graph_context):
-    result = benchmark(query.run_query4, graph_context)
+def test_benchmark_query4(benchmark, adapter):
+    result = _bench(benchmark, adapter, 4)
     _assert_rows(result, [{"c.id": 1924145496676}], order_sensitive=True)
 
 
-def test_benchmark_query5(benchmark, graph_context):
-    result = benchmark(query.run_query5, graph_context)
+def test_benchmark_query5(benchmark, adapter):
+    result = _bench(benchmark, adapter, 5)
     _assert_rows(
         result,
         [{"p.firstname": "Akihiko", "p.lastname": "Choi"}],
@@ -103,8 +107,8 @@ def test_benchmark_query5(benchmark, graph_context):
     )
 
 
-def test_benchmark_query6(benchmark, graph_context):
-    result = benchmark(query.run_query6, graph_context)
+def test_benchmark_query6(benchmark, adapter):
+    result = _bench(benchmark, adapter, 6)
     _assert_rows(
         result,
         [
@@ -117,18 +121,18 @@ def test_benchmark_query6(benchmark, graph_context):
     )
 
 
-def test_benchmark_query7(benchmark, graph_context):
-    result = benchmark(query.run_query7, graph_context)
+def test_benchmark_query7(benchmark, adapter):
+    result = _bench(benchmark, adapter, 7)
     _assert_rows(result, [])
 
 
-def test_benchmark_query8(benchmark, graph_context):
-    result = benchmark(query.run_query8, graph_context)
+def test_benchmark_query8(benchmark, adapter):
+    result = _bench(benchmark, adapter, 8)
     _assert_rows(result, [{"p.id": 13194139534410}], order_sensitive=True)
 
 
-def test_benchmark_query9(benchmark, graph_context):
-    result = benchmark(query.run_query9, graph_context)
+def test_benchmark_query9(benchmark, adapter):
+    result = _bench(benchmark, adapter, 9)
     _assert_rows(
         result,
         [{"p.id": 1242, "p.firstname": "Hans", "p.lastname": "Johansson"}],
@@ -136,8 +140,8 @@ def test_benchmark_query9(benchmark, graph_context):
     )
 
 
-def test_benchmark_query10(benchmark, graph_context):
-    result = benchmark(query.run_query10, graph_context)
+def test_benchmark_query10(benchmark, adapter):
+    result = _bench(benchmark, adapter, 10)
     _assert_rows(
         result,
         [
@@ -148,101 +152,101 @@ def test_benchmark_query10(benchmark, graph_context):
     )
 
 
-def test_benchmark_query11(benchmark, graph_context):
-    result = benchmark(query.run_query11, graph_context)
+def test_benchmark_query11(benchmark, adapter):
+    result = _bench(benchmark, adapter, 11)
     _assert_rows(result, [{"num_e": 190, "o.name": "MDLR_Airlines"}])
 
 
-def test_benchmark_query12(benchmark, graph_context):
-    result = benchmark(query.run_query12, graph_context)
+def test_benchmark_query12(benchmark, adapter):
+    result = _bench(benchmark, adapter, 12)
     _assert_single_value(result, "num_comments", 3229)
 
 
-def test_benchmark_query13(benchmark, graph_context):
-    result = benchmark(query.run_query13, graph_context)
+def test_benchmark_query13(benchmark, adapter):
+    result = _bench(benchmark, adapter, 13)
     _assert_single_value(result, "num_persons", 2293)
 
 
-def test_benchmark_query14(benchmark, graph_context):
-    result = benchmark(query.run_query14, graph_context)
+def test_benchmark_query14(benchmark, adapter):
+    result = _bench(benchmark, adapter, 14)
     _assert_single_value(result, "num_forums", 37)
 
 
-def test_benchmark_query15(benchmark, graph_context):
-    result = benchmark(query.run_query15, graph_context)
+def test_benchmark_query15(benchmark, adapter):
+    result = _bench(benchmark, adapter, 15)
     _assert_single_value(result, "num_forums", 278)
 
 
-def test_benchmark_query16(benchmark, graph_context):
-    result = benchmark(query.run_query16, graph_context)
+def test_benchmark_query16(benchmark, adapter):
+    result = _bench(benchmark, adapter, 16)
     _assert_single_value(result, "num_posts", 3)
 
 
-def test_benchmark_query17(benchmark, graph_context):
-    result = benchmark(query.run_query17, graph_context)
+def test_benchmark_query17(benchmark, adapter):
+    result = _bench(benchmark, adapter, 17)
     _assert_rows(result, [{"t.name": "Hamid_Karzai", "tag_count": 32}])
 
 
-def test_benchmark_query18(benchmark, graph_context):
-    result = benchmark(query.run_query18, graph_context)
+def test_benchmark_query18(benchmark, adapter):
+    result = _bench(benchmark, adapter, 18)
     _assert_single_value(result, "num_p", 20)
 
 
-def test_benchmark_query19(benchmark, graph_context):
-    result = benchmark(query.run_query19, graph_context)
+def test_benchmark_query19(benchmark, adapter):
+    result = _bench(benchmark, adapter, 19)
     _assert_rows(result, [{"l.name": "India", "comment_count": 242}])
 
 
-def test_benchmark_query20(benchmark, graph_context):
-    result = benchmark(query.run_query20, graph_context)
+def test_benchmark_query20(benchmark, adapter):
+    result = _bench(benchmark, adapter, 20)
     _assert_single_value(result, "long_comment_count", 3)
 
 
-def test_benchmark_query21(benchmark, graph_context):
-    result = benchmark(query.run_query21, graph_context)
+def test_benchmark_query21(benchmark, adapter):
+    result = _bench(benchmark, adapter, 21)
     _assert_single_value(result, "liked", True)
 
 
-def test_benchmark_query22(benchmark, graph_context):
-    result = benchmark(query.run_query22, graph_context)
+def test_benchmark_query22(benchmark, adapter):
+    result = _bench(benchmark, adapter, 22)
     _assert_single_value(result, "has_reply_comment", True)
 
 
-def test_benchmark_query23(benchmark, graph_context):
-    result = benchmark(query.run_query23, graph_context)
+def test_benchmark_query23(benchmark, adapter):
+    result = _bench(benchmark, adapter, 23)
     _assert_single_value(result, "has_moderator", True)
 
 
-def test_benchmark_query24(benchmark, graph_context):
-    result = benchmark(query.run_query24, graph_context)
+def test_benchmark_query24(benchmark, adapter):
+    result = _bench(benchmark, adapter, 24)
     _assert_single_value(result, "has_person", False)
 
 
-def test_benchmark_query25(benchmark, graph_context):
-    result = benchmark(query.run_query25, graph_context)
+def test_benchmark_query25(benchmark, adapter):
+    result = _bench(benchmark, adapter, 25)
     _assert_single_value(result, "knows_someone", False)
 
 
-def test_benchmark_query26(benchmark, graph_context):
-    result = benchmark(query.run_query26, graph_context)
+def test_benchmark_query26(benchmark, adapter):
+    result = _bench(benchmark, adapter, 26)
     _assert_single_value(result, "has_forum", False)
 
 
-def test_benchmark_query27(benchmark, graph_context):
-    result = benchmark(query.run_query27, graph_context)
+def test_benchmark_query27(benchmark, adapter):
+    result = _bench(benchmark, adapter, 27)
     _assert_single_value(result, "has_comment", True)
 
 
-def test_benchmark_query28(benchmark, graph_context):
-    result = benchmark(query.run_query28, graph_context)
+def test_benchmark_query28(benchmark, adapter):
+    result = _bench(benchmark, adapter, 28)
     _assert_single_value(result, "has_people", True)
 
 
-def test_benchmark_query29(benchmark, graph_context):
-    result = benchmark(query.run_query29, graph_context)
+def test_benchmark_query29(benchmark, adapter):
+    result = _bench(benchmark, adapter, 29)
     _assert_single_value(result, "has_written_post_with_safari", False)
 
 
-def test_benchmark_query30(benchmark, graph_context):
-    result = benchmark(query.run_query30, graph_context)
+def test_benchmark_query30(benchmark, adapter):
+    result = _bench(benchmark, adapter, 30)
     _assert_single_value(result, "has_self_reply", True)
@@ -3,7 +3,21 @@ Builds Lance datasets for the LDBC SNB SF1 graph from CSV inputs.
 
 This script reads CSV files under `csv/static` and `csv/dynamic`, converts them
 into PyArrow tables, and writes one Lance dataset per node/edge CSV into
-`lance_graph/graph_lance`.
+`lance_graph/graph_lance`. Pass `--csv-root` and `--graph-root` to build from
+another CSV root, e.g. a snapshot written by `harness.updates`. The derived
+edges under `csv/views` (see `harness.views`) are only loaded with `--views`;
+without it, view datasets left by an earlier `--views` build are deleted, since
+the query adapter loads any view dataset it finds.
+With `--stats`, node datasets get the degree columns from `csv/stats` (see
+`harness.ingest_stats`) and the table cardinalities are kept as `_stats.json`.
+
+Date and time columns (`creationDate`, `joinDate`, `birthday`) are read as
+`timestamp[ms, UTC]` and `date32` rather than left to CSV type inference.
+
+String columns with few distinct values (`browserused`, `gender`, `language`,
+`Organisation.type`, `Place.type`, ...) are stored dictionary-encoded. A column
+is encoded when its distinct values are at most `--dictionary-ratio` of its
+rows (default 1%; 0 stores every string column as plain UTF-8).
 
 Node CSVs are detected by a leading `id` column. Edge CSVs are detected by
 having the first two columns in the form `Label.id|Label.id`. Edge endpoints
@@ -12,6 +26,9 @@ are normalized to `src`/`dst` and cast to the referenced node id types.
 
 from __future__ import annotations
 
+import argparse
+import shutil
+import sys
 from pathlib import Path
 from typing import Iterable
 
@@ -20,10 +37,24 @@ import pyarrow as pa
 import pyarrow.compute as pc
 import pyarrow.csv as csv
 
+# The harness package lives at the repo root, one level up.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from harness.adapters.lance import VIEW_DATASETS  # noqa: E402
+from harness.ldbc import TEMPORAL_COLUMNS  # noqa: E402
+
 SCRIPT_ROOT = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_ROOT.parent
 CSV_ROOT = REPO_ROOT / "csv"
 GRAPH_ROOT = SCRIPT_ROOT / "graph_lance"
+DICTIONARY_RATIO = 0.01
+
+# Arrow type per kind in `TEMPORAL_COLUMNS`, e.g. "2010-02-14T15:32:10.447+0000"
+# and "1989-12-03".
+ARROW_TEMPORAL_TYPES: dict[str, pa.DataType] = {
+    "timestamp": pa.timestamp("ms", tz="UTC"),
+    "date": pa.date32(),
+}
 
 
 def _normalize_label(label: str) -> str:
@@ -51,6 +82,14 @@ def _dedupe_names(names: Iterable[str]) -> list[str]:
     return out
 
 
+# Temporal columns by normalized name.
+TEMPORAL_TYPES: dict[str, pa.DataType] = {
+    _normalize_column(column): ARROW_TEMPORAL_TYPES[kind]
+    for columns in TEMPORAL_COLUMNS.values()
+    for column, kind in columns.items()
+}
+
+
 def _read_header(path: Path) -> list[str]:
     with path.open("r", encoding="utf-8") as f:
         header = f.readline().rstrip("\n")
@@ -60,7 +99,12 @@ def _read_header(path: Path) -> list[str]:
 def _read_csv(path: Path, column_names: list[str]) -> pa.Table:
     read_opts = csv.ReadOptions(column_names=column_names, skip_rows=1)
     parse_opts = csv.ParseOptions(delimiter="|")
-    return csv.read_csv(str(path), read_options=read_opts, parse_options=parse_opts)
+    convert_opts = csv.ConvertOptions(
+        column_types={name: TEMPORAL_TYPES[name] for name in column_names if name in TEMPORAL_TYPES}
+    )
+    return csv.read_csv(
+        str(path), read_options=read_opts, parse_options=parse_opts, convert_options=convert_opts
+    )
 
 
 def _assert_no_nulls(arr: pa.Array, where: str) -> None:
@@ -75,9 +119,25 @@ def _cast_column(table: pa.Table, name: str, typ: pa.DataType) -> pa.Array:
     return pc.cast(arr, typ)
 
 
-def _write_lance(table: pa.Table, name: str) -> str:
-    GRAPH_ROOT.mkdir(parents=True, exist_ok=True)
-    path = GRAPH_ROOT / f"{name}.lance"
+def _dictionary_encode(table: pa.Table, max_ratio: float) -> tuple[pa.Table, list[str]]:
+    """Dictionary-encode the string columns with at most `max_ratio` distinct values per row."""
+    if max_ratio <= 0 or table.num_rows == 0:
+        return table, []
+    encoded: list[str] = []
+    columns = []
+    for name, column in zip(table.column_names, table.columns):
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            distinct = pc.count_distinct(column, mode="all").as_py()
+            if distinct / table.num_rows <= max_ratio:
+                column = pc.dictionary_encode(column)
+                encoded.append(name)
+        columns.append(column)
+    return pa.table(columns, names=table.column_names), encoded
+
+
+def _write_lance(table: pa.Table, name: str, graph_root: Path) -> str:
+    graph_root.mkdir(parents=True, exist_ok=True)
+    path = graph_root / f"{name}.lance"
     lance.write_dataset(table, str(path), mode="overwrite")
     return str(path)
 
@@ -153,13 +213,35 @@ def _load_edge(path: Path, src_type: pa.DataType, dst_type: pa.DataType) -> pa.T
     return pa.table(cols, names=table.column_names)
 
 
-def main() -> None:
-    if not CSV_ROOT.exists():
-        raise FileNotFoundError(f"CSV root not found: {CSV_ROOT}")
-
-    csv_files = sorted(CSV_ROOT.rglob("*.csv"))
+def _add_degrees(table: pa.Table, path: Path) -> pa.Table:
+    degrees = _read_csv(path, [_normalize_column(n) for n in _read_header(path)])
+    joined = table.join(degrees, "id", join_type="left outer")
+    columns = [
+        pc.fill_null(joined[name], 0) if name in degrees.column_names else joined[name]
+        for name in joined.column_names
+    ]
+    return pa.table(columns, names=joined.column_names)
+
+
+def main(
+    csv_root: Path = CSV_ROOT,
+    graph_root: Path = GRAPH_ROOT,
+    views: bool = False,
+    stats: bool = False,
+    dictionary_ratio: float = DICTIONARY_RATIO,
+) -> None:
+    if not csv_root.exists():
+        raise FileNotFoundError(f"CSV root not found: {csv_root}")
+
+    # csv/stats holds derived files, never tables of its own.
+    skipped_dirs = {"stats"} if views else {"stats", "views"}
+    csv_files = sorted(
+        path
+        for path in csv_root.rglob("*.csv")
+        if path.relative_to(csv_root).parts[0] not in skipped_dirs
+    )
     if not csv_files:
-        raise FileNotFoundError(f"No CSV files found under: {CSV_ROOT}")
+        raise FileNotFoundError(f"No CSV files found under: {csv_root}")
 
     node_id_types: dict[str, pa.DataType] = {}
     edge_files: list[Path] = []
@@ -170,7 +252,13 @@ def main() -> None:
             label = _node_label_from_stem(path.stem)
             table, id_type = _load_node(path, label)
             node_id_types[label] = id_type
-            dataset_path = _write_lance(table, label)
+            degrees_path = csv_root / "stats" / "degrees" / f"{label}.csv"
+            if stats and degrees_path.exists():
+                table = _add_degrees(table, degrees_path)
+            table, encoded = _dictionary_encode(table, dictionary_ratio)
+            if encoded:
+                print(f"Dictionary-encoded {label} columns: {', '.join(encoded)}")
+            dataset_path = _write_lance(table, label, graph_root)
             index_name = f"{label}_id_btree"
             _create_scalar_index(dataset_path, "id", index_name)
         else:
@@ -188,15 +276,45 @@ def main() -> None:
             skipped.append(path)
             continue
         table = _load_edge(path, node_id_types[src_label], node_id_types[dst_label])
-        _write_lance(table, _edge_name_from_stem(path.stem))
+        _write_lance(table, _edge_name_from_stem(path.stem), graph_root)
 
     if skipped:
         print("Skipped non-graph CSVs:")
         for path in skipped:
-            print(f"  - {path.relative_to(REPO_ROOT)}")
+            print(f"  - {path.relative_to(csv_root)}")
+
+    # Written last: readers ignore it once a dataset has a newer version.
+    if stats:
+        shutil.copyfile(csv_root / "stats" / "cardinality.json", graph_root / "_stats.json")
+    else:
+        (graph_root / "_stats.json").unlink(missing_ok=True)
+    if not views:
+        for name in VIEW_DATASETS.values():
+            stale = graph_root / f"{name}.lance"
+            if stale.exists():
+                shutil.rmtree(stale)
+                print(f"Removed view dataset from an earlier --views build: {stale.name}")
 
-    print(f"Wrote Lance datasets to: {GRAPH_ROOT.resolve()}")
+    print(f"Wrote Lance datasets to: {graph_root.resolve()}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser("Build Lance datasets from files")
+    parser.add_argument("--csv-root", type=Path, default=CSV_ROOT)
+    parser.add_argument("--graph-root", type=Path, default=GRAPH_ROOT)
+    parser.add_argument(
+        "--views", action="store_true", help="Also load the materialized views in csv/views"
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="Add the degree columns and cardinalities in csv/stats"
+    )
+    parser.add_argument(
+        "--dictionary-ratio",
+        type=float,
+        default=DICTIONARY_RATIO,
+        help="Dictionary-encode string columns with at most this many distinct values per row "
+        "(0 disables)",
+    )
+    args = parser.parse_args()
+
+    main(args.csv_root, args.graph_root, args.views, args.stats, args.dictionary_ratio)
@@ -0,0 +1,35 @@
+"""
+Split the comment-anchored Lance datasets into shards for the sharded
+lance-graph mode (`harness/adapters/sharded.py`).
+
+`Comment` and the edges starting at a comment are hash-partitioned on the
+comment id into `lance_graph/graph_lance_shards/shard_<i>/`; the rest of the
+graph is copied once to Arrow IPC files under `graph_lance_shards/shared/`,
+which every worker memory-maps. Run `build_graph.py` first, and rebuild the
+shards after every graph build.
+"""
+
+import argparse
+import shutil
+import sys
+from pathlib import Path
+
+# The harness package lives at the repo root, one level up.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from harness.adapters.lance import GRAPH_ROOT  # noqa: E402
+from harness.adapters.sharded import SHARD_ROOT, write_shards  # noqa: E402
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser("Partition Lance datasets into shards")
+    parser.add_argument("--shards", "-n", type=int, default=4, help="Number of worker shards")
+    parser.add_argument("--graph-root", type=Path, default=GRAPH_ROOT)
+    parser.add_argument("--shard-root", type=Path, default=SHARD_ROOT)
+    args = parser.parse_args()
+
+    # Leftover shards from a build with more workers would be picked up too.
+    shutil.rmtree(args.shard_root, ignore_errors=True)
+    counts = write_shards(args.graph_root, args.shard_root, args.shards)
+    for name, rows in counts.items():
+        print(f"{name}: {' / '.join(str(count) for count in rows)} rows")
+    print(f"Wrote {args.shards} shards to: {args.shard_root.resolve()}")
@@ -1,52 +1,24 @@
 from __future__ import annotations
 
-import asyncio
-import os
 from typing import Any, Iterable
 
 import pytest
-from dotenv import load_dotenv
-from neo4j import AsyncGraphDatabase, AsyncSession
 
-import query
-
-load_dotenv()
-
-URI = os.environ.get("NEO4J_URI", "bolt://localhost:7687")
-NEO4J_USER = os.environ.get("NEO4J_USER")
-NEO4J_PASSWORD = os.environ.get("NEO4J_PASSWORD")
-NEO4J_DATABASE = os.environ.get("NEO4J_DATABASE", "neo4j")
-
-
-@pytest.fixture(scope="session")
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+from harness.adapters import EngineAdapter, Neo4jAdapter
+from harness.catalog import QUERIES
 
 
 @pytest.fixture(scope="session")
-def session(event_loop) -> AsyncSession:
-    if NEO4J_USER is None or NEO4J_PASSWORD is None:
-        raise EnvironmentError("NEO4J_USER and NEO4J_PASSWORD must be set")
-    driver = AsyncGraphDatabase.driver(URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
-    session = driver.session(database=NEO4J_DATABASE)
-
-    def _close():
-        event_loop.run_until_complete(session.close())
-        event_loop.run_until_complete(driver.close())
-
-    yield session
-    _close()
-
-
-def _run(event_loop, coro):
-    return event_loop.run_until_complete(coro)
+def adapter():
+    adapter = Neo4jAdapter()
+    adapter.open()
+    yield adapter
+    adapter.close()
 
 
 def _rows(result: Any) -> list[dict[str, Any]]:
-    if hasattr(result, "to_dicts"):
-        return result.to_dicts()
+    if hasattr(result, "to_pylist"):
+        return result.to_pylist()
     return result
 
 
@@ -73,8 +45,14 @@ def _assert_single_value(result: Any, key: str, expected_value: Any) -> None:
     assert rows == [{key: expected_value}]
 
 
-def test_benchmark_query1(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query1(session)))
+def _bench(benchmark, adapter: EngineAdapter, idx: int) -> Any:
+    # Rendering the query text is not part of what is timed.
+    prepared = adapter.prepare(QUERIES[idx])
+    return benchmark(adapter.execute, prepared)
+
+
+def test_benchmark_query1(benchmark, adapter):
+    result = _bench(benchmark, adapter, 1)
     _assert_rows(
         result,
         [{"p.firstName": "Thomas", "p.lastName": "Brown"}],
@@ -82,8 +60,8 @@ def test_benchmark_query1(benchmark, session, event_loop):
     )
 
 
-def test_benchmark_query2(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query2(session)))
+def test_benchmark_query2(benchmark, adapter):
+    result = _bench(benchmark, adapter, 2)
     _assert_rows(
         result,
         [
@@ -93,8 +71,8 @@ def test_benchmark_query2(benchmark, session, event_loop):
     )
 
 
-def test_benchmark_query3(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query3(session)))
+def test_benchmark_query3(benchmark, adapter):
+    result = _bench(benchmark, adapter, 3)
     _assert_rows(
         result,
         [
@@ -108,13 +86,13 @@ def test_benchmark_query3(benchmark, session, event_loop):
     )
 
 
-def test_benchmark_query4(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query4(session)))
+def test_benchmark_query4(benchmark, adapter):
+    result = _bench(benchmark, adapter, 4)
     _assert_rows(result, [{"c.ID": 1924145496676}], order_sensitive=True)
 
 
-def test_benchmark_query5(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query5(session)))
+def test_benchmark_query5(benchmark, adapter):
+    result = _bench(benchmark, adapter, 5)
     _assert_rows(
         result,
         [{"p.firstName": "Akihiko", "p.lastName": "Choi"}],
@@ -122,8 +100,8 @@ def test_benchmark_query5(benchmark, session, event_loop):
     )
 
 
-def test_benchmark_query6(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query6(session)))
+def test_benchmark_query6(benchmark, adapter):
+    result = _bench(benchmark, adapter, 6)
     _assert_rows(
         result,
         [
@@ -136,18 +114,18 @@ def test_benchmark_query6(benchmark, session, event_loop):
     )
 
 
-def test_benchmark_query7(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query7(session)))
+def test_benchmark_query7(benchmark, adapter):
+    result = _bench(benchmark, adapter, 7)
     _assert_rows(result, [])
 
 
-def test_benchmark_query8(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query8(session)))
+def test_benchmark_query8(benchmark, adapter):
+    result = _bench(benchmark, adapter, 8)
     _assert_rows(result, [{"p.ID": 13194139534410}], order_sensitive=True)
 
 
-def test_benchmark_query9(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query9(session)))
+def test_benchmark_query9(benchmark, adapter):
+    result = _bench(benchmark, adapter, 9)
     _assert_rows(
         result,
         [{"p.ID": 1242, "p.firstName": "Hans", "p.lastName": "Johansson"}],
@@ -155,8 +133,8 @@ def test_benchmark_query9(benchmark, session, event_loop):
     )
 
 
-def test_benchmark_query10(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query10(session)))
+def test_benchmark_query10(benchmark, adapter):
+    result = _bench(benchmark, adapter, 10)
     _assert_rows(
         result,
         [
@@ -167,101 +145,101 @@ def test_benchmark_query10(benchmark, session, event_loop):
     )
 
 
-def test_benchmark_query11(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query11(session)))
+def test_benchmark_query11(benchmark, adapter):
+    result = _bench(benchmark, adapter, 11)
     _assert_rows(result, [{"num_e": 190, "o.name": "MDLR_Airlines"}])
 
 
-def test_benchmark_query12(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query12(session)))
+def test_benchmark_query12(benchmark, adapter):
+    result = _bench(benchmark, adapter, 12)
     _assert_single_value(result, "num_comments", 3229)
 
 
-def test_benchmark_query13(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query13(session)))
+def test_benchmark_query13(benchmark, adapter):
+    result = _bench(benchmark, adapter, 13)
     _assert_single_value(result, "num_persons", 2293)
 
 
-def test_benchmark_query14(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query14(session)))
+def test_benchmark_query14(benchmark, adapter):
+    result = _bench(benchmark, adapter, 14)
     _assert_single_value(result, "num_forums", 37)
 
 
-def test_benchmark_query15(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query15(session)))
+def test_benchmark_query15(benchmark, adapter):
+    result = _bench(benchmark, adapter, 15)
     _assert_single_value(result, "num_forums", 278)
 
 
-def test_benchmark_query16(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query16(session)))
+def test_benchmark_query16(benchmark, adapter):
+    result = _bench(benchmark, adapter, 16)
     _assert_single_value(result, "num_posts", 3)
 
 
-def test_benchmark_query17(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query17(session)))
+def test_benchmark_query17(benchmark, adapter):
+    result = _bench(benchmark, adapter, 17)
     _assert_rows(result, [{"t.name": "Hamid_Karzai", "tag_count": 32}])
 
 
-def test_benchmark_query18(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query18(session)))
+def test_benchmark_query18(benchmark, adapter):
+    result = _bench(benchmark, adapter, 18)
     _assert_single_value(result, "num_p", 20)
 
 
-def test_benchmark_query19(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query19(session)))
+def test_benchmark_query19(benchmark, adapter):
+    result = _bench(benchmark, adapter, 19)
     _assert_rows(result, [{"l.name": "India", "comment_count": 242}])
 
 
-def test_benchmark_query20(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query20(session)))
+def test_benchmark_query20(benchmark, adapter):
+    result = _bench(benchmark, adapter, 20)
     _assert_single_value(result, "long_comment_count", 3)
 
 
-def test_benchmark_query21(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query21(session)))
+def test_benchmark_query21(benchmark, adapter):
+    result = _bench(benchmark, adapter, 21)
     _assert_single_value(result, "liked", True)
 
 
-def test_benchmark_query22(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query22(session)))
+def test_benchmark_query22(benchmark, adapter):
+    result = _bench(benchmark, adapter, 22)
     _assert_single_value(result, "has_reply_comment", True)
 
 
-def test_benchmark_query23(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query23(session)))
+def test_benchmark_query23(benchmark, adapter):
+    result = _bench(benchmark, adapter, 23)
     _assert_single_value(result, "has_moderator", True)
 
 
-def test_benchmark_query24(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query24(session)))
+def test_benchmark_query24(benchmark, adapter):
+    result = _bench(benchmark, adapter, 24)
     _assert_single_value(result, "has_person", False)
 
 
-def test_benchmark_query25(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query25(session)))
+def test_benchmark_query25(benchmark, adapter):
+    result = _bench(benchmark, adapter, 25)
     _assert_single_value(result, "knows_someone", False)
 
 
-def test_benchmark_query26(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query26(session)))
+def test_benchmark_query26(benchmark, adapter):
+    result = _bench(benchmark, adapter, 26)
     _assert_single_value(result, "has_forum", False)
 
 
-def test_benchmark_query27(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query27(session)))
+def test_benchmark_query27(benchmark, adapter):
+    result = _bench(benchmark, adapter, 27)
     _assert_single_value(result, "has_comment", True)
 
 
-def test_benchmark_query28(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query28(session)))
+def test_benchmark_query28(benchmark, adapter):
+    result = _bench(benchmark, adapter, 28)
     _assert_single_value(result, "has_people", True)
 
 
-def test_benchmark_query29(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query29(session)))
+def test_benchmark_query29(benchmark, adapter):
+    result = _bench(benchmark, adapter, 29)
     _assert_single_value(result, "has_written_post_with_safari", False)
 
 
-def test_benchmark_query30(benchmark, session, event_loop):
-    result = benchmark(lambda: _run(event_loop, query.run_query30(session)))
+def test_benchmark_query30(benchmark, adapter):
+    result = _bench(benchmark, adapter, 30)
     _assert_single_value(result, "has_self_reply", True)
@@ -1,6 +1,7 @@
 import argparse
 import asyncio
 import os
+import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -10,6 +11,12 @@ import polars as pl
 from dotenv import load_dotenv
 from neo4j import AsyncGraphDatabase, AsyncManagedTransaction, AsyncSession
 
+# The harness package lives at the repo root, one level up.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from harness.ldbc import TEMPORAL_COLUMNS  # noqa: E402
+from harness.views import VIEWS  # noqa: E402
+
 load_dotenv()
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -70,6 +77,67 @@ EDGE_SPECS: list[EdgeSpec] = [
     EdgeSpec(DYNAMIC_ROOT / "person_workAt_organisation_0_0.csv", "Person", "workAt", "Organisation"),
 ]
 
+# Materialized views written by `harness.views`, loaded with --views.
+VIEW_SPECS: list[EdgeSpec] = [
+    EdgeSpec(CSV_ROOT / view.path, view.src_label, view.rel_type, view.dst_label)
+    for view in VIEWS.values()
+]
+
+
+# Format of the timestamps in `TEMPORAL_COLUMNS`, parsed so they are stored as
+# Neo4j DateTime values; dates are stored as Date values.
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S%.3f%z"
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    kind: str  # RANGE or TEXT
+    label: str  # node label or relationship type
+    prop: str
+    relationship: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.label}_{self.prop}_{self.kind.lower()}"
+
+    def statement(self) -> str:
+        pattern = f"()-[x:{self.label}]-()" if self.relationship else f"(x:{self.label})"
+        return (
+            f"CREATE {self.kind} INDEX {self.name} IF NOT EXISTS "
+            f"FOR {pattern} ON (x.{self.prop})"
+        )
+
+
+# Secondary indexes for the filters in the query catalog, built after the data is
+# loaded: RANGE for equality and range predicates, TEXT for CONTAINS.
+INDEX_PLAN: list[IndexSpec] = [
+    IndexSpec("RANGE", "Place", "name"),
+    IndexSpec("RANGE", "Tag", "name"),
+    IndexSpec("RANGE", "Tagclass", "name"),
+    IndexSpec("RANGE", "Organisation", "name"),
+    IndexSpec("RANGE", "Organisation", "type"),
+    IndexSpec("RANGE", "Person", "firstName"),
+    IndexSpec("RANGE", "Person", "lastName"),
+    IndexSpec("TEXT", "Person", "lastName"),
+    IndexSpec("TEXT", "Tag", "name"),
+    IndexSpec("TEXT", "Forum", "title"),
+    IndexSpec("TEXT", "Post", "content"),
+    IndexSpec("TEXT", "Comment", "content"),
+    IndexSpec("RANGE", "Comment", "creationDate"),
+    IndexSpec("RANGE", "Forum", "creationDate"),
+    IndexSpec("RANGE", "Person", "creationDate"),
+    IndexSpec("RANGE", "Person", "birthday"),
+    IndexSpec("RANGE", "Post", "creationDate"),
+    IndexSpec("RANGE", "knows", "creationDate", relationship=True),
+    IndexSpec("RANGE", "likeComment", "creationDate", relationship=True),
+    IndexSpec("RANGE", "likePost", "creationDate", relationship=True),
+    IndexSpec("RANGE", "hasMember", "joinDate", relationship=True),
+]
+
+
+def _rebase(path: Path, csv_root: Path) -> Path:
+    return csv_root / path.relative_to(CSV_ROOT)
+
 
 def _iter_batches(rows: list[JsonBlob], batch_size: int) -> Iterable[list[JsonBlob]]:
     for start in range(0, len(rows), batch_size):
@@ -82,6 +150,17 @@ def _load_csv(path: Path) -> pl.DataFrame:
     return pl.read_csv(path, separator="|")
 
 
+def _parse_temporal(df: pl.DataFrame, name: str) -> pl.DataFrame:
+    columns = TEMPORAL_COLUMNS.get(name, {})
+    return df.with_columns(
+        pl.col(column).str.to_datetime(TIMESTAMP_FORMAT, time_unit="ms")
+        if kind == "timestamp"
+        else pl.col(column).str.to_date("%Y-%m-%d")
+        for column, kind in columns.items()
+        if column in df.columns
+    )
+
+
 def _normalize_node_rows(rows: list[JsonBlob]) -> list[JsonBlob]:
     normalized = []
     for row in rows:
@@ -135,6 +214,15 @@ async def _merge_edges(
     await tx.run(query, rows=rows)
 
 
+async def _set_degrees(tx: AsyncManagedTransaction, label: str, rows: list[JsonBlob]) -> None:
+    query = f"""
+        UNWIND $rows AS row
+        MATCH (n:{label} {{ID: row.ID}})
+            SET n += row
+    """
+    await tx.run(query, rows=rows)
+
+
 async def create_constraints(session: AsyncSession) -> None:
     labels = list(NODE_FILES.keys())
     for label in labels:
@@ -142,18 +230,30 @@ async def create_constraints(session: AsyncSession) -> None:
         await session.run(query)
 
 
-async def write_nodes(session: AsyncSession, batch_size: int) -> None:
+async def create_indexes(session: AsyncSession, timeout_s: int) -> float:
+    """Create the index plan and wait until every index is online; returns the seconds taken."""
+    start = time.perf_counter()
+    for spec in INDEX_PLAN:
+        await session.run(spec.statement())
+    result = await session.run(f"CALL db.awaitIndexes({timeout_s})")
+    await result.consume()
+    return time.perf_counter() - start
+
+
+async def write_nodes(session: AsyncSession, batch_size: int, csv_root: Path) -> None:
     for label, path in NODE_FILES.items():
-        df = _load_csv(path)
+        df = _parse_temporal(_load_csv(_rebase(path, csv_root)), label)
         rows = _normalize_node_rows(df.to_dicts())
         for batch in _iter_batches(rows, batch_size):
             await session.execute_write(_merge_nodes, label, batch)
         print(f"Loaded {len(rows)} nodes for label {label}")
 
 
-async def write_edges(session: AsyncSession, batch_size: int) -> None:
-    for spec in EDGE_SPECS:
-        df = _load_csv(spec.path)
+async def write_edges(
+    session: AsyncSession, batch_size: int, csv_root: Path, specs: list[EdgeSpec] = EDGE_SPECS
+) -> None:
+    for spec in specs:
+        df = _parse_temporal(_load_csv(_rebase(spec.path, csv_root)), spec.rel_type)
         rows = _normalize_edge_rows(df.to_dicts())
         for batch in _iter_batches(rows, batch_size):
             await session.execute_write(
@@ -162,24 +262,59 @@ async def write_edges(session: AsyncSession, batch_size: int) -> None:
         print(f"Loaded {len(rows)} edges for {spec.rel_type}")
 
 
-async def main(batch_size: int) -> None:
+async def write_degrees(session: AsyncSession, batch_size: int, csv_root: Path) -> None:
+    """Add the per-node degree properties written by `harness.ingest_stats`."""
+    for path in sorted((csv_root / "stats" / "degrees").glob("*.csv")):
+        rows = _normalize_node_rows(_load_csv(path).to_dicts())
+        for batch in _iter_batches(rows, batch_size):
+            await session.execute_write(_set_degrees, path.stem, batch)
+        print(f"Added degrees for {len(rows)} nodes of label {path.stem}")
+
+
+async def main(
+    batch_size: int,
+    csv_root: Path = CSV_ROOT,
+    database: str = NEO4J_DATABASE,
+    views: bool = False,
+    stats: bool = False,
+    indexes: str = "build",
+    index_timeout_s: int = 1800,
+) -> None:
     if NEO4J_USER is None or NEO4J_PASSWORD is None:
         raise EnvironmentError("NEO4J_USER and NEO4J_PASSWORD must be set")
 
     async with AsyncGraphDatabase.driver(URI, auth=(NEO4J_USER, NEO4J_PASSWORD)) as driver:
-        async with driver.session(database=NEO4J_DATABASE) as session:
+        async with driver.session(database=database) as session:
             await create_constraints(session)
 
+            if indexes == "only":
+                elapsed = await create_indexes(session, index_timeout_s)
+                print(f"{len(INDEX_PLAN)} indexes online in {elapsed:.4f}s")
+                return
+
             nodes_start = time.perf_counter()
-            await write_nodes(session, batch_size)
+            await write_nodes(session, batch_size, csv_root)
             nodes_elapsed = time.perf_counter() - nodes_start
             print(f"Nodes loaded in {nodes_elapsed:.4f}s")
 
             edges_start = time.perf_counter()
-            await write_edges(session, batch_size)
+            await write_edges(session, batch_size, csv_root)
             edges_elapsed = time.perf_counter() - edges_start
             print(f"Edges loaded in {edges_elapsed:.4f}s")
 
+            if views:
+                views_start = time.perf_counter()
+                await write_edges(session, batch_size, csv_root, VIEW_SPECS)
+                views_elapsed = time.perf_counter() - views_start
+                print(f"Views loaded in {views_elapsed:.4f}s")
+
+            if stats:
+                await write_degrees(session, batch_size, csv_root)
+
+            if indexes == "build":
+                elapsed = await create_indexes(session, index_timeout_s)
+                print(f"{len(INDEX_PLAN)} indexes online in {elapsed:.4f}s")
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser("Build Neo4j graph from files")
@@ -190,6 +325,42 @@ if __name__ == "__main__":
         default=50_000,
         help="Batch size of rows to ingest at a time",
     )
+    parser.add_argument(
+        "--csv-root",
+        type=Path,
+        default=CSV_ROOT,
+        help="CSV root, e.g. a snapshot written by harness.updates",
+    )
+    parser.add_argument("--database", default=NEO4J_DATABASE, help="Database to load into")
+    parser.add_argument(
+        "--views", action="store_true", help="Also load the materialized views in csv/views"
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="Add the degree properties in csv/stats"
+    )
+    parser.add_argument(
+        "--indexes",
+        choices=("build", "skip", "only"),
+        default="build",
+        help="Build the secondary indexes after loading, skip them, or only build them "
+        "on an already loaded database",
+    )
+    parser.add_argument(
+        "--index-timeout",
+        type=int,
+        default=1800,
+        help="Seconds to wait for the indexes to come online",
+    )
     args = parser.parse_args()
 
-    asyncio.run(main(args.batch_size))
+    asyncio.run(
+        main(
+            args.batch_size,
+            args.csv_root,
+            args.database,
+            args.views,
+            args.stats,
+            args.indexes,
+            args.index_timeout,
+        )
+    )
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
+import json
 import re
 from pathlib import Path
 
@@ -14,6 +16,8 @@ UNIT_TO_MS = {
 }
 ROUND_MS_DECIMALS = 1
 SPEEDUP_DECIMALS = 1
+MEMORY_DIR_NAME = "memory"
+BYTES_PER_MB = 1024 * 1024
 
 
 def normalize_name(name: str) -> str:
@@ -49,6 +53,20 @@ def parse_benchmark_file(path: Path) -> dict[str, float]:
     return means_ms
 
 
+def parse_memory_file(path: Path) -> dict[str, dict[str, int]]:
+    """Per-query readings written by `python -m harness.memory`."""
+    return json.loads(path.read_text())["queries"]
+
+
+def format_memory(reading: dict[str, int] | None) -> str:
+    if reading is None:
+        return "n/a"
+    return " / ".join(
+        f"{reading[key] / BYTES_PER_MB:.1f}"
+        for key in ("peak_rss_delta_bytes", "python_peak_bytes", "arrow_bytes")
+    )
+
+
 def sort_query_key(name: str) -> tuple[int, int | str]:
     match = re.search(r"query(\d+)", name)
     if match:
@@ -123,6 +141,19 @@ def plot_results(
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare pytest-benchmark results across systems."
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help=(
+            "Add per-system memory columns (peak RSS delta / Python peak / Arrow bytes, MB) "
+            "from results/memory/<system>.json"
+        ),
+    )
+    args = parser.parse_args()
+
     results_dir = Path(__file__).resolve().parent
     files = sorted(results_dir.glob("*.txt"))
     if not files:
@@ -142,7 +173,15 @@ def main() -> None:
         key=sort_query_key,
     )
 
+    memory_results: dict[str, dict[str, dict[str, int]]] = {}
+    if args.memory:
+        for system in systems:
+            memory_path = results_dir / MEMORY_DIR_NAME / f"{system}.json"
+            if memory_path.exists():
+                memory_results[system] = parse_memory_file(memory_path)
+
     headers = ["Query"] + [f"{system} (ms)" for system in systems]
+    headers += [f"{system} mem (MB: rss/py/arrow)" for system in memory_results]
     rows = []
     plot_queries: list[str] = []
     plot_values: list[list[float | None]] = []
@@ -172,6 +211,8 @@ def main() -> None:
                 speedup = neo4j_value / value
                 value_text = f"{value_text} ({speedup:.{SPEEDUP_DECIMALS}f}x)"
             row.append(value_text)
+        for system, readings in memory_results.items():
+            row.append(format_memory(readings.get(query)))
         rows.append(row)
         plot_queries.append(display_query)
         plot_values.append(series)
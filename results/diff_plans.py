@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Diff saved query plans between two systems, e.g. two versions of one engine.
+
+Plans are written to `results/plans/<system>/q<N>.txt` by running an engine's
+`query.py --profile`. Example:
+
+    uv run results/diff_plans.py kuzu-0.11.3 ladybug-0.15.3 --queries 7,13
+"""
+from __future__ import annotations
+
+import argparse
+import difflib
+import re
+from pathlib import Path
+
+PLANS_DIR = Path(__file__).resolve().parent / "plans"
+NUMBER_RE = re.compile(r"\d+(\.\d+)?")
+
+
+def plan_files(system: str) -> dict[int, Path]:
+    system_dir = PLANS_DIR / system
+    if not system_dir.is_dir():
+        raise SystemExit(f"No saved plans for {system} under {PLANS_DIR}")
+    files: dict[int, Path] = {}
+    for path in system_dir.glob("q*.txt"):
+        match = re.fullmatch(r"q(\d+)", path.stem)
+        if match:
+            files[int(match.group(1))] = path
+    return files
+
+
+def read_plan(path: Path, ignore_metrics: bool) -> list[str]:
+    lines = path.read_text().splitlines()
+    if ignore_metrics:
+        # Row counts and timings change run to run; keep only the plan shape.
+        lines = [NUMBER_RE.sub("#", line) for line in lines]
+    return lines
+
+
+def diff_plan(
+    base: Path,
+    other: Path,
+    base_label: str,
+    other_label: str,
+    *,
+    ignore_metrics: bool = False,
+) -> list[str]:
+    return list(
+        difflib.unified_diff(
+            read_plan(base, ignore_metrics),
+            read_plan(other, ignore_metrics),
+            fromfile=base_label,
+            tofile=other_label,
+            lineterm="",
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Diff saved query plans between two systems.")
+    parser.add_argument("base", help="System directory under results/plans, e.g. kuzu-0.11.3")
+    parser.add_argument("other", help="System to compare against the base")
+    parser.add_argument(
+        "--queries", "-q", default=None, help="Comma-separated query numbers (default: all)"
+    )
+    parser.add_argument(
+        "--ignore-metrics",
+        action="store_true",
+        help="Mask numbers (row counts, timings) so only plan shape changes are shown",
+    )
+    args = parser.parse_args()
+
+    base_files = plan_files(args.base)
+    other_files = plan_files(args.other)
+    if args.queries:
+        selected = [int(part) for part in args.queries.split(",") if part.strip()]
+    else:
+        selected = sorted(set(base_files) | set(other_files))
+
+    unchanged: list[int] = []
+    for idx in selected:
+        if idx not in base_files or idx not in other_files:
+            missing = args.base if idx not in base_files else args.other
+            print(f"q{idx}: no saved plan for {missing}\n")
+            continue
+        lines = diff_plan(
+            base_files[idx],
+            other_files[idx],
+            f"{args.base}/q{idx}",
+            f"{args.other}/q{idx}",
+            ignore_metrics=args.ignore_metrics,
+        )
+        if not lines:
+            unchanged.append(idx)
+            continue
+        print("\n".join(lines))
+        print()
+
+    if unchanged:
+        print("Identical plans: " + ", ".join(f"q{idx}" for idx in unchanged))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+RESULTS_DIR = Path(__file__).resolve().parent
+
+
+def load_curves(load_dir: Path) -> list[dict]:
+    curves = []
+    for path in sorted(load_dir.glob("*.json")):
+        payload = json.loads(path.read_text())
+        if payload.get("steps"):
+            curves.append(payload)
+    return curves
+
+
+def plot_curves(curves: list[dict], output_path: Path) -> None:
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError as exc:
+        raise SystemExit("matplotlib is required for plotting. Install it and retry.") from exc
+
+    fig, ax = plt.subplots(figsize=(10.0, 6.5))
+    for curve in curves:
+        steps = curve["steps"]
+        achieved = [step["achieved_per_s"] for step in steps]
+        (line,) = ax.plot(
+            achieved, [step["p99_ms"] for step in steps], marker="o", label=f"{curve['system']} p99"
+        )
+        ax.plot(
+            achieved,
+            [step["p50_ms"] for step in steps],
+            marker=".",
+            linestyle="--",
+            color=line.get_color(),
+            alpha=0.6,
+            label=f"{curve['system']} p50",
+        )
+        knee = curve.get("knee_per_s")
+        if knee is not None:
+            # Mark the knee at the step it was measured on.
+            step = next(step for step in steps if step["offered_per_s"] == knee)
+            ax.scatter(
+                [step["achieved_per_s"]],
+                [step["p99_ms"]],
+                marker="D",
+                s=70,
+                facecolors="none",
+                edgecolors=line.get_color(),
+                linewidths=1.5,
+                zorder=3,
+            )
+
+    ax.set_yscale("log")
+    ax.set_xlabel("Throughput (queries/s)")
+    ax.set_ylabel("Latency from scheduled send (ms)")
+    ax.set_title("Open-loop latency vs throughput (diamond = knee)")
+    ax.grid(True, which="both", alpha=0.3)
+    ax.legend(loc="upper left", fontsize="small")
+
+    fig.tight_layout()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(output_path, dpi=160)
+    print(f"Wrote plot to {output_path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Plot latency-vs-throughput curves written by harness.load."
+    )
+    parser.add_argument(
+        "--load-dir",
+        type=Path,
+        default=RESULTS_DIR / "load",
+        help="Directory holding the <system>.json curves.",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=RESULTS_DIR / "load_curves.png",
+        help="Output path for the plot image.",
+    )
+    args = parser.parse_args()
+
+    curves = load_curves(args.load_dir)
+    if not curves:
+        raise SystemExit(f"No load curves found in {args.load_dir}.")
+    plot_curves(curves, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Rendering of catalog queries per dialect, and the existence forms of the
+yes/no queries.
+"""
+
+import pytest
+
+from harness.catalog import DIALECTS, QUERIES, existence_spec, render
+
+YES_NO_QUERIES = range(21, 31)
+
+
+@pytest.mark.parametrize("idx", YES_NO_QUERIES)
+@pytest.mark.parametrize("dialect", sorted(DIALECTS))
+def test_existence_form_ends_in_limit_1(idx: int, dialect: str) -> None:
+    text = render(existence_spec(QUERIES[idx]), DIALECTS[dialect])
+    assert text.rstrip(";").rstrip().endswith("LIMIT 1")
+    assert "COUNT(" not in text.upper()
+
+
+@pytest.mark.parametrize("idx", YES_NO_QUERIES)
+def test_existence_form_keeps_the_answer_column(idx: int) -> None:
+    spec = existence_spec(QUERIES[idx])
+    column = QUERIES[idx].bool_column
+    assert column is not None
+    for dialect in DIALECTS.values():
+        assert f"AS {column} LIMIT 1" in render(spec, dialect)
+
+
+def test_existence_form_needs_a_yes_no_query() -> None:
+    with pytest.raises(ValueError):
+        existence_spec(QUERIES[1])
+
+
+def test_lance_dialect_lowercases_properties_and_drops_the_comparison() -> None:
+    text = render(QUERIES[21], DIALECTS["lance"])
+    assert "p2.firstname = 'Bill'" in text
+    assert "> 0" not in text
+    assert not text.endswith(";")
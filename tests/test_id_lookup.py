@@ -0,0 +1,66 @@
+"""
+`IdLookup` rewrites name filters into id filters; a wrong rewrite changes the
+rows a query returns, so the rewritten text is checked here.
+"""
+
+from harness.catalog import QUERIES, QuerySpec
+from harness.id_lookup import NO_MATCH_ID, IdLookup
+
+
+def _lookup() -> IdLookup:
+    lookup = IdLookup()
+    lookup.ids = {
+        "Place": {("Paris",): (10,)},
+        "Tag": {("Cate_Blanchett",): (1, 2)},
+        "Tagclass": {},
+        "Organisation": {},
+        "Person": {("Bill", "Moore"): (7,)},
+    }
+    return lookup
+
+
+def test_unique_name_becomes_id_equality() -> None:
+    resolved = _lookup().resolve(QUERIES[24])
+    assert "l.ID = 10" in resolved.cypher
+    assert "$place_name" not in resolved.cypher
+
+
+def test_non_unique_name_becomes_a_disjunction() -> None:
+    resolved = _lookup().resolve(QUERIES[24])
+    assert "(t.ID = 1 OR t.ID = 2)" in resolved.cypher
+    assert "$tag_name" not in resolved.cypher
+
+
+def test_unknown_name_matches_no_id() -> None:
+    resolved = _lookup().resolve(QUERIES[24], {"place_name": "Atlantis"})
+    assert f"l.ID = {NO_MATCH_ID}" in resolved.cypher
+
+
+def test_full_name_becomes_person_id() -> None:
+    resolved = _lookup().resolve(QUERIES[21])
+    assert "p2.ID = 7" in resolved.cypher
+    assert "firstName" not in resolved.cypher
+    assert "lastName" not in resolved.cypher
+
+
+def test_overrides_use_the_dialect_id_property() -> None:
+    spec = QuerySpec(
+        0,
+        "Tagged posts.",
+        "MATCH (p:Post)-[:postHasTag]->(t:Tag) WHERE t.name = $tag_name RETURN p.ID;",
+        {"tag_name": "Cate_Blanchett"},
+        {"lance": "MATCH (p:Post)-[:postHasTag]->(t:Tag) WHERE t.name = $tag_name RETURN p.id"},
+    )
+    resolved = _lookup().resolve(spec)
+    assert "(t.id = 1 OR t.id = 2)" in resolved.overrides["lance"]
+
+
+def test_property_maps_and_other_labels_are_left_alone() -> None:
+    spec = QuerySpec(
+        0,
+        "Tags of a tagclass.",
+        "MATCH (t:Tag)-[:hasType]->(:Tagclass {name: $tagclass_name}), (f:Forum) "
+        "WHERE f.name = $tagclass_name RETURN t.ID;",
+        {"tagclass_name": "BritishRoyalty"},
+    )
+    assert _lookup().resolve(spec).cypher == spec.cypher
@@ -0,0 +1,87 @@
+"""
+The join-order rewrite decides which pattern lance-graph executes, so the
+rewritten text must keep every hop, the cycles, and the clauses after the
+pattern as written.
+"""
+
+from harness.catalog import DIALECTS, QUERIES, render
+from harness.ldbc import EDGE_FILES
+from harness.planner import Hop, Statistics, parse_pattern, parse_query, reorder
+
+ROWS = {
+    "Comment": 2_000_000,
+    "Forum": 90_000,
+    "Person": 10_000,
+    "Post": 1_000_000,
+    "Organisation": 8_000,
+    "Place": 1_500,
+    "Tag": 16_000,
+    "Tagclass": 71,
+    **{rel_type: 100_000 for rel_type in EDGE_FILES},
+}
+
+
+def _stats() -> Statistics:
+    return Statistics.from_row_counts(ROWS)
+
+
+def _lance(idx: int) -> str:
+    return render(QUERIES[idx], DIALECTS["lance"])
+
+
+def _hops(text: str) -> set[Hop]:
+    parsed = parse_query(text)
+    assert parsed is not None
+    return set(parsed.pattern.hops)
+
+
+def test_parse_pattern_joins_paths_on_shared_variables() -> None:
+    pattern = parse_pattern(
+        "(c:Comment)-[:commentHasCreator]->(creator:Person), "
+        "(c)-[:replyOfPost]->(post:Post)-[:postHasCreator]->(creator)"
+    )
+    assert pattern is not None
+    assert pattern.nodes == ["c", "creator", "post"]
+    assert set(pattern.hops) == {
+        Hop("c", "", "commentHasCreator", "creator"),
+        Hop("c", "", "replyOfPost", "post"),
+        Hop("post", "", "postHasCreator", "creator"),
+    }
+
+
+def test_parse_pattern_rejects_what_it_does_not_cover() -> None:
+    assert parse_pattern("(p:Person {id: 1})-[:knows]->(f:Person)") is None
+    assert parse_pattern("(p:Person)-[:knows*1..2]->(f:Person)") is None
+    assert parse_pattern("(p:Person)-[:knows]-(f:Person)") is None
+
+
+def test_reorder_keeps_the_q30_cycle() -> None:
+    text = _lance(30)
+    plan = reorder(text, _stats())
+    assert plan is not None
+    assert _hops(plan.text) == _hops(text)
+    # The cycle closes on the same variable rather than a fresh `creator`.
+    assert plan.text.count("(creator:Person)") == 1
+    assert "->(creator)" in plan.text
+
+
+def test_reorder_starts_from_the_filtered_end() -> None:
+    text = _lance(27)
+    plan = reorder(text, _stats())
+    assert plan is not None
+    assert plan.cost < plan.original_cost
+    assert not plan.text.startswith("MATCH (c:Comment)")
+    assert _hops(plan.text) == _hops(text)
+
+
+def test_reorder_keeps_where_and_return() -> None:
+    for idx in (1, 10, 27, 30):
+        text = _lance(idx)
+        plan = reorder(text, _stats())
+        assert plan is not None
+        assert plan.text.endswith(parse_query(text).rest)
+
+
+def test_reorder_leaves_unsupported_queries() -> None:
+    text = "MATCH (p:Person)-[:knows]->(f:Person) WITH f MATCH (f)-[:knows]->(g:Person) RETURN g.id"
+    assert reorder(text, _stats()) is None
@@ -0,0 +1,82 @@
+"""
+`ResultCache` serves results without running the query, so its eviction and
+invalidation decide whether a stale or evicted result can be returned.
+"""
+
+import pyarrow as pa
+
+from harness.adapters.result_cache import CacheKey, ResultCache, cache_key
+
+
+def _table(rows: int) -> pa.Table:
+    return pa.table({"id": pa.array(range(rows), pa.int64())})
+
+
+def _key(name: str, versions: dict[str, int] | None = None) -> CacheKey:
+    return cache_key(f"MATCH (p:Person) RETURN p.{name}", {}, versions or {"Person": 1})
+
+
+def test_key_ignores_whitespace_and_parameter_order() -> None:
+    first = cache_key("MATCH (p:Person)\n  RETURN p.id", {"a": 1, "b": "x"}, {"Person": 1})
+    second = cache_key("MATCH (p:Person) RETURN p.id ", {"b": "x", "a": 1}, {"Person": 1})
+    assert first == second
+    assert first != cache_key("MATCH (p:Person) RETURN p.id", {"a": 1, "b": "x"}, {"Person": 2})
+
+
+def test_hits_and_misses_are_counted() -> None:
+    cache = ResultCache(max_bytes=1 << 20)
+    table = _table(10)
+    assert cache.get(_key("id")) is None
+    cache.put(_key("id"), table)
+    assert cache.get(_key("id")) is table
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.bytes == table.nbytes
+    assert stats.hit_rate == 0.5
+
+
+def test_evicts_the_least_recently_used_entry() -> None:
+    table = _table(10)
+    cache = ResultCache(max_bytes=2 * table.nbytes)
+    cache.put(_key("a"), table)
+    cache.put(_key("b"), table)
+    cache.get(_key("a"))
+    cache.put(_key("c"), table)
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) is table
+    assert cache.get(_key("c")) is table
+    assert cache.stats().evictions == 1
+
+
+def test_stays_within_its_size_bound() -> None:
+    small, large = _table(10), _table(30)
+    cache = ResultCache(max_bytes=large.nbytes + small.nbytes)
+    for name in ("a", "b", "c"):
+        cache.put(_key(name), small)
+    cache.put(_key("d"), large)
+    stats = cache.stats()
+    assert stats.bytes <= cache.max_bytes
+    assert stats.entries == 2
+    assert stats.evictions == 2
+
+
+def test_rejects_a_result_bigger_than_the_cache() -> None:
+    small = _table(10)
+    cache = ResultCache(max_bytes=small.nbytes * 2)
+    cache.put(_key("a"), small)
+    cache.put(_key("b"), _table(100))
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) is small
+    assert cache.stats().evictions == 0
+
+
+def test_invalidate_drops_only_entries_that_read_the_datasets() -> None:
+    table = _table(10)
+    cache = ResultCache(max_bytes=1 << 20)
+    cache.put(_key("a", {"Person": 1, "knows": 1}), table)
+    cache.put(_key("b", {"Post": 1}), table)
+    cache.invalidate(["knows"])
+    assert cache.get(_key("a", {"Person": 1, "knows": 1})) is None
+    assert cache.get(_key("b", {"Post": 1})) is table
+    stats = cache.stats()
+    assert (stats.invalidations, stats.entries, stats.bytes) == (1, 1, table.nbytes)
@@ -0,0 +1,20 @@
+"""
+The heap top-K may keep a different group than the engine's sort when groups
+tie at the k-th value, and that must still count as the same result.
+"""
+
+import pyarrow as pa
+
+from harness.topk import same_top_k
+
+
+def test_groups_tied_at_the_kth_value_agree() -> None:
+    engine = pa.table({"l.name": ["Paris"], "comment_count": [12]})
+    heap = pa.table({"l.name": ["Glasgow"], "comment_count": [12]})
+    assert same_top_k(engine, heap, "comment_count")
+
+
+def test_a_different_kth_value_disagrees() -> None:
+    engine = pa.table({"l.name": ["Paris"], "comment_count": [12]})
+    heap = pa.table({"l.name": ["Glasgow"], "comment_count": [11]})
+    assert not same_top_k(engine, heap, "comment_count")
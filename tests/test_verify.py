@@ -0,0 +1,56 @@
+"""
+Engines return the same answer with different Arrow types, column-name case
+and row order; `digest_table` must hash those results the same, and still tell
+different answers apart.
+"""
+
+from datetime import datetime, timezone
+
+import pyarrow as pa
+
+from harness.verify import digest_table
+
+
+def _digest(table: pa.Table) -> str:
+    return digest_table(table).digest
+
+
+def test_timestamps_compare_as_utc_instants() -> None:
+    instant = datetime(2010, 2, 14, 15, 32, 10, 447000, tzinfo=timezone.utc)
+    utc_ms = pa.table({"t": pa.array([instant], pa.timestamp("ms", tz="UTC"))})
+    naive_us = pa.table({"t": pa.array([instant.replace(tzinfo=None)], pa.timestamp("us"))})
+    assert _digest(utc_ms) == _digest(naive_us)
+
+
+def test_dictionary_strings_compare_as_strings() -> None:
+    names = ["Glasgow", "Paris", "Glasgow"]
+    plain = pa.table({"name": pa.array(names, pa.string())})
+    encoded = pa.table({"name": pa.array(names, pa.string()).dictionary_encode()})
+    assert _digest(plain) == _digest(encoded)
+
+
+def test_integer_widths_compare_as_int64() -> None:
+    int32 = pa.table({"n": pa.array([1, 2, 3], pa.int32())})
+    int64 = pa.table({"n": pa.array([1, 2, 3], pa.int64())})
+    assert _digest(int32) == _digest(int64)
+
+
+def test_bools_with_nulls_ignore_bitmap_padding() -> None:
+    values = [True, None, False]
+    fresh = pa.table({"b": pa.array(values, pa.bool_())})
+    # A slice keeps the parent's buffers, so its bitmaps start at an offset
+    # and carry the parent's bits past the last row.
+    sliced = pa.table({"b": pa.array([True, *values, True, None], pa.bool_()).slice(1, 3)})
+    assert _digest(fresh) == _digest(sliced)
+    assert _digest(fresh) != _digest(pa.table({"b": pa.array([True, False, False])}))
+
+
+def test_row_order_and_column_case_are_ignored() -> None:
+    first = pa.table({"firstName": ["Bill", "Ana"], "ID": [7, 3]})
+    second = pa.table({"firstname": ["Ana", "Bill"], "id": [3, 7]})
+    assert _digest(first) == _digest(second)
+
+
+def test_different_answers_differ() -> None:
+    assert _digest(pa.table({"n": [1, 2]})) != _digest(pa.table({"n": [1, 3]}))
+    assert _digest(pa.table({"n": [1, 2]})) != _digest(pa.table({"m": [1, 2]}))